@@ -0,0 +1,62 @@
+""" Unit tests for the project aggregates"""
+
+from datetime import datetime
+
+from core.data.character import Character
+from core.data.event import Event
+from core.data.project import Project
+
+
+def make_day_event(name, start, end=None):
+    event = Event(name)
+    event.timeline_mode = "day_sequence"
+    event.day_index = start
+    event.day_index_end = end or start
+    return event
+
+
+class TestProjectAggregates:
+    """Tests for ProjectAggregates"""
+
+    def test_next_day_index_follows_edits(self):
+        project = Project()
+        assert project.aggregates.next_day_index() == 1
+        first = make_day_event("First", 1, 3)
+        last = make_day_event("Last", 4, 9)
+        project.events = [first, last]
+        aggregates = project.aggregates
+        assert aggregates.next_day_index() == 10
+
+        last.day_index_end = 5
+        assert aggregates.next_day_index() == 6
+        project.events.remove(last)
+        assert aggregates.next_day_index() == 4
+        project.events.append(make_day_event("Later", "Day 12"))
+        assert aggregates.next_day_index() == 13
+        assert aggregates.event_count("day_sequence") == 2
+        assert aggregates.event_count("calendar") == 0
+
+        project.events = []
+        assert aggregates.next_day_index() == 1
+
+    def test_bounds_counts_and_participants(self):
+        project = Project()
+        alice, bob = Character("Alice"), Character("Bob")
+        project.characters = [alice, bob]
+        meeting = Event("Meeting")
+        meeting.start_date = "2024-03-01"
+        meeting.end_date = "2024-03-03"
+        meeting.participants = [alice.id]
+        project.events = [meeting]
+        aggregates = project.aggregates
+
+        assert aggregates.date_bounds() == (datetime(2024, 3, 1), datetime(2024, 3, 3))
+        assert aggregates.day_count() == 3
+        assert aggregates.event_count() == 1
+        assert aggregates.participating_characters() == [alice.id]
+
+        meeting.participants = [bob.id]
+        assert aggregates.participating_characters() == [bob.id]
+        project.events.remove(meeting)
+        assert aggregates.participating_characters() == []
+        assert aggregates.day_count() == 1
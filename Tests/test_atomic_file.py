@@ -0,0 +1,58 @@
+""" Unit tests for atomic file writes and project snapshots"""
+
+import os
+import pytest
+from core.data.event import Event
+from core.data.project import Project
+from core.utils import atomic_file
+from core.utils.atomic_file import write_atomic
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic"""
+
+    def test_writes_and_replaces(self, tmp_path):
+        path = tmp_path / "project.json"
+        write_atomic(str(path), "first")
+        write_atomic(str(path), "second åäö")
+        assert path.read_text(encoding="utf-8") == "second åäö"
+        assert os.listdir(tmp_path) == ["project.json"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="file modes are POSIX only")
+    def test_new_file_follows_umask(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(atomic_file, "_UMASK", 0o027)
+        path = tmp_path / "project.json"
+        write_atomic(str(path), "data")
+        assert os.stat(path).st_mode & 0o777 == 0o640
+
+    def test_failed_write_keeps_old_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "project.json"
+        path.write_text("old", encoding="utf-8")
+
+        def broken_replace(source, target):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(atomic_file.os, "replace", broken_replace)
+        with pytest.raises(OSError):
+            write_atomic(str(path), "new")
+        assert path.read_text(encoding="utf-8") == "old"
+        assert os.listdir(tmp_path) == ["project.json"]
+
+
+class TestProjectSnapshot:
+    """Tests for Project.snapshot"""
+
+    def test_snapshot_is_detached(self):
+        project = Project()
+        event = Event("Battle")
+        event.participants = ["CHA001"]
+        project.events.append(event)
+        project.metadata = {"timeline_mode": "calendar"}
+
+        snapshot = project.snapshot()
+        event.participants.append("CHA002")
+        project.metadata["timeline_mode"] = "day"
+
+        assert snapshot["events"][0]["participants"] == ["CHA001"]
+        assert snapshot["metadata"]["timeline_mode"] == "calendar"
+        assert Project.dict_to_json(snapshot) != project.to_json()
@@ -2,6 +2,7 @@
 """ Unit tests for creating and editing Character, Event and Place"""
 
 import pytest
+from datetime import date
 from core.data.character import Character
 from core.data.event import Event
 from core.data.place import Place
@@ -76,6 +77,34 @@ class TestEventOperations:
         assert event.day_index == 6
         assert event.day_index_end == 7000
 
+    def test_event_time_range_follows_field_changes(self):
+        event = Event("Siege")
+        event.start_date = "2024-03-01"
+        event.end_date = "2024/03/04"
+        assert event.time_range() == ("calendar", date(2024, 3, 1), date(2024, 3, 4))
+
+        event.end_date = "bad date"
+        assert event.time_range() == ("calendar", date(2024, 3, 1), date(2024, 3, 1))
+
+        event.timeline_mode = "day_sequence"
+        event.day_index = 3
+        assert event.time_range() == ("day_sequence", 3, 3)
+
+    def test_event_from_dict(self):
+        event = Event.from_dict({
+            "id": "EVE9000",
+            "created": "2024-01-02T03:04:05",
+            "name": "Dawn",
+            "start_date": "Day 4",
+            "timeline_mode": "day_sequence",
+            "participants": ["1", "", "1", "2"],
+        })
+        assert event.created.isoformat() == "2024-01-02T03:04:05"
+        assert event.day_index == 4 and event.day_number == 4
+        assert event.participants == ["1", "2"]
+        assert event.display_mode == "span" and event.files == []
+        assert Event("Later").id > "EVE9000"
+
     def test_event_add_participants(self):
         event = Event("Workshop")
         event.participants = []
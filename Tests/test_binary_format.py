@@ -0,0 +1,107 @@
+""" Unit tests for the binary project format"""
+
+import json
+import pytest
+from core.data import binary_format
+from core.data.binary_format import BinaryProjectLoader
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+
+
+def make_project():
+    project = Project()
+    project.name = "Saga åäö"
+    project.metadata = {"timeline_mode": "calendar", "zoom": 1.5}
+    for index in range(30):
+        character = Character(f"Hero {index}")
+        character.age = index * 10 if index % 3 else None
+        character.aliases = ["The Bold"] if index % 2 else []
+        project.characters.append(character)
+        event = Event(f"Battle {index}")
+        event.start_date = f"2020-01-{index % 28 + 1:02d}" if index % 5 else ""
+        event.end_date = "2020-02-01T10:30" if index == 7 else ""
+        event.participants = [character.id]
+        event.extra_fields = {"weather": "rain"} if index == 3 else {}
+        project.events.append(event)
+    place = Place("Harbor")
+    place.coordinates = (12.5, -3.25)
+    project.places.append(place)
+    return project
+
+
+class TestBinaryFormat:
+    """Tests for dumps/loads"""
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_round_trip(self, compress):
+        data = make_project().to_dict()
+        blob = binary_format.dumps(data, compress=compress)
+        assert blob.startswith(binary_format.MAGIC)
+        # same result as writing and reading JSON, tuples come back as lists
+        assert binary_format.loads(blob) == json.loads(Project.dict_to_json(data))
+
+    def test_round_trip_keeps_types_and_shapes(self):
+        data = {
+            "name": "Odd",
+            "characters": [
+                {"id": "A", "flag": True, "count": 1, "date": "2020-01-01"},
+                {"id": "B", "flag": 1, "count": None, "date": None},
+                {"count": 2, "id": "C"},
+            ],
+            "events": [],
+        }
+        result = binary_format.loads(binary_format.dumps(data))
+        assert result["characters"] == data["characters"]
+        assert [type(record.get("flag")) for record in result["characters"]] == [bool, int, type(None)]
+        assert list(result["characters"][2]) == ["count", "id"]
+        assert result["events"] == [] and result["places"] == []
+
+    def test_constant_containers_are_not_shared(self):
+        data = {"name": "P", "events": [{"id": "E1", "style": {}}, {"id": "E2", "style": {}}]}
+        events = binary_format.loads(binary_format.dumps(data))["events"]
+        events[0]["style"]["color"] = "red"
+        assert events[1]["style"] == {}
+
+    def test_snapshot_matches_to_dict(self):
+        project = make_project()
+        project.events[2].timeline_mode = "day_sequence"
+        project.events[2].day_index = 4
+        project.events[2].participants = [project.characters[0].id, project.characters[0].id]
+        snapshot = binary_format.snapshot(project)
+        assert binary_format.loads(binary_format.dumps(snapshot)) == json.loads(project.to_json())
+
+    def test_loader_events_match_from_dict(self, tmp_path):
+        project = make_project()
+        project.events[4].timeline_mode = "day_sequence"
+        project.events[4].start_date = "Day 3"
+        project.events[4].day_index = None
+        path = tmp_path / "project.tlbin"
+        path.write_bytes(binary_format.dumps(binary_format.snapshot(project)))
+
+        loaded = BinaryProjectLoader(str(path)).load()
+        expected = [Event.from_dict(event.to_dict()) for event in project.events]
+        def state(event):
+            return {key: value for key, value in vars(event).items() if key != "_registry"}
+
+        assert [state(event) for event in loaded.events] == [state(event) for event in expected]
+
+    def test_rejects_other_files(self):
+        with pytest.raises(ValueError):
+            binary_format.loads(b'{"name": "json"}')
+
+    def test_loader_builds_project(self, tmp_path):
+        project = make_project()
+        path = tmp_path / "project.tlbin"
+        path.write_bytes(binary_format.dumps(project.to_dict()))
+
+        assert binary_format.is_binary_file(str(path))
+        loaded = BinaryProjectLoader(str(path), batch_size=7).load()
+        expected = json.loads(project.to_json())
+        result = loaded.to_dict()
+        # Place.from_dict does not restore the creation time
+        for data in (expected, result):
+            for place in data['places']:
+                place.pop('created')
+        assert json.loads(Project.dict_to_json(result)) == expected
@@ -0,0 +1,50 @@
+""" Unit tests for timeline column assignment"""
+
+import random
+from core.utils.column_layout import assign_columns
+
+
+def first_fit(intervals):
+    """The previous O(n*c) assignment, columns only"""
+    order = sorted(range(len(intervals)), key=lambda i: (intervals[i][0], intervals[i][0] - intervals[i][1], i))
+    columns_end = []
+    columns = [0] * len(intervals)
+    for index in order:
+        start, end = intervals[index]
+        for column, last_end in enumerate(columns_end):
+            if start > last_end:
+                columns_end[column] = end
+                break
+        else:
+            column = len(columns_end)
+            columns_end.append(end)
+        columns[index] = column
+    return columns
+
+
+class TestAssignColumns:
+    """Tests for assign_columns"""
+
+    def test_clusters_get_their_own_column_count(self):
+        intervals = [(0, 5), (1, 2), (3, 4), (10, 10), (4, 6), (20, 22), (21, 21)]
+        columns, counts = assign_columns(intervals)
+        assert columns == [0, 1, 1, 0, 2, 0, 1]
+        assert counts == [3, 3, 3, 1, 3, 2, 2]
+
+    def test_touching_days_overlap(self):
+        columns, counts = assign_columns([(0, 2), (2, 3), (4, 4)])
+        assert columns == [0, 1, 0]
+        assert counts == [2, 2, 1]
+
+    def test_matches_first_fit_columns(self):
+        random.seed(5)
+        for _ in range(50):
+            intervals = []
+            for _ in range(random.randint(0, 60)):
+                start = random.randint(0, 100)
+                intervals.append((start, start + random.randint(0, 10)))
+            columns, counts = assign_columns(intervals)
+            assert columns == first_fit(intervals)
+            assert all(column < count for column, count in zip(columns, counts))
+            if intervals:
+                assert max(counts) == max(columns) + 1
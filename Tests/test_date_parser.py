@@ -0,0 +1,41 @@
+""" Unit tests for the shared date parser"""
+
+import pytest
+from datetime import date, datetime
+from core.utils import date_parser
+
+
+class TestDateParser:
+    """Tests for parse_datetime, parse_day_index and parse_many"""
+
+    def test_supported_shapes(self):
+        assert date_parser.parse_datetime("2024-03-01") == datetime(2024, 3, 1)
+        assert date_parser.parse_datetime("2024/3/1") == datetime(2024, 3, 1)
+        assert date_parser.parse_datetime("2024-03-01T10:20") == datetime(2024, 3, 1, 10, 20)
+        assert date_parser.parse_datetime("2024-03-01T10:20:30") == datetime(2024, 3, 1, 10, 20, 30)
+        assert date_parser.parse_date(" 2024-03-01 ") == date(2024, 3, 1)
+
+    def test_offset_is_dropped(self):
+        parsed = date_parser.parse_datetime("2024-01-02T10:00+02:00")
+        assert parsed == datetime(2024, 1, 2, 10, 0) and parsed.tzinfo is None
+        assert parsed > date_parser.parse_datetime("2024-01-01")
+
+    def test_invalid_values(self):
+        for value in ("", "abc", "2024-02-30", "2024-13-01", "2024-03-01T25:00", None, 5):
+            assert date_parser.parse_datetime(value) is None
+
+    def test_day_index(self):
+        assert date_parser.parse_day_index("Day 12") == 12
+        assert date_parser.parse_day_index("day 0") == 1
+        assert date_parser.parse_day_index("7") == 7
+        assert date_parser.parse_day_index("2024-01-01") is None
+
+    def test_parse_many_keeps_order(self):
+        values = ["2024-01-02", "bad", "2024-01-02", "2023/12/31"]
+        assert date_parser.parse_many(values) == [
+            datetime(2024, 1, 2), None, datetime(2024, 1, 2), datetime(2023, 12, 31)
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,65 @@
+""" Unit tests for IntervalIndex and CharacterSchedule"""
+
+import pytest
+from core.data.character import Character
+from core.data.event import Event
+from core.data.project import Project
+from core.utils.interval_index import CharacterSchedule, IntervalIndex
+
+
+def day_range(event):
+    return "day_sequence", event.day_index, event.day_index_end
+
+
+class TestIntervalIndex:
+    """Tests for overlap queries"""
+
+    def test_overlapping_matches_brute_force(self):
+        intervals = [(f"E{i}", (i * 7) % 50, (i * 7) % 50 + i % 5) for i in range(60)]
+        index = IntervalIndex(intervals)
+        for start in range(0, 60, 3):
+            end = start + 2
+            expected = {key for key, s, e in intervals if s <= end and start <= e}
+            assert set(index.overlapping(start, end)) == expected
+
+    def test_remove_and_exclude(self):
+        index = IntervalIndex([("A", 1, 3), ("B", 2, 5), ("C", 8, 9)])
+        index.remove("A")
+        assert index.overlapping(2, 2) == ["B"]
+        assert index.overlapping(2, 9, exclude={"B"}) == ["C"]
+        assert index.first_overlap(6, 7) is None
+
+
+class TestCharacterSchedule:
+    """Tests for per character schedules"""
+
+    def make_project(self):
+        project = Project()
+        first, second = Event("First"), Event("Second")
+        first.day_index, first.day_index_end = 1, 3
+        second.day_index, second.day_index_end = 5, 6
+        project.events.extend([first, second])
+        character = Character("Anna")
+        character.associated_events = [first.id, second.id]
+        project.characters.append(character)
+        return project, character, first, second
+
+    def test_conflicts_follow_event_changes(self):
+        project, character, first, second = self.make_project()
+        schedule = CharacterSchedule(project, day_range)
+        assert schedule.conflicts(character, "day_sequence", 2, 2) == [first]
+
+        first.day_index, first.day_index_end = 10, 11
+        assert schedule.conflicts(character, "day_sequence", 2, 2) == []
+        assert schedule.event_conflicts(character, second) == []
+
+    def test_in_place_edit_is_noticed(self):
+        project, character, first, second = self.make_project()
+        schedule = CharacterSchedule(project, day_range)
+        assert schedule.conflicts(character, "day_sequence", 5, 5) == [second]
+        character.associated_events.remove(second.id)
+        assert schedule.conflicts(character, "day_sequence", 5, 5) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+""" Unit tests for LinkReconciler"""
+
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+from core.utils.link_reconciler import LinkReconciler
+
+
+def make_project():
+    project = Project()
+    hero, villain = Character("Hero"), Character("Villain")
+    project.characters.extend([hero, villain])
+    harbor, castle = Place("Harbor"), Place("Castle")
+    project.places.extend([harbor, castle])
+    first, second = Event("First"), Event("Second")
+    first.participants = [hero.id]
+    first.associated_places = [harbor.id]
+    second.participants = [hero.id, villain.id, "missing"]
+    second.associated_places = [castle.id]
+    project.events.extend([first, second])
+    return project, (hero, villain), (harbor, castle), (first, second)
+
+
+class TestLinkReconciler:
+    """Tests for LinkReconciler"""
+
+    def test_reconcile_builds_links(self):
+        project, (hero, villain), (harbor, castle), (first, second) = make_project()
+        report = LinkReconciler(project).reconcile()
+
+        assert hero.associated_events == [first.id, second.id]
+        assert villain.associated_events == [second.id]
+        assert hero.associated_places == [harbor.id, castle.id]
+        assert castle.associated_events == [second.id]
+        assert report.dangling == [('event', second.id, 'participants', 'missing')]
+
+    def test_check_only_reports_without_changing(self):
+        project, (hero, _villain), (harbor, _castle), (first, second) = make_project()
+        reconciler = LinkReconciler(project)
+        reconciler.reconcile()
+        hero.associated_events = [second.id, "gone"]
+        harbor.associated_events = []
+
+        report = reconciler.reconcile(check_only=True)
+        assert hero.associated_events == [second.id, "gone"]
+        fixed = {(kind, entity_id, field) for kind, entity_id, field, _added, _removed in report.fixes}
+        assert fixed == {('character', hero.id, 'associated_events'), ('place', harbor.id, 'associated_events')}
+
+        reconciler.reconcile()
+        assert hero.associated_events == [second.id, first.id]
+        assert harbor.associated_events == [first.id]
+        assert not reconciler.reconcile(check_only=True).changed
+
+    def test_manual_place_links_are_kept(self):
+        project, _characters, (harbor, _castle), (first, second) = make_project()
+        harbor.associated_events = [second.id, "deleted"]
+        LinkReconciler(project).reconcile()
+        assert harbor.associated_events == [second.id, first.id]
+
+    def test_sync_event_and_character(self):
+        project, (hero, villain), (harbor, castle), (first, second) = make_project()
+        reconciler = LinkReconciler(project)
+        reconciler.reconcile()
+
+        previous = list(first.participants)
+        first.participants = [villain.id]
+        reconciler.sync_event(first, previous, [harbor.id])
+        assert hero.associated_events == [second.id]
+        assert villain.associated_events == [first.id, second.id]
+        assert villain.associated_places == [harbor.id, castle.id]
+
+        previous_events = list(hero.associated_events)
+        hero.associated_events = [first.id]
+        reconciler.sync_character(hero, previous_events)
+        assert hero.id in first.participants
+        assert hero.id not in second.participants
@@ -0,0 +1,47 @@
+""" Unit tests for the LRU caches"""
+
+from core.utils.lru_cache import ByteSizeLRU, CountLRU
+
+
+class TestByteSizeLRU:
+    """Tests for ByteSizeLRU"""
+
+    def test_evicts_least_recently_used(self):
+        cache = ByteSizeLRU(100)
+        cache.put("a", "A", 40)
+        cache.put("b", "B", 40)
+        assert cache.get("a") == "A"
+        cache.put("c", "C", 40)
+
+        assert "b" not in cache
+        assert cache.get("a") == "A" and cache.get("c") == "C"
+        assert cache.total_bytes == 80
+
+    def test_replacing_and_popping_updates_size(self):
+        cache = ByteSizeLRU(100)
+        cache.put("a", "A", 40)
+        cache.put("a", "A2", 10)
+        assert cache.total_bytes == 10 and cache.get("a") == "A2"
+        assert cache.pop("a") == "A2"
+        assert cache.total_bytes == 0 and len(cache) == 0
+
+    def test_oversized_entry_is_kept_alone(self):
+        cache = ByteSizeLRU(100)
+        cache.put("a", "A", 40)
+        cache.put("big", "BIG", 500)
+        assert len(cache) == 1 and cache.get("big") == "BIG"
+
+
+class TestCountLRU:
+    """Tests for CountLRU"""
+
+    def test_evicts_least_recently_used(self):
+        cache = CountLRU(2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        assert cache.get("a") == "A"
+        cache.put("c", "C")
+
+        assert "b" not in cache and len(cache) == 2
+        assert cache.get("a") == "A" and cache.get("c") == "C"
+        assert cache.get("b", "missing") == "missing"
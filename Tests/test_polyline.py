@@ -0,0 +1,19 @@
+""" Unit tests for polyline simplification"""
+
+from core.utils.polyline import simplify_polyline
+
+
+class TestSimplifyPolyline:
+    """Tests for simplify_polyline"""
+
+    def test_close_points_are_merged(self):
+        coords = [0, 0, 1, 0, 2, 0, 5, 0, 5.5, 1, 9, 0]
+        assert simplify_polyline(coords, 3) == [0, 0, 5, 0, 9, 0]
+
+    def test_keeps_end_points(self):
+        assert simplify_polyline([0, 0, 0.1, 0.1, 0.2, 0.2], 10) == [0, 0, 0.2, 0.2]
+        assert simplify_polyline([0, 0, 4, 4], 10) == [0, 0, 4, 4]
+
+    def test_zero_tolerance_keeps_everything(self):
+        coords = [0, 0, 0, 0, 1, 1]
+        assert simplify_polyline(coords, 0) == coords
@@ -0,0 +1,63 @@
+""" Unit tests for the streaming project loader"""
+
+import json
+import pytest
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+from core.data.project_loader import StreamingProjectLoader
+
+
+def make_project():
+    project = Project()
+    project.name = "Saga åäö"
+    project.metadata = {"timeline_mode": "calendar", "numbers": [1, 2.5, -3]}
+    for index in range(25):
+        character = Character(f"Hero {index}")
+        character.age = index * 10
+        project.characters.append(character)
+        event = Event(f"Battle {index}")
+        event.start_date = f"2020-01-{index + 1:02d}"
+        event.participants = [character.id]
+        project.events.append(event)
+    project.places.append(Place("Harbor"))
+    return project
+
+
+class TestStreamingProjectLoader:
+    """Tests for StreamingProjectLoader"""
+
+    def test_small_chunks_give_same_project(self, tmp_path):
+        project = make_project()
+        path = tmp_path / "project.json"
+        path.write_text(project.to_json(), encoding="utf-8")
+
+        loader = StreamingProjectLoader(str(path), chunk_size=7, batch_size=10)
+        progress = list(loader.steps())
+        loaded = loader.project
+
+        expected = Project.from_json(json.loads(path.read_text(encoding="utf-8"))).to_dict()
+        actual = loaded.to_dict()
+        # Place.from_dict does not restore the created time
+        for place in expected["places"] + actual["places"]:
+            place.pop("created")
+        assert actual == expected
+        assert loaded.get_event(project.events[3].id).name == "Battle 3"
+        assert progress[-1][0] == progress[-1][1] == path.stat().st_size
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    def test_empty_and_broken_files(self, tmp_path):
+        empty = tmp_path / "empty.json"
+        empty.write_text("   ", encoding="utf-8")
+        with pytest.raises(ValueError):
+            StreamingProjectLoader(str(empty)).load()
+
+        broken = tmp_path / "broken.json"
+        broken.write_text('{"name": "x", "events": [{"id": "E1"}', encoding="utf-8")
+        with pytest.raises(ValueError):
+            StreamingProjectLoader(str(broken)).load()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+""" Unit tests for the id indexes kept by Project"""
+
+import pytest
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+
+
+class TestProjectRegistry:
+    """Tests for id -> entity lookups"""
+
+    def test_lookup_after_append_and_remove(self):
+        project = Project()
+        event = Event("Battle")
+        project.events.append(event)
+        assert project.get_event(event.id) is event
+
+        project.events.remove(event)
+        assert project.get_event(event.id) is None
+
+    def test_get_many_keeps_order_and_skips_unknown(self):
+        project = Project()
+        first = Character("Anna")
+        second = Character("Bert")
+        project.characters.extend([first, second])
+
+        found = project.characters.get_many([second.id, "MISSING", first.id])
+        assert found == [second, first]
+
+    def test_id_change_updates_index(self):
+        project = Project()
+        place = Place("Harbor")
+        project.places.append(place)
+        old_id = place.id
+
+        place.id = "PLA-NEW"
+        assert project.get_place("PLA-NEW") is place
+        assert project.get_place(old_id) is None
+
+    def test_replacing_list_indexes_new_entities(self):
+        project = Project()
+        old_event = Event("Old")
+        project.events.append(old_event)
+        new_event = Event("New")
+        project.events = [new_event]
+
+        assert project.get_event(new_event.id) is new_event
+        assert project.get_event(old_event.id) is None
+        old_event.id = "EVE-RENAMED"
+        assert project.get_event("EVE-RENAMED") is None
+
+    def test_from_json_builds_indexes(self):
+        data = {
+            "characters": [{"id": "C1", "name": "Anna"}],
+            "events": [{"id": "EVE900", "name": "Feast", "participants": ["C1"]}],
+            "places": [{"id": "PLA900", "name": "Hall"}],
+        }
+        project = Project.from_json(data)
+        assert project.get_character("C1").name == "Anna"
+        assert project.get_event("EVE900").name == "Feast"
+        assert project.get_place("PLA900").name == "Hall"
+
+    def test_mapping_stays_live_after_reindex(self):
+        project = Project()
+        places = project.places.mapping()
+        project.reindex()
+        hall = Place("Hall")
+        project.places.append(hall)
+        assert places[hall.id] is hall
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,59 @@
+""" Unit tests for the project relationship index"""
+
+from core.data.event import Event
+from core.data.project import Project
+
+
+def make_event(name, participants, places):
+    event = Event(name)
+    event.participants = participants
+    event.associated_places = places
+    return event
+
+
+class TestRelationshipIndex:
+    """Tests for RelationshipIndex"""
+
+    def test_lookups(self):
+        project = Project()
+        first = make_event("First", ["A", "B"], ["P1"])
+        second = make_event("Second", ["B"], ["P1", "P2"])
+        project.events.extend([first, second])
+        relations = project.relations
+
+        assert relations.events_of_character("B") == [first.id, second.id]
+        assert relations.events_at_place("P1") == [first.id, second.id]
+        assert relations.characters_at_place("P1") == ["A", "B"]
+        assert relations.places_of_character("B") == ["P1", "P2"]
+        assert relations.characters_at_place("unknown") == []
+
+    def test_follows_edits(self):
+        project = Project()
+        first = make_event("First", ["A", "B"], ["P1"])
+        second = make_event("Second", ["B"], ["P1"])
+        project.events.extend([first, second])
+        relations = project.relations
+        relations.characters_at_place("P1")
+
+        first.participants = ["C"]
+        assert relations.characters_at_place("P1") == ["B", "C"]
+        assert relations.events_of_character("A") == []
+
+        second.associated_places = ["P2"]
+        assert relations.places_of_character("B") == ["P2"]
+
+        project.events.remove(first)
+        assert relations.characters_at_place("P1") == []
+
+        old_id = second.id
+        second.id = "EVE999"
+        assert relations.events_at_place("P2") == ["EVE999"]
+        assert old_id not in relations.events_of_character("B")
+
+    def test_rebuilds_after_list_replacement(self):
+        project = Project()
+        project.events.append(make_event("First", ["A"], ["P1"]))
+        assert project.relations.characters_at_place("P1") == ["A"]
+
+        project.events = [make_event("Other", ["Z"], ["P1"])]
+        assert project.relations.characters_at_place("P1") == ["Z"]
@@ -0,0 +1,63 @@
+""" Unit tests for the project search index"""
+
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+
+
+def make_project():
+    project = Project()
+    alice = Character("Alice Hart", "A detective")
+    alice.aliases = ["The Fox"]
+    bob = Character("Bob", "Works at the harbour")
+    bob.extra_fields = {"Occupation": {"value": "Sailor", "type": "text"}}
+    project.characters.extend([alice, bob])
+    storm = Event("Storm at sea", "Bob loses his ship")
+    storm.notes = "Alice is not there"
+    project.events.append(storm)
+    project.places.append(Place("Harbour", "Where the ships dock"))
+    return project, alice, bob, storm
+
+
+def names(hits):
+    return [hit.entity.name for hit in hits]
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex"""
+
+    def test_ranks_names_above_other_fields(self):
+        project, alice, _bob, _storm = make_project()
+        hits = project.search("alice")
+        assert names(hits) == ["Alice Hart", "Storm at sea"]
+        assert hits[0].field == "name"
+        assert hits[1].field == "notes"
+
+    def test_prefix_fuzzy_and_all_words(self):
+        project, _alice, bob, _storm = make_project()
+        assert names(project.search("harb")) == ["Harbour", "Bob"]
+        assert names(project.search("harbuor")) == ["Harbour", "Bob"]
+        assert names(project.search("fox")) == ["Alice Hart"]
+        assert names(project.search("sailor")) == ["Bob"]
+        assert names(project.search("storm sea")) == ["Storm at sea"]
+        assert project.search("storm harbour") == []
+        assert names(project.search("harbour", kinds=("place",))) == ["Harbour"]
+
+    def test_follows_edits(self):
+        project, alice, bob, storm = make_project()
+        project.search("alice")
+
+        alice.name = "Alicia"
+        assert names(project.search("hart")) == []
+        assert names(project.search("alicia")) == ["Alicia"]
+
+        project.characters.remove(bob)
+        assert names(project.search("sailor")) == []
+
+        late = Event("Late arrival")
+        project.events.append(late)
+        assert names(project.search("arrival")) == ["Late arrival"]
+
+        project.events = [storm]
+        assert names(project.search("arrival")) == []
@@ -0,0 +1,39 @@
+""" Unit tests for the grid spatial index"""
+
+import random
+from core.utils.spatial_index import GridIndex
+
+
+def intersects(rect, area):
+    x, y, width, height = rect
+    ax, ay, aw, ah = area
+    return x < ax + aw and ax < x + width and y < ay + ah and ay < y + height
+
+
+class TestGridIndex:
+    """Tests for GridIndex"""
+
+    def test_query_matches_brute_force(self):
+        random.seed(4)
+        index = GridIndex(cell_size=50)
+        rects = {}
+        for key in range(300):
+            rect = (random.uniform(-100, 900), random.uniform(-100, 900), random.uniform(0, 200), random.uniform(0, 80))
+            rects[key] = rect
+            index.insert(key, *rect)
+        for key in range(0, 300, 3):
+            index.remove(key)
+            del rects[key]
+        for _ in range(100):
+            area = (random.uniform(-150, 900), random.uniform(-150, 900), random.uniform(1, 300), random.uniform(1, 300))
+            expected = {key for key, rect in rects.items() if intersects(rect, area)}
+            assert set(index.query(*area)) == expected
+        assert len(index) == len(rects)
+
+    def test_reinsert_moves_the_rect(self):
+        index = GridIndex(cell_size=10)
+        index.insert("a", 0, 0, 5, 5)
+        index.insert("a", 100, 100, 5, 5)
+        assert index.query(0, 0, 6, 6) == []
+        assert index.query(101, 101, 1, 1) == ["a"]
+        assert index.rect("a") == (100, 100, 5, 5)
@@ -0,0 +1,91 @@
+""" Unit tests for the event time index"""
+
+from datetime import date, datetime
+
+from core.data.event import Event
+from core.data.project import Project
+
+
+def make_event(name, start, end="", mode="calendar"):
+    event = Event(name)
+    if mode == "day_sequence":
+        event.timeline_mode = "day_sequence"
+        event.day_index = start
+        event.day_index_end = end or start
+    else:
+        event.start_date = start
+        event.end_date = end
+    return event
+
+
+def names(events):
+    return [event.name for event in events]
+
+
+class TestEventTimeIndex:
+    """Tests for EventTimeIndex and Project.events_between"""
+
+    def make_project(self):
+        project = Project()
+        project.events = [
+            make_event("War", "2024-01-01", "2024-03-31"),
+            make_event("Wedding", "2024-02-10"),
+            make_event("Ball", "2024-02-10", "2024-02-11"),
+            make_event("Voyage", "2024-05-01", "2024-05-20"),
+            make_event("Undated", ""),
+            make_event("Dawn", 2, 4, mode="day_sequence"),
+        ]
+        return project
+
+    def test_order_bounds_and_windows(self):
+        project = self.make_project()
+        index = project.time_index
+        assert names(index.ordered("calendar")) == ["War", "Ball", "Wedding", "Voyage"]
+        assert index.bounds("calendar") == (datetime(2024, 1, 1), datetime(2024, 5, 20))
+        assert index.bounds("day_sequence") == (2, 4)
+
+        assert names(project.events_between(date(2024, 2, 11))) == ["War", "Ball"]
+        assert names(project.events_between(date(2024, 3, 31), date(2024, 5, 1))) == ["War", "Voyage"]
+        assert project.events_between(date(2024, 4, 1), date(2024, 4, 30)) == []
+        assert names(project.events_between(3)) == ["Dawn"]
+        assert project.events_between(5, 9) == []
+        assert index.first_from(date(2024, 2, 11)).name == "Voyage"
+        assert index.first_from(date(2025, 1, 1)) is None
+
+    def test_follows_edits(self):
+        project = self.make_project()
+        index = project.time_index
+        index.ordered("calendar")
+
+        wedding = project.events[1]
+        wedding.start_date = "2024-06-01"
+        assert names(index.ordered("calendar")) == ["War", "Ball", "Voyage", "Wedding"]
+        assert index.bounds("calendar")[1] == datetime(2024, 6, 1)
+
+        project.events.remove(project.events[3])
+        project.events.append(make_event("Feast", "2023-12-24"))
+        assert names(index.ordered("calendar")) == ["Feast", "War", "Ball", "Wedding"]
+        assert index.bounds("calendar") == (datetime(2023, 12, 24), datetime(2024, 6, 1))
+
+        # the longest event going away shortens the overlap look-back
+        project.events.remove(project.events[0])
+        assert names(project.events_between(date(2024, 3, 1))) == []
+
+        project.events = [make_event("Alone", "2020-01-01")]
+        assert names(index.ordered("calendar")) == ["Alone"]
+        assert index.bounds("day_sequence") == (None, None)
+
+    def test_long_event_keeps_queries_bounded(self):
+        project = Project()
+        project.events = [make_event(f"Day {day}", day, mode="day_sequence") for day in range(1, 1001)]
+        project.events.append(make_event("Age", 1, 1000, mode="day_sequence"))
+        index = project.time_index
+
+        assert names(project.events_between(500)) == ["Age", "Day 500"]
+        assert names(project.events_between(999, 1200)) == ["Age", "Day 999", "Day 1000"]
+        # only the long event's own bucket looks back to its start
+        assert len(list(index._candidates(500, 500, "day_sequence"))) <= 3
+
+        project.events[-1].day_index_end = 2
+        assert names(project.events_between(500)) == ["Day 500"]
+        assert len(list(index._candidates(500, 500, "day_sequence"))) <= 2
@@ -0,0 +1,113 @@
+""" Unit tests for the headless timeline layout engine"""
+
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+from core.utils.timeline_layout import NO_PLACE, LayoutCache, TimelineLayoutEngine
+
+
+def make_project():
+    project = Project()
+    hero = Character("Hero")
+    project.characters.append(hero)
+    harbor = Place("Harbor")
+    project.places.append(harbor)
+    events = []
+    for name, start, end in (("Arrival", "2020-01-01", "2020-01-03"), ("Storm", "2020-01-02", ""), ("Later", "2020-01-10", "")):
+        event = Event(name)
+        event.start_date = start
+        event.end_date = end
+        event.participants = [hero.id]
+        event.associated_places = [harbor.id]
+        events.append(event)
+    loose = Event("Loose")
+    loose.start_date = "2020-01-05"
+    events.append(loose)
+    project.events.extend(events)
+    return project, hero, harbor
+
+
+class TestTimelineLayoutEngine:
+    """Tests for TimelineLayoutEngine"""
+
+    def test_calendar_layout(self):
+        project, hero, harbor = make_project()
+        geometry = TimelineLayoutEngine().layout(project, "calendar")
+
+        assert geometry.lane_ids == [NO_PLACE, harbor.id]
+        assert geometry.min_date == datetime(2020, 1, 1)
+        assert geometry.day_count == 10
+        assert [event.name for event in geometry.events] == ["Arrival", "Storm", "Loose", "Later"]
+        assert list(geometry.columns) == [0, 1, 0, 0]
+        assert list(geometry.column_counts) == [2, 2, 1, 1]
+        assert list(geometry.lane_tops) == [80.0, 80.0 + geometry.lane_heights[0]]
+
+        x, y, width, height = geometry.rect(0)
+        assert (x, width) == (180 + 6, 3 * 120 - 12)
+        assert geometry.rect(1)[1] > y
+        assert len(geometry.char_points[hero.id]) == 3
+        assert geometry.characters_with_blocks == {hero.id}
+        assert geometry.block_centers[0] == (geometry.char_points[hero.id][0][1],)
+        assert geometry.block_centers[2] == ()
+        assert geometry.events_in(x + 10, y + 10, 1, 1) == [0]
+        assert geometry.position_of(project.events[3].id) == 2
+
+    def test_empty_project(self):
+        geometry = TimelineLayoutEngine().layout(Project(), "day_sequence", today=datetime(2024, 5, 1))
+        assert geometry.lane_ids == [NO_PLACE]
+        assert geometry.day_count == 10
+        assert geometry.axis_labels[0] == "Day 1"
+        assert geometry.event_count == 0
+
+    def test_cache_reuses_layout_until_the_project_changes(self):
+        project, hero, _harbor = make_project()
+        cache = LayoutCache(TimelineLayoutEngine())
+        first = cache.layout(project, "calendar")
+        assert cache.layout(project, "calendar") is first
+        filtered = cache.layout(project, "calendar", {hero.id})
+        assert filtered is not first
+        assert cache.layout(project, "calendar") is first
+
+        revision = project.revision
+        project.events[1].end_date = "2020-01-04"
+        assert project.revision > revision
+        assert cache.layout(project, "calendar") is not first
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_participant_moves_patch_the_last_layout(self):
+        project, hero, _harbor = make_project()
+        sidekick = Character("Sidekick")
+        project.characters.append(sidekick)
+        cache = LayoutCache(TimelineLayoutEngine())
+        geometry = cache.layout(project, "calendar")
+
+        project.events[2].participants = [sidekick.id, hero.id]
+        project.events[0].participants = []
+        assert cache.layout(project, "calendar") is geometry
+        assert cache.updates == 1
+        assert cache.last_update == (0, 3)
+
+        fresh = TimelineLayoutEngine().layout(project, "calendar")
+        assert list(geometry.rects) == list(fresh.rects)
+        assert geometry.block_centers == fresh.block_centers
+        assert geometry.char_points == fresh.char_points
+        assert geometry.char_bounds == fresh.char_bounds
+
+        project.events[1].name = "Thunder"
+        assert cache.layout(project, "calendar") is not geometry
+        assert cache.last_update is None
+
+    def test_imports_without_qt(self):
+        root = Path(__file__).resolve().parents[1]
+        code = (
+            "import sys; sys.modules['PySide6'] = None\n"
+            "from core.data.project import Project\n"
+            "from core.utils.timeline_layout import TimelineLayoutEngine\n"
+            "TimelineLayoutEngine().layout(Project())\n"
+        )
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
@@ -20,6 +20,8 @@ def main():
     # Create main controller, which sets up everything
     controller = MainController()
     controller.show()
+    # don't exit in the middle of writing a project file
+    app.aboutToQuit.connect(controller.project_controller.wait_for_saves)
 
     sys.exit(app.exec())
 
@@ -0,0 +1,86 @@
+"""Benchmark for core.data.binary_format.
+
+Compares file size, serialization and parsing of the JSON project format
+with the binary one for a generated project, then a whole save (snapshot
+and serialization) and open (file to Project). Run from the repository root:
+
+    python benchmarks/bench_binary_format.py [event_count]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.data import binary_format
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+from core.data.project_loader import StreamingProjectLoader
+
+
+def make_project(event_count):
+    random.seed(3)
+    project = Project()
+    project.name = "Benchmark"
+    characters = [Character(f"Character {index}") for index in range(max(10, event_count // 50))]
+    places = [Place(f"Place {index}") for index in range(20)]
+    project.characters = characters
+    project.places = places
+    events = []
+    for index in range(event_count):
+        event = Event(f"Event {index}")
+        event.start_date = f"{1900 + index % 120}-{index % 12 + 1:02d}-{index % 28 + 1:02d}"
+        event.end_date = event.start_date if index % 3 else ""
+        event.participants = [character.id for character in random.sample(characters, 3)]
+        event.associated_places = [random.choice(places).id]
+        events.append(event)
+    project.events = events
+    return project
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    event_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    data = make_project(event_count).to_dict()
+
+    text, json_dump = timed(lambda: Project.dict_to_json(data).encode("utf-8"))
+    _parsed, json_load = timed(lambda: json.loads(text))
+    print(f"{event_count} events")
+    print(f"{'json':<18} {len(text):>12,} bytes  dump {json_dump:6.3f} s  load {json_load:6.3f} s")
+
+    for label, compress in (("binary", False), ("binary + zlib", True)):
+        blob, dump = timed(lambda: binary_format.dumps(data, compress=compress))
+        _parsed, load = timed(lambda: binary_format.loads(blob))
+        print(f"{label:<18} {len(blob):>12,} bytes  dump {dump:6.3f} s  load {load:6.3f} s")
+
+    project = make_project(event_count)
+    print("whole save and open")
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = os.path.join(folder, "project.json")
+        binary_path = os.path.join(folder, "project.tlbin")
+        text, json_save = timed(lambda: Project.dict_to_json(project.snapshot()).encode("utf-8"))
+        blob, binary_save = timed(lambda: binary_format.dumps(binary_format.snapshot(project)))
+        with open(json_path, "wb") as handle:
+            handle.write(text)
+        with open(binary_path, "wb") as handle:
+            handle.write(blob)
+        _loaded, json_open = timed(lambda: StreamingProjectLoader(json_path).load())
+        _loaded, binary_open = timed(lambda: binary_format.BinaryProjectLoader(binary_path).load())
+    print(f"{'json':<18} save {json_save:6.3f} s  open {json_open:6.3f} s")
+    print(f"{'binary + zlib':<18} save {binary_save:6.3f} s  open {binary_open:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
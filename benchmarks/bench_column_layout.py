@@ -0,0 +1,59 @@
+"""Benchmark for core.utils.column_layout.
+
+Times assign_columns against the previous first-fit scan over all columns
+for a dense lane. Run from the repository root:
+
+    python benchmarks/bench_column_layout.py [interval_count]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.utils.column_layout import assign_columns
+
+
+def make_intervals(count):
+    random.seed(7)
+    span = max(1, count // 50)
+    intervals = []
+    for _ in range(count):
+        start = random.randint(0, span)
+        intervals.append((start, start + random.randint(0, 300)))
+    return intervals
+
+
+def first_fit(intervals):
+    intervals = sorted(intervals, key=lambda item: (item[0], item[0] - item[1]))
+    columns_end = []
+    for start, end in intervals:
+        for column, last_end in enumerate(columns_end):
+            if start > last_end:
+                columns_end[column] = end
+                break
+        else:
+            columns_end.append(end)
+    return len(columns_end)
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    intervals = make_intervals(count)
+    (columns, counts), heap_time = timed(assign_columns, intervals)
+    print(f"{count} intervals, {max(counts)} columns in the widest cluster")
+    print(f"assign_columns {heap_time:.3f}s")
+    old_count, old_time = timed(first_fit, intervals)
+    print(f"first fit      {old_time:.3f}s ({old_count} columns)")
+
+
+if __name__ == "__main__":
+    main()
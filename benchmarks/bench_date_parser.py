@@ -0,0 +1,73 @@
+"""Micro-benchmark for core.utils.date_parser.
+
+Compares the shared parser with the strptime loop that TimelineHandler and
+HelperController used before. Run from the repository root:
+
+    python benchmarks/bench_date_parser.py [count]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.utils import date_parser
+
+FORMATS = ["%Y-%m-%d", "%Y/%m/%d", "%Y-%m-%dT%H:%M", "%Y-%m-%dT%H:%M:%S"]
+
+
+def strptime_parse(value):
+    """The previous implementation, one strptime attempt per format"""
+    if not value:
+        return None
+    text = value.strip()
+    if not text:
+        return None
+    for fmt in FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def make_values(count, distinct):
+    random.seed(7)
+    base = datetime(1900, 1, 1)
+    shapes = ["%Y-%m-%d", "%Y/%m/%d", "%Y-%m-%dT%H:%M", "%Y-%m-%dT%H:%M:%S"]
+    pool = []
+    for index in range(distinct):
+        moment = base + timedelta(days=random.randint(0, 60000), minutes=random.randint(0, 1439))
+        pool.append(moment.strftime(shapes[index % len(shapes)]))
+    return [random.choice(pool) for _ in range(count)]
+
+
+def run(label, function, values):
+    start = time.perf_counter()
+    function(values)
+    elapsed = time.perf_counter() - start
+    per_million = elapsed * 1_000_000 / len(values)
+    print(f"{label:<34} {per_million:8.2f} s per million strings")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    for distinct in (count, 1000):
+        values = make_values(count, distinct)
+        print(f"{count} strings, {distinct} distinct")
+        run("strptime loop (old)", lambda items: [strptime_parse(item) for item in items], values)
+        date_parser.clear_memo()
+        run("parse_datetime", lambda items: [date_parser.parse_datetime(item) for item in items], values)
+        date_parser.clear_memo()
+        run("parse_many", date_parser.parse_many, values)
+        print()
+
+
+if __name__ == "__main__":
+    main()
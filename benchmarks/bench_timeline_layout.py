@@ -0,0 +1,55 @@
+"""Benchmark for core.utils.timeline_layout.
+
+Lays out a generated project in both timeline modes without importing
+PySide6. Run from the repository root:
+
+    python benchmarks/bench_timeline_layout.py [event_count]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.modules['PySide6'] = None  # make sure nothing pulls in Qt
+
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+from core.utils.timeline_layout import TimelineLayoutEngine
+
+
+def make_project(event_count):
+    random.seed(11)
+    project = Project()
+    characters = [Character(f"Character {index}") for index in range(max(10, event_count // 50))]
+    places = [Place(f"Place {index}") for index in range(20)]
+    project.characters = characters
+    project.places = places
+    events = []
+    for index in range(event_count):
+        event = Event(f"Event {index}")
+        event.start_date = f"{1900 + index % 120}-{index % 12 + 1:02d}-{index % 28 + 1:02d}"
+        event.participants = [character.id for character in random.sample(characters, 3)]
+        event.associated_places = [random.choice(places).id]
+        events.append(event)
+    project.events = events
+    return project
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    project = make_project(count)
+    engine = TimelineLayoutEngine()
+    for mode in ("calendar", "day_sequence"):
+        started = time.perf_counter()
+        geometry = engine.layout(project, mode)
+        elapsed = time.perf_counter() - started
+        print(f"{mode:13} {geometry.event_count} events, {len(geometry.lane_ids)} lanes, "
+              f"{geometry.day_count} days: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import heapq
+from collections import Counter
+from core.utils import date_parser
+
+
+class ProjectAggregates:
+    """Summary values of a project's events, kept current while they are edited.
+
+    Tracks the highest day number used by any event (for numbering new
+    day sequence events) and the number of events per timeline mode. Day
+    numbers are counted in a Counter with a max-heap on top; removing the
+    current highest number only drops its count, and the heap discards
+    numbers that are no longer used when it is next read.
+
+    Date bounds come from the project's EventTimeIndex and the characters
+    taking part in events from its RelationshipIndex, both of which are
+    maintained incrementally as well.
+    """
+
+    DAY_FIELDS = ('day_index', 'day_index_end')
+    WATCHED_FIELDS = frozenset(DAY_FIELDS + ('timeline_mode',))
+
+    def __init__(self, project):
+        self.project = project
+        self._entries = {}  # event -> (mode, day numbers)
+        self._days = Counter()
+        self._day_heap = []  # negated day numbers, may hold unused ones
+        self._modes = Counter()
+        self._dirty = True
+        project.add_listener(self._on_project_changed)
+
+    def detach(self):
+        """Stop listening to the project"""
+        self.project.remove_listener(self._on_project_changed)
+
+    def max_day_index(self):
+        """Highest day_index or day_index_end of any event, 0 when none is set"""
+        self._ensure_built()
+        heap = self._day_heap
+        while heap and not self._days.get(-heap[0]):
+            heapq.heappop(heap)
+        return -heap[0] if heap else 0
+
+    def next_day_index(self):
+        """Day number for a new event after all others"""
+        return self.max_day_index() + 1
+
+    def event_count(self, mode=None):
+        """Number of events, or of events in one timeline mode"""
+        self._ensure_built()
+        if mode is None:
+            return len(self._entries)
+        return self._modes.get(mode, 0)
+
+    def date_bounds(self, mode='calendar'):
+        """(earliest start, latest end) of the events in mode, see EventTimeIndex.bounds"""
+        return self.project.time_index.bounds(mode)
+
+    def day_count(self, mode='calendar'):
+        """Number of day columns covering every event in mode, at least 1"""
+        first, last = self.date_bounds(mode)
+        if first is None:
+            return 1
+        if mode == 'day_sequence':
+            return max(1, last - first + 1)
+        return max(1, (last - first).days + 1)
+
+    def participating_characters(self):
+        """IDs of the characters taking part in at least one event"""
+        return self.project.relations.participating_characters()
+
+    def rebuild(self):
+        self._entries.clear()
+        self._days.clear()
+        self._modes.clear()
+        for event in self.project.events:
+            self._add(event)
+        self._day_heap = [-day for day in self._days]
+        heapq.heapify(self._day_heap)
+        self._dirty = False
+
+    def _ensure_built(self):
+        if self._dirty:
+            self.rebuild()
+
+    def _add(self, event):
+        if event in self._entries:
+            return
+        days = []
+        for field in self.DAY_FIELDS:
+            number = date_parser.parse_day_index(getattr(event, field, None))
+            if number is not None:
+                days.append(number)
+                if not self._days[number] and not self._dirty:
+                    heapq.heappush(self._day_heap, -number)
+                self._days[number] += 1
+        mode = getattr(event, 'timeline_mode', 'calendar') or 'calendar'
+        self._modes[mode] += 1
+        self._entries[event] = (mode, days)
+
+    def _remove(self, event):
+        entry = self._entries.pop(event, None)
+        if entry is None:
+            return
+        mode, days = entry
+        self._decrement(self._modes, mode)
+        for number in days:
+            self._decrement(self._days, number)
+        if len(self._day_heap) > 2 * len(self._days) + 16:
+            # too many unused numbers waiting to be popped
+            self._day_heap = [-day for day in self._days]
+            heapq.heapify(self._day_heap)
+
+    def _on_project_changed(self, kind, entity, field, old_value):
+        if kind != 'event' or self._dirty:
+            return
+        if entity is None:
+            self._dirty = True
+        elif field is None or field in self.WATCHED_FIELDS:
+            # added when it belongs to a list, removed otherwise
+            self._remove(entity)
+            if getattr(entity, '_registry', None) is not None:
+                self._add(entity)
+
+    @staticmethod
+    def _decrement(counts, key):
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
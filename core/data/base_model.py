@@ -3,6 +3,8 @@ from datetime import datetime
 class BaseModel:
     """Baseclass for all data models"""
 
+    _registry = None    # EntityList that currently holds this object
+
     def __init__(self, name="", description=""):
         self.id = self._make_id()           # Unique ID for each object
         self.created = datetime.now()
@@ -13,6 +15,22 @@ class BaseModel:
         self.extra_fields = {}
         self.style = {}
 
+    def __setattr__(self, name, value):
+        """Set attribute and tell the owning registry when a field changes"""
+        registry = self.__dict__.get('_registry')
+        if registry is None or name.startswith('_'):
+            object.__setattr__(self, name, value)
+            return
+        old_value = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        if old_value is value:
+            # reassigning the same list/dict usually means it was edited in place
+            if not isinstance(value, (list, dict)):
+                return
+        elif old_value == value:
+            return
+        registry._entity_changed(self, name, old_value)
+
     def _make_id(self):
         """unique ID"""
         return str(datetime.now().timestamp())
@@ -36,21 +54,28 @@ class BaseModel:
         """Create objects"""
         obj = cls()
         obj.id = data.get('id', obj.id)
-        obj.name = data.get('name', '')
-        obj.description = data.get('description', '')
-        obj.files = data.get('files', [])
-        obj.notes = data.get('notes', '')
-        obj.extra_fields = data.get('extra_fields', {})
-        obj.style = data.get('style', {})
+        for name, value in cls._base_fields(data).items():
+            setattr(obj, name, value)
+        return obj
 
-        created_str = data.get('created')
-        if created_str:
+    @staticmethod
+    def _base_fields(data):
+        """The fields from_dict restores on every model, the id aside"""
+        created = data.get('created')
+        if not isinstance(created, datetime):
             try:
-                obj.created = datetime.fromisoformat(created_str)
+                created = datetime.fromisoformat(created) if created else datetime.now()
             except ValueError:
-                obj.created = datetime.now()
-
-        return obj
+                created = datetime.now()
+        return {
+            'name': data.get('name', ''),
+            'description': data.get('description', ''),
+            'files': data.get('files', []),
+            'notes': data.get('notes', ''),
+            'extra_fields': data.get('extra_fields', {}),
+            'style': data.get('style', {}),
+            'created': created,
+        }
 
     @property
     def image_path(self):
@@ -0,0 +1,483 @@
+"""Compact binary project files (.tlbin).
+
+Layout, all integers little endian:
+
+    b"TLBIN", version (u8), flags (u8, 1 = payload is zlib compressed)
+    payload: length prefixed blocks (u32 length + bytes)
+
+The payload starts with a JSON block holding the top level fields (name,
+metadata, ...), then the string table and one table per entity kind. A
+table stores its records column by column. Every field gets the most
+compact column type that gives back its values exactly, with JSON as the
+fallback, so `loads(dumps(project.to_dict()))` equals `project.to_dict()`.
+
+Saving skips the per-event dicts: `snapshot()` reads the event fields
+straight into columns, since Event.to_dict would otherwise cost more than
+the whole encoding. `BinaryProjectLoader` hands event creation times to
+Event.from_dict as datetimes instead of formatting and parsing them again.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date, datetime, timedelta
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project, _copy_containers
+
+MAGIC = b"TLBIN"
+VERSION = 1
+FLAG_COMPRESSED = 1
+FILE_EXTENSION = ".tlbin"
+ENTITY_KINDS = ('characters', 'events', 'places')
+
+_HEADER = struct.Struct("<5sBB")
+_LENGTH = struct.Struct("<I")
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_INT_RANGE = (-(1 << 63), (1 << 63) - 1)
+_SWAP = sys.byteorder == "big"
+
+# the Event.to_dict() fields read and written column by column, 'type' aside
+_EVENT_FIELDS = (
+    'id', 'created', 'name', 'description', 'files', 'notes', 'extra_fields', 'style',
+    'start_date', 'end_date', 'location', 'participants', 'related_events', 'places',
+    'timeline_mode', 'day_number', 'day_number_end', 'day_index', 'day_index_end',
+    'display_mode', 'associated_places',
+)
+
+# column types
+_CONSTANT = "C"  # the same value in every record
+_STRING = "S"    # str or None, as string table indexes
+_DATE = "D"      # 'YYYY-MM-DD', '' or None, as day ordinals
+_TIMESTAMP = "T" # naive datetimes or their isoformat() strings, as microseconds
+_INTEGER = "I"   # int or None
+_STR_LIST = "L"  # lists of str
+_JSON = "J"      # anything else
+
+
+def is_binary_file(file_path):
+    """True if file_path starts with the binary project header"""
+    try:
+        with open(file_path, "rb") as handle:
+            return handle.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def snapshot(project):
+    """Copy of project for dumps(), safe to hand to another thread.
+
+    Gives the same data as Project.snapshot(), except that the events are
+    read straight into columns instead of one to_dict() per event.
+    """
+    return {
+        'name': project.name,
+        'characters': _copy_containers([character.to_dict() for character in project.characters]),
+        'events': _event_columns(project.events),
+        'places': _copy_containers([place.to_dict() for place in project.places]),
+        'metadata': _copy_containers(project.metadata),
+    }
+
+
+def dumps(data, compress=True):
+    """Project.to_dict() schema, or a snapshot() of it, to bytes"""
+    writer = _Writer()
+    header = _json_bytes({key: value for key, value in data.items() if key not in ENTITY_KINDS})
+    tables = [_encode_table(writer, data.get(kind) or []) for kind in ENTITY_KINDS]
+    payload = _block(header) + writer.strings_block() + b"".join(tables)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= FLAG_COMPRESSED
+    return _HEADER.pack(MAGIC, VERSION, flags) + payload
+
+
+def loads(blob):
+    """Bytes written by dumps() back to the to_dict() schema"""
+    reader = _open_payload(blob)
+    data = reader.json()
+    strings = reader.strings()
+    for kind in ENTITY_KINDS:
+        data[kind] = _decode_table(reader, strings)
+    return data
+
+
+class BinaryProjectLoader:
+    """Loads a binary project file with the same interface as StreamingProjectLoader"""
+
+    ENTITY_TYPES = {
+        'characters': Character,
+        'events': Event,
+        'places': Place,
+    }
+
+    def __init__(self, file_path, batch_size=500):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.project = None
+
+    def load(self):
+        """Load the whole file and return the Project"""
+        for _progress in self.steps():
+            pass
+        return self.project
+
+    def steps(self):
+        """Generator that builds the project, yielding (records_done, records_total)"""
+        with open(self.file_path, "rb") as handle:
+            reader = _open_payload(handle.read())
+        data = reader.json()
+        strings = reader.strings()
+        tables = {kind: _read_table(reader, strings, raw_timestamps=kind == 'events') for kind in ENTITY_KINDS}
+        total = sum(table[0]['count'] for table in tables.values()) or 1
+        yield 0, total
+
+        project = Project()
+        done = 0
+        for kind in ENTITY_KINDS:
+            entity_type = self.ENTITY_TYPES[kind]
+            meta, shape_ids, columns = tables[kind]
+            entities = getattr(project, kind)
+            records = _records(meta, shape_ids, columns)
+            for start in range(0, len(records), self.batch_size):
+                batch = records[start:start + self.batch_size]
+                entities.extend(entity_type.from_dict(record) for record in batch)
+                done += len(batch)
+                yield done, total
+        project.name = data.get('name', 'My Project')
+        project.metadata = data.get('metadata', {})
+        self.project = project
+        yield total, total
+
+
+# writing
+def _block(data):
+    return _LENGTH.pack(len(data)) + data
+
+
+def _array_bytes(values):
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class _Writer:
+    def __init__(self):
+        self._string_ids = {}
+        self._strings = []
+
+    def intern(self, text):
+        """String table index + 1, 0 stands for None"""
+        if text is None:
+            return 0
+        index = self._string_ids.get(text)
+        if index is None:
+            index = self._string_ids[text] = len(self._strings) + 1
+            self._strings.append(text)
+        return index
+
+    def strings_block(self):
+        lengths = array("I", map(len, self._strings))
+        text = "".join(self._strings).encode("utf-8", "surrogatepass")
+        return _block(_array_bytes(lengths)) + _block(text)
+
+
+def _json_bytes(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8", "surrogatepass")
+
+
+class _Columns:
+    """Records of one kind held as field -> list of values, all of the same length"""
+
+    def __init__(self, fields, count):
+        self.fields = fields
+        self.count = count
+
+
+def _event_columns(events):
+    """Event.to_dict() of every event as _Columns, containers copied"""
+    count = len(events)
+
+    def column(field, default=None):
+        return [getattr(event, field, default) for event in events]
+
+    def copied(field):
+        return [_copied(getattr(event, field, [])) for event in events]
+
+    day_index = column('day_index')
+    day_index_end = column('day_index_end')
+    day_number = [index if number is None else number for number, index in zip(column('day_number'), day_index)]
+    day_number_end = [index if number is None else number for number, index in zip(column('day_number_end'), day_index_end)]
+    created = column('created')
+    if not all(type(value) is datetime and value.tzinfo is None for value in created):
+        created = [value.isoformat() for value in created]
+    fields = {
+        'id': column('id'),
+        'created': created,
+        'name': column('name'),
+        'description': column('description'),
+        'files': copied('files'),
+        'notes': column('notes'),
+        'extra_fields': [_copied(event.extra_fields) for event in events],
+        'style': [_copied(event.style) for event in events],
+        'type': [event.__class__.__name__ for event in events],
+        'start_date': column('start_date', ''),
+        'end_date': column('end_date', ''),
+        'location': column('location', ''),
+        'participants': copied('participants'),
+        'related_events': copied('related_events'),
+        'places': copied('places'),
+        'timeline_mode': column('timeline_mode', 'calendar'),
+        'day_number': day_number,
+        'day_number_end': day_number_end,
+        'day_index': day_index,
+        'day_index_end': day_index_end,
+        'display_mode': column('display_mode', 'span'),
+        'associated_places': copied('associated_places'),
+    }
+    return _Columns(fields, count)
+
+
+def _copied(value):
+    """value with its lists and dicts copied, plain lists of strings and empty dicts quickly"""
+    if type(value) is list and all(type(item) is str for item in value):
+        return value[:]
+    if type(value) is dict and not value:
+        return {}
+    return _copy_containers(value)
+
+
+def _encode_table(writer, records):
+    if isinstance(records, _Columns):
+        names = list(records.fields)
+        count = records.count
+        shape_ids = array("I", bytes(4 * count))
+        shapes = [list(range(len(names)))] if count else []
+        columns = [_encode_column(writer, values) for values in records.fields.values()]
+    else:
+        fields = {}
+        shape_keys = {}
+        shape_ids = array("I")
+        for record in records:
+            keys = tuple(record)
+            shape = shape_keys.get(keys)
+            if shape is None:
+                shape = shape_keys[keys] = len(shape_keys)
+                for key in keys:
+                    fields.setdefault(key, len(fields))
+            shape_ids.append(shape)
+
+        names = list(fields)
+        count = len(records)
+        shapes = [[fields[key] for key in keys] for keys in shape_keys]
+        columns = []
+        for name in names:
+            present = [record[name] for record in records if name in record]
+            # records without the field take a value that does not change the column type
+            values = [record.get(name, present[0]) for record in records]
+            columns.append(_encode_column(writer, values))
+
+    meta = {
+        'count': count,
+        'fields': names,
+        'types': "".join(column_type for column_type, _blocks in columns),
+        'shapes': shapes,
+    }
+    parts = [_block(_json_bytes(meta)), _block(_array_bytes(shape_ids))]
+    for _column_type, blocks in columns:
+        parts.extend(_block(part) for part in blocks)
+    return b"".join(parts)
+
+
+def _encode_column(writer, values):
+    if values and all(type(value) is datetime and value.tzinfo is None for value in values):
+        micros = array("q", [(value - _EPOCH) // _MICROSECOND for value in values])
+        return _TIMESTAMP, [_array_bytes(micros)]
+
+    first = values[0] if values else None
+    first_type = type(first)
+    # equal values of the same type, e.g. 1 and True are not the same constant
+    if all(type(value) is first_type and value == first for value in values):
+        first_json = _json_bytes(first)
+        if first_type not in (dict, list) or not first or all(_json_bytes(value) == first_json for value in values):
+            return _CONSTANT, [first_json]
+
+    if all(value is None or type(value) is str for value in values):
+        ordinals = _date_ordinals(values)
+        if ordinals is not None:
+            return _DATE, [_array_bytes(ordinals)]
+        micros = _timestamps(values)
+        if micros is not None:
+            return _TIMESTAMP, [_array_bytes(micros)]
+        return _STRING, [_array_bytes(array("I", map(writer.intern, values)))]
+
+    if all(value is None or (type(value) is int and _INT_RANGE[0] <= value <= _INT_RANGE[1]) for value in values):
+        nulls = bytes(value is None for value in values)
+        numbers = array("q", (0 if value is None else value for value in values))
+        return _INTEGER, [_array_bytes(numbers), nulls]
+
+    if all(type(value) is list and all(type(item) is str for item in value) for value in values):
+        lengths = array("I", map(len, values))
+        items = array("I", (writer.intern(item) for value in values for item in value))
+        return _STR_LIST, [_array_bytes(lengths), _array_bytes(items)]
+
+    return _JSON, [_json_bytes(values)]
+
+
+def _date_ordinals(values):
+    """Day ordinals (0 for '', -1 for None) if every value is a plain date"""
+    known = {None: -1, "": 0}
+    ordinals = array("i")
+    for value in values:
+        ordinal = known.get(value)
+        if ordinal is None:
+            if len(value) != 10:
+                return None
+            try:
+                parsed = date.fromisoformat(value)
+            except ValueError:
+                return None
+            if parsed.isoformat() != value:
+                return None
+            ordinal = known[value] = parsed.toordinal()
+        ordinals.append(ordinal)
+    return ordinals
+
+
+def _timestamps(values):
+    """Microseconds since 1970 if every value is a naive datetime.isoformat()"""
+    micros = array("q")
+    for value in values:
+        if value is None or len(value) < 19 or value[10] != "T":
+            return None
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None or parsed.isoformat() != value:
+            return None
+        micros.append((parsed - _EPOCH) // _MICROSECOND)
+    return micros
+
+
+# reading
+def _open_payload(blob):
+    if len(blob) < _HEADER.size:
+        raise ValueError("File is too short to be a binary project.")
+    magic, version, flags = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError("Not a binary project file.")
+    if version > VERSION:
+        raise ValueError(f"Binary project version {version} is newer than this application supports.")
+    payload = blob[_HEADER.size:]
+    if flags & FLAG_COMPRESSED:
+        payload = zlib.decompress(payload)
+    return _Reader(payload)
+
+
+class _Reader:
+    def __init__(self, payload):
+        self._data = memoryview(payload)
+        self._pos = 0
+
+    def block(self):
+        if self._pos + _LENGTH.size > len(self._data):
+            raise ValueError("Unexpected end of binary project data")
+        (length,) = _LENGTH.unpack_from(self._data, self._pos)
+        start = self._pos + _LENGTH.size
+        self._pos = start + length
+        if self._pos > len(self._data):
+            raise ValueError("Unexpected end of binary project data")
+        return self._data[start:self._pos]
+
+    def json(self):
+        return json.loads(str(self.block(), "utf-8", "surrogatepass"))
+
+    def array(self, typecode):
+        values = array(typecode)
+        values.frombytes(self.block())
+        if _SWAP:
+            values.byteswap()
+        return values
+
+    def strings(self):
+        """String table with None at index 0"""
+        lengths = self.array("I")
+        text = str(self.block(), "utf-8", "surrogatepass")
+        strings = [None]
+        position = 0
+        for length in lengths:
+            strings.append(text[position:position + length])
+            position += length
+        return strings
+
+
+def _decode_table(reader, strings):
+    return _records(*_read_table(reader, strings))
+
+
+def _read_table(reader, strings, raw_timestamps=False):
+    """(meta, shape_ids, columns) of the next table"""
+    meta = reader.json()
+    count = meta['count']
+    shape_ids = reader.array("I")
+    columns = [_decode_column(reader, column_type, count, strings, raw_timestamps) for column_type in meta['types']]
+    return meta, shape_ids, columns
+
+
+def _records(meta, shape_ids, columns):
+    """One to_dict() record per row of a table"""
+    count = meta['count']
+    names = meta['fields']
+    if meta['shapes'] == [list(range(len(names)))]:
+        # the usual case, every record has all fields in the same order
+        return [dict(zip(names, row)) for row in zip(*columns)] if names else [{} for _row in range(count)]
+    shapes = [[(names[field], columns[field]) for field in shape] for shape in meta['shapes']]
+    return [
+        {name: column[row] for name, column in shapes[shape]}
+        for row, shape in enumerate(shape_ids)
+    ]
+
+
+def _decode_column(reader, column_type, count, strings, raw_timestamps=False):
+    if column_type == _CONSTANT:
+        text = str(reader.block(), "utf-8", "surrogatepass")
+        value = json.loads(text)
+        if isinstance(value, (dict, list)):
+            # every record gets its own copy
+            if not value:
+                return [{} for _row in range(count)] if isinstance(value, dict) else [[] for _row in range(count)]
+            return [json.loads(text) for _row in range(count)]
+        return [value] * count
+    if column_type == _STRING:
+        return list(map(strings.__getitem__, reader.array("I")))
+    if column_type == _DATE:
+        ordinals = reader.array("i")
+        formatted = {ordinal: date.fromordinal(ordinal).isoformat() for ordinal in set(ordinals) if ordinal > 0}
+        formatted[-1] = None
+        formatted[0] = ""
+        return list(map(formatted.__getitem__, ordinals))
+    if column_type == _TIMESTAMP:
+        moments = [_EPOCH + value * _MICROSECOND for value in reader.array("q")]
+        return moments if raw_timestamps else [moment.isoformat() for moment in moments]
+    if column_type == _INTEGER:
+        numbers = reader.array("q")
+        nulls = reader.block()
+        return [None if null else number for number, null in zip(numbers, nulls)]
+    if column_type == _STR_LIST:
+        lengths = reader.array("I")
+        items = list(map(strings.__getitem__, reader.array("I")))
+        column = []
+        position = 0
+        for length in lengths:
+            column.append(items[position:position + length])
+            position += length
+        return column
+    if column_type == _JSON:
+        return json.loads(str(reader.block(), "utf-8", "surrogatepass"))
+    raise ValueError(f"Unknown column type {column_type!r} in binary project")
@@ -5,10 +5,6 @@ class TimelineDataManager:
         self.controller = timeline_controller
         self.processor = timeline_controller.data_processor
 
-    def get_events(self, display_mode):
-        """Get events for current display mode"""
-        return self.processor.get_events(display_mode)
-    
     def get_character_names(self, character_ids):
         """Get character names"""
         return self.processor.get_character_names(character_ids)
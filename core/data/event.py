@@ -1,10 +1,14 @@
 from core.data.base_model import BaseModel
+from core.utils import date_parser
 
 class Event(BaseModel):
     """Event model"""
 
     id_count = 1
 
+    # writing any of these drops the cached parsed dates and time range
+    TIME_FIELDS = ('start_date', 'end_date', 'day_index', 'day_index_end', 'timeline_mode')
+
     def __init__(self, name="", description=""):
         super().__init__(name, description)
         self.id = self._make_id()
@@ -22,11 +26,86 @@ class Event(BaseModel):
         self.day_index_end = None
         self.associated_places = []
 
+    def __setattr__(self, name, value):
+        if name in Event.TIME_FIELDS and self.__dict__.get(name) != value:
+            self.__dict__.pop('_parsed_dates', None)
+            self.__dict__.pop('_time_range', None)
+        super().__setattr__(name, value)
+
     def _make_id(self):
         eid = f"EVE{Event.id_count:03d}"
         Event.id_count += 1
         return eid
 
+    def parsed_dates(self):
+        """start_date and end_date as datetimes (or None), parsed once per change"""
+        cached = self.__dict__.get('_parsed_dates')
+        if cached is None:
+            cached = (self.parse_date(self.start_date), self.parse_date(self.end_date))
+            self.__dict__['_parsed_dates'] = cached
+        return cached
+
+    def time_range(self):
+        """(mode, start, end) used for overlap checks, cached until a time field changes"""
+        cached = self.__dict__.get('_time_range')
+        if cached is None:
+            cached = Event.range_of(self)
+            self.__dict__['_time_range'] = cached
+        return cached
+
+    @staticmethod
+    def range_of(event):
+        """(mode, start, end) for any event-like object.
+
+        Day sequence events give day numbers, calendar events give dates.
+        start and end are None when the event has no usable start.
+        """
+        mode = getattr(event, "timeline_mode", "calendar") or "calendar"
+
+        if mode == "day_sequence":
+            start = getattr(event, "day_index", None)
+            end = getattr(event, "day_index_end", None)
+            if start is None:
+                start_str = getattr(event, "start_date", "")
+                start = Event.parse_day_index(start_str) if start_str else None
+            if end is None:
+                end_str = getattr(event, "end_date", "")
+                end = Event.parse_day_index(end_str) if end_str else None
+            if start is None:
+                return mode, None, None
+            try:
+                start = int(start)
+                if end is not None:
+                    end = int(end)
+            except (ValueError, TypeError):
+                return mode, None, None
+            if end is None or end < start:
+                end = start
+            return mode, start, end
+
+        if isinstance(event, Event):
+            start_date, end_date = event.parsed_dates()
+        else:
+            start_date = Event.parse_date(getattr(event, "start_date", ""))
+            end_date = Event.parse_date(getattr(event, "end_date", ""))
+        if start_date is None:
+            return mode, None, None
+        start_date = start_date.date()
+        end_date = end_date.date() if end_date is not None else None
+        if end_date is None or end_date < start_date:
+            end_date = start_date
+        return mode, start_date, end_date
+
+    @staticmethod
+    def parse_date(value):
+        """Date string to datetime, None if it cannot be read"""
+        return date_parser.parse_datetime(value)
+
+    @staticmethod
+    def parse_day_index(value):
+        """Day number from 'Day 3' or '3', None if there is none"""
+        return date_parser.parse_day_index(value)
+
     def to_dict(self):
         """make dictionary"""
         data = super().to_dict()
@@ -57,32 +136,64 @@ class Event(BaseModel):
 
     @classmethod
     def from_dict(cls, data):
-        """Create event"""
-        event = super().from_dict(data)
-        event.start_date = data.get('start_date', '')
-        event.end_date = data.get('end_date', '')
-        event.location = data.get('location', '')
-        event.participants = cls._clean_list(data.get('participants', []))
-        event.related_events = cls._clean_list(data.get('related_events', []))
-        event.places = cls._clean_list(data.get('places', []))
-        event.timeline_mode = data.get('timeline_mode', 'calendar')
-        event.day_number = data.get('day_number', data.get('day_index'))
-        event.day_number_end = data.get('day_number_end', data.get('day_index_end'))
-        event.display_mode = data.get('display_mode', 'span')
-        event.day_index = data.get('day_index', data.get('day_number'))
-        event.day_index_end = data.get('day_index_end', data.get('day_number_end'))
-        event.associated_places = data.get('associated_places', data.get('places', []))
-        if event.timeline_mode == 'day_sequence':
-            if event.day_index is None:
-                event.day_index = cls._parse_day_value(event.start_date)
-            if event.day_index_end is None:
-                event.day_index_end = cls._parse_day_value(event.end_date)
-        if event.day_number is None:
-            event.day_number = event.day_index
-        if event.day_number_end is None:
-            event.day_number_end = event.day_index_end
+        """Create event.
+
+        Both project loaders create their events here. The new event is not
+        in a project yet, so its instance dict is filled at once instead of
+        running __init__ and the attribute setters; the id counter then
+        continues after the restored id.
+        """
+        get = data.get
+        start_date = get('start_date', '')
+        end_date = get('end_date', '')
+        timeline_mode = get('timeline_mode', 'calendar')
+        day_index = get('day_index', get('day_number'))
+        day_index_end = get('day_index_end', get('day_number_end'))
+        if timeline_mode == 'day_sequence':
+            if day_index is None:
+                day_index = cls._parse_day_value(start_date)
+            if day_index_end is None:
+                day_index_end = cls._parse_day_value(end_date)
+        day_number = get('day_number', get('day_index'))
+        if day_number is None:
+            day_number = day_index
+        day_number_end = get('day_number_end', get('day_index_end'))
+        if day_number_end is None:
+            day_number_end = day_index_end
+
+        event = cls.__new__(cls)
+        fields = event.__dict__
+        fields['id'] = data['id'] if 'id' in data else event._make_id()
+        fields.update(cls._base_fields(data))
+        fields.update(
+            start_date=start_date,
+            end_date=end_date,
+            location=get('location', ''),
+            participants=cls._clean_list(get('participants', [])),
+            related_events=cls._clean_list(get('related_events', [])),
+            places=cls._clean_list(get('places', [])),
+            timeline_mode=timeline_mode,
+            display_mode=get('display_mode', 'span'),
+            day_number=day_number,
+            day_number_end=day_number_end,
+            day_index=day_index,
+            day_index_end=day_index_end,
+            associated_places=get('associated_places', get('places', [])),
+        )
+        cls._sync_id_counter(event.id)
         return event
 
+    @classmethod
+    def _sync_id_counter(cls, identifier):
+        """Ensure ID counter is always higher than any restored ID"""
+        if not isinstance(identifier, str) or not identifier.startswith("EVE"):
+            return
+        suffix = identifier[3:]
+        if suffix.isdigit():
+            number = int(suffix)
+            if number >= Event.id_count:
+                Event.id_count = number + 1
+
     @staticmethod
     def _parse_day_value(value):
         """Extract numeric day value from a string like 'Day 1'."""
@@ -100,7 +211,7 @@ class Event(BaseModel):
     @staticmethod
     def _clean_list(items):
         """Clean list"""
-        if not isinstance(items, list):
+        if not items or not isinstance(items, list):
             return []
 
         clean_items = []
@@ -1,18 +1,291 @@
 import json
+from types import MappingProxyType
+from core.data.base_model import BaseModel
 from core.data.character import Character
 from core.data.event import Event
 from core.data.place import Place
+from core.data.relationship_index import RelationshipIndex
+from core.data.search_index import SearchIndex
+from core.data.time_index import EventTimeIndex
+from core.data.aggregates import ProjectAggregates
+
+
+class EntityList(list):
+    """List of entities that keeps an id -> entity index in sync"""
+
+    def __init__(self, kind, items=(), listeners=None):
+        super().__init__()
+        self.kind = kind
+        self._by_id = {}
+        # shared with the owning Project, called as listener(kind, entity, field, old_value)
+        self._listeners = listeners if listeners is not None else []
+        self.extend(items)
+
+    # lookups
+    def get(self, entity_id, default=None):
+        """Get entity by ID in O(1)"""
+        entity = self._by_id.get(entity_id)
+        if entity is None:
+            return default
+        if getattr(entity, 'id', None) != entity_id:
+            # id was changed behind our back, rebuild and retry once
+            self._reindex()
+            return self._by_id.get(entity_id, default)
+        return entity
+
+    def get_many(self, entity_ids):
+        """Get entities for a list of IDs, unknown IDs are skipped"""
+        found = []
+        for entity_id in entity_ids or []:
+            entity = self.get(entity_id)
+            if entity is not None:
+                found.append(entity)
+        return found
+
+    def has_id(self, entity_id):
+        return self.get(entity_id) is not None
+
+    def mapping(self):
+        """Read-only id -> entity view"""
+        return MappingProxyType(self._by_id)
+
+    # list mutations
+    def append(self, entity):
+        super().append(entity)
+        self._attach(entity)
+
+    def extend(self, entities):
+        entities = list(entities)
+        super().extend(entities)
+        for entity in entities:
+            self._attach(entity)
+
+    def __iadd__(self, entities):
+        self.extend(entities)
+        return self
+
+    def insert(self, index, entity):
+        super().insert(index, entity)
+        self._attach(entity)
+
+    def remove(self, entity):
+        super().remove(entity)
+        self._detach(entity)
+
+    def pop(self, index=-1):
+        entity = super().pop(index)
+        self._detach(entity)
+        return entity
+
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        for entity in removed:
+            self._detach(entity)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            removed, added = self[index], value
+        else:
+            removed, added = [self[index]], [value]
+        super().__setitem__(index, value)
+        for entity in removed:
+            self._detach(entity)
+        for entity in added:
+            self._attach(entity)
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for entity in removed:
+            self._detach(entity)
+
+    # index maintenance
+    def _attach(self, entity):
+        if isinstance(entity, BaseModel):
+            entity._registry = self
+        entity_id = getattr(entity, 'id', None)
+        if entity_id is not None and entity_id not in self._by_id:
+            self._by_id[entity_id] = entity
+        self._notify(entity, None, None)
+
+    def _detach(self, entity):
+        if entity in self:
+            # same object still present at another position
+            return
+        if getattr(entity, '_registry', None) is self:
+            entity._registry = None
+        entity_id = getattr(entity, 'id', None)
+        if self._by_id.get(entity_id) is entity:
+            del self._by_id[entity_id]
+            self._index_first(entity_id)
+        self._notify(entity, None, None)
+
+    def _notify(self, entity, field, old_value):
+        for listener in list(self._listeners):
+            listener(self.kind, entity, field, old_value)
+
+    def _index_first(self, entity_id):
+        """Point a duplicated ID at the first remaining entity"""
+        for entity in self:
+            if getattr(entity, 'id', None) == entity_id:
+                self._by_id[entity_id] = entity
+                return
+
+    def _release(self):
+        """Stop tracking all entities, used when the list is replaced"""
+        for entity in self:
+            if getattr(entity, '_registry', None) is self:
+                entity._registry = None
+
+    def _reindex(self):
+        # cleared in place so views from mapping() stay live
+        self._by_id.clear()
+        for entity in self:
+            entity_id = getattr(entity, 'id', None)
+            if entity_id is not None and entity_id not in self._by_id:
+                self._by_id[entity_id] = entity
+
+    def _entity_changed(self, entity, field, old_value):
+        """Called by BaseModel when a field on one of our entities changes"""
+        if field == 'id':
+            if self._by_id.get(old_value) is entity:
+                del self._by_id[old_value]
+                self._index_first(old_value)
+            if entity.id is not None and entity.id not in self._by_id:
+                self._by_id[entity.id] = entity
+        self._notify(entity, field, old_value)
+
+
+def _copy_containers(value):
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy_containers(item) for item in value]
+    return value
+
 
 class Project:
     """Main project"""
 
     def __init__(self):
+        self._listeners = [self._count_change]
+        self._revisions = {'character': 0, 'event': 0, 'place': 0}
+        self._relations = None
+        self._search_index = None
+        self._time_index = None
+        self._aggregates = None
         self.name = "My Project"
         self.characters = []
         self.events = []
         self.places = []
         self.metadata = {}
 
+    @property
+    def relations(self):
+        """RelationshipIndex for reverse lookups, created on first use"""
+        if self._relations is None:
+            self._relations = RelationshipIndex(self)
+        return self._relations
+
+    @property
+    def search_index(self):
+        """SearchIndex over the text of all entities, created on first use"""
+        if self._search_index is None:
+            self._search_index = SearchIndex(self)
+        return self._search_index
+
+    def search(self, query, limit=50, kinds=None):
+        """Ranked SearchHits for query, see SearchIndex.search"""
+        return self.search_index.search(query, limit, kinds)
+
+    @property
+    def time_index(self):
+        """EventTimeIndex of events sorted by start, created on first use"""
+        if self._time_index is None:
+            self._time_index = EventTimeIndex(self)
+        return self._time_index
+
+    def events_between(self, start, end=None, mode=None):
+        """Events overlapping start..end, ordered by start.
+
+        Dates (or datetimes) query calendar events and day numbers day
+        sequence events unless mode says otherwise; without end only events
+        on start itself are returned.
+        """
+        if mode is None:
+            mode = 'day_sequence' if isinstance(start, int) else 'calendar'
+        return self.time_index.between(start, end, mode)
+
+    @property
+    def aggregates(self):
+        """ProjectAggregates with summary values of the events, created on first use"""
+        if self._aggregates is None:
+            self._aggregates = ProjectAggregates(self)
+        return self._aggregates
+
+    @property
+    def revision(self):
+        """Grows with every change to characters, events or places, for caches"""
+        return sum(self._revisions.values())
+
+    def revision_of(self, kind):
+        """Change counter of one entity kind ('character', 'event' or 'place')"""
+        return self._revisions.get(kind, 0)
+
+    def _count_change(self, kind, entity, field, old_value):
+        self._revisions[kind] = self._revisions.get(kind, 0) + 1
+
+    @property
+    def characters(self):
+        return self._characters
+
+    @characters.setter
+    def characters(self, items):
+        self._characters = self._make_list('character', items, getattr(self, '_characters', None))
+
+    @property
+    def events(self):
+        return self._events
+
+    @events.setter
+    def events(self, items):
+        self._events = self._make_list('event', items, getattr(self, '_events', None))
+
+    @property
+    def places(self):
+        return self._places
+
+    @places.setter
+    def places(self, items):
+        self._places = self._make_list('place', items, getattr(self, '_places', None))
+
+    def _make_list(self, kind, items, previous):
+        if items is previous:
+            return previous
+        if previous is not None:
+            previous._release()
+        entities = EntityList(kind, items or [])
+        # listeners only hear about the replacement, not every new entity
+        entities._listeners = self._listeners
+        for listener in list(self._listeners):
+            listener(kind, None, None, None)
+        return entities
+
+    def add_listener(self, listener):
+        """Call listener(kind, entity, field, old_value) when entities change.
+
+        field is None when the entity was added or removed, and entity is
+        None when the whole list of that kind was replaced.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
     @classmethod
     def from_json(cls, data):
         """Create Project from JSON dict"""
@@ -36,14 +309,33 @@ class Project:
 
     def to_json(self, *, indent=2):
         """Serialize project to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        return self.dict_to_json(self.to_dict(), indent=indent)
+
+    @staticmethod
+    def dict_to_json(data, *, indent=2):
+        """Serialize a to_dict() result the same way as to_json"""
+        return json.dumps(data, indent=indent, ensure_ascii=False)
+
+    def snapshot(self):
+        """to_dict() with every list and dict copied, safe to hand to another thread"""
+        return _copy_containers(self.to_dict())
 
     def get_character(self, character_id):
         """Get character by ID"""
-        for char in self.characters:
-            if char.id == character_id:
-                return char
-        return None
+        return self.characters.get(character_id)
+
+    def get_event(self, event_id):
+        """Get event by ID"""
+        return self.events.get(event_id)
+
+    def get_place(self, place_id):
+        """Get place by ID"""
+        return self.places.get(place_id)
+
+    def reindex(self):
+        """Rebuild all ID indexes, e.g. after bulk ID migration"""
+        for entities in (self.characters, self.events, self.places):
+            entities._reindex()
 
     def __str__(self):
         """Show project """
@@ -0,0 +1,151 @@
+import codecs
+import json
+import os
+from core.data.character import Character
+from core.data.event import Event
+from core.data.place import Place
+from core.data.project import Project
+
+
+class StreamingProjectLoader:
+    """Reads a project JSON file piece by piece.
+
+    The characters, events and places arrays are decoded one entity at a
+    time, so only the current entity and one read chunk are held as text.
+    `steps()` builds the project in small batches and yields
+    (bytes_read, total_bytes) after each one, which lets the GUI keep
+    processing events and show progress. `load()` runs all steps at once.
+    """
+
+    ENTITY_TYPES = {
+        'characters': Character,
+        'events': Event,
+        'places': Place,
+    }
+
+    def __init__(self, file_path, chunk_size=1 << 16, batch_size=200):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.project = None
+        self.total_bytes = 0
+        self.bytes_read = 0
+        self._decoder = json.JSONDecoder()
+        self._handle = None
+        self._text_decoder = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def load(self):
+        """Load the whole file and return the Project"""
+        for _progress in self.steps():
+            pass
+        return self.project
+
+    def steps(self):
+        """Generator that builds the project, yielding (bytes_read, total_bytes)"""
+        self.total_bytes = os.path.getsize(self.file_path)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        with open(self.file_path, "rb") as handle:
+            self._handle = handle
+            try:
+                yield from self._parse_project()
+            finally:
+                self._handle = None
+                self._buffer = ""
+
+    def _parse_project(self):
+        if self._peek() is None:
+            raise ValueError("Project file is empty.")
+        self._expect("{")
+        project = Project()
+        data = {}
+        built = 0
+        first = True
+        while True:
+            if self._peek() == "}":
+                self._pos += 1
+                break
+            if not first:
+                self._expect(",")
+            first = False
+            key = self._decode_value()
+            self._expect(":")
+            entity_type = self.ENTITY_TYPES.get(key)
+            if entity_type is None:
+                data[key] = self._decode_value()
+                continue
+
+            entities = getattr(project, key)
+            self._expect("[")
+            first_item = True
+            while True:
+                if self._peek() == "]":
+                    self._pos += 1
+                    break
+                if not first_item:
+                    self._expect(",")
+                first_item = False
+                entities.append(entity_type.from_dict(self._decode_value()))
+                built += 1
+                if built % self.batch_size == 0:
+                    yield self.bytes_read, self.total_bytes
+
+        project.name = data.get('name', 'My Project')
+        project.metadata = data.get('metadata', {})
+        self.project = project
+        yield self.total_bytes, self.total_bytes
+
+    # low level reading
+    def _read_chunk(self):
+        if self._eof:
+            return False
+        raw = self._handle.read(self.chunk_size)
+        self.bytes_read += len(raw)
+        if not raw:
+            self._eof = True
+            self._buffer += self._text_decoder.decode(b"", final=True)
+            return False
+        if self._pos:
+            # drop everything that was already parsed
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += self._text_decoder.decode(raw)
+        return True
+
+    def _peek(self):
+        """Next non-whitespace character, None at end of file"""
+        while True:
+            buffer = self._buffer
+            length = len(buffer)
+            pos = self._pos
+            while pos < length and buffer[pos] in " \t\r\n":
+                pos += 1
+            self._pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._read_chunk():
+                return None
+
+    def _expect(self, character):
+        found = self._peek()
+        if found != character:
+            raise ValueError(f"Expected '{character}' at byte {self.bytes_read}, found {found!r}")
+        self._pos += 1
+
+    def _decode_value(self):
+        if self._peek() is None:
+            raise ValueError("Unexpected end of project file")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read_chunk():
+                    continue
+                raise
+            # a number right at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read_chunk():
+                continue
+            self._pos = end
+            return value
@@ -0,0 +1,142 @@
+from collections import Counter, defaultdict
+
+
+class RelationshipIndex:
+    """Reverse lookups derived from event participants and event places.
+
+    Answers character -> events, place -> events, place -> characters and
+    character -> places with dictionary lookups. The index listens to the
+    project and updates only the links of an event that was added, removed
+    or had its participants or places reassigned. Replacing a whole entity
+    list makes it rebuild on the next query.
+    """
+
+    LINK_FIELDS = ('participants', 'associated_places')
+
+    def __init__(self, project):
+        self.project = project
+        self._links = {}  # event_id -> (event, participants, places)
+        self._events_by_character = defaultdict(dict)
+        self._events_by_place = defaultdict(dict)
+        self._characters_by_place = defaultdict(Counter)
+        self._places_by_character = defaultdict(Counter)
+        self._dirty = True
+        project.add_listener(self._on_project_changed)
+
+    def detach(self):
+        """Stop listening to the project"""
+        self.project.remove_listener(self._on_project_changed)
+
+    def events_of_character(self, character_id):
+        self._ensure_built()
+        return list(self._events_by_character.get(character_id, ()))
+
+    def events_at_place(self, place_id):
+        self._ensure_built()
+        return list(self._events_by_place.get(place_id, ()))
+
+    def characters_at_place(self, place_id):
+        """Characters taking part in any event at place_id"""
+        self._ensure_built()
+        return list(self._characters_by_place.get(place_id, ()))
+
+    def places_of_character(self, character_id):
+        """Places of all events character_id takes part in"""
+        self._ensure_built()
+        return list(self._places_by_character.get(character_id, ()))
+
+    def participating_characters(self):
+        """Characters taking part in at least one event"""
+        self._ensure_built()
+        return list(self._events_by_character)
+
+    def rebuild(self):
+        self._links.clear()
+        self._events_by_character.clear()
+        self._events_by_place.clear()
+        self._characters_by_place.clear()
+        self._places_by_character.clear()
+        for event in self.project.events:
+            self._add(event)
+        self._dirty = False
+
+    def _ensure_built(self):
+        if self._dirty:
+            self.rebuild()
+
+    def _add(self, event):
+        event_id = getattr(event, 'id', None)
+        if event_id is None:
+            return
+        if event_id in self._links:
+            # a second event with the same id, keep the first like EntityList does
+            return
+        participants = self._unique(getattr(event, 'participants', None))
+        places = self._unique(getattr(event, 'associated_places', None))
+        self._links[event_id] = (event, participants, places)
+        for character_id in participants:
+            self._events_by_character[character_id][event_id] = None
+        for place_id in places:
+            self._events_by_place[place_id][event_id] = None
+            for character_id in participants:
+                self._characters_by_place[place_id][character_id] += 1
+                self._places_by_character[character_id][place_id] += 1
+
+    def _remove(self, event_id, event=None):
+        entry = self._links.get(event_id)
+        if entry is None or (event is not None and entry[0] is not event):
+            return
+        del self._links[event_id]
+        _event, participants, places = entry
+        for character_id in participants:
+            self._discard(self._events_by_character, character_id, event_id)
+        for place_id in places:
+            self._discard(self._events_by_place, place_id, event_id)
+            for character_id in participants:
+                self._decrement(self._characters_by_place, place_id, character_id)
+                self._decrement(self._places_by_character, character_id, place_id)
+
+    def _on_project_changed(self, kind, entity, field, old_value):
+        if kind != 'event' or self._dirty:
+            return
+        if entity is None:
+            self._dirty = True
+        elif field is None:
+            # added when it belongs to a list, removed otherwise
+            self._remove(entity.id, entity)
+            if getattr(entity, '_registry', None) is not None:
+                self._add(entity)
+            elif self.project.events.get(entity.id) is not None:
+                # another event with the same id takes its place
+                self._dirty = True
+        elif field == 'id':
+            self._remove(old_value, entity)
+            self._add(entity)
+        elif field in self.LINK_FIELDS:
+            self._remove(entity.id, entity)
+            self._add(entity)
+
+    @staticmethod
+    def _unique(ids):
+        if not isinstance(ids, (list, tuple)):
+            return ()
+        return tuple(dict.fromkeys(item for item in ids if item is not None))
+
+    @staticmethod
+    def _discard(mapping, key, value):
+        values = mapping.get(key)
+        if values is not None:
+            values.pop(value, None)
+            if not values:
+                del mapping[key]
+
+    @staticmethod
+    def _decrement(mapping, key, value):
+        counts = mapping.get(key)
+        if counts is None:
+            return
+        counts[value] -= 1
+        if counts[value] <= 0:
+            del counts[value]
+            if not counts:
+                del mapping[key]
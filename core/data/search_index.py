@@ -0,0 +1,263 @@
+import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Lower case words of text, in order"""
+    return [word.casefold() for word in _WORD.findall(text or "")]
+
+
+def _texts(value):
+    """All text inside a field value: strings, list items and dict values (extra fields)"""
+    if value is None:
+        return
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        if 'value' in value:
+            # an extra field entry, its other keys describe the field
+            yield from _texts(value['value'])
+            return
+        for item in value.values():
+            yield from _texts(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from _texts(item)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield str(value)
+
+
+def field_text(entity, field):
+    """Searchable text of one field of entity as a single string"""
+    return " ".join(_texts(getattr(entity, field, None)))
+
+
+def _deletes(token):
+    """token with one character left out, every way"""
+    return {token[:index] + token[index + 1:] for index in range(len(token))}
+
+
+def _within_one_edit(first, second):
+    """True for one insert, delete, substitution or swap of neighbours apart"""
+    if first == second:
+        return True
+    length_a, length_b = len(first), len(second)
+    if abs(length_a - length_b) > 1:
+        return False
+    if length_a > length_b:
+        first, second = second, first
+        length_a, length_b = length_b, length_a
+    index = 0
+    while index < length_a and first[index] == second[index]:
+        index += 1
+    if length_a == length_b:
+        if first[index + 1:] == second[index + 1:]:
+            return True
+        return (
+            index + 1 < length_a
+            and first[index] == second[index + 1]
+            and first[index + 1] == second[index]
+            and first[index + 2:] == second[index + 2:]
+        )
+    return first[index:] == second[index + 1:]
+
+
+class SearchHit:
+    """One search result: the entity, its kind, the score and the best matching field"""
+
+    def __init__(self, kind, entity, score, field):
+        self.kind = kind
+        self.entity = entity
+        self.score = score
+        self.field = field
+
+    def __repr__(self):
+        return f"SearchHit({self.kind!r}, {getattr(self.entity, 'name', None)!r}, {self.score:.2f}, {self.field!r})"
+
+
+class SearchIndex:
+    """Inverted word index over the text fields of characters, events and places.
+
+    Every word maps to the entities containing it with the weight of the
+    best field it appears in (a name counts more than a note). A query word
+    matches whole words and, from PREFIX_MIN_LENGTH letters on, words it
+    is a prefix of (found by bisecting the sorted word list). When neither exists and the word has at least
+    FUZZY_MIN_LENGTH letters, words one typo away match instead (found
+    through a table of one-letter deletions). An entity must match every
+    query word; hits are ranked by their summed score.
+
+    The index listens to the project and re-indexes only the entity that
+    was added, removed or had a text field changed. Replacing a whole
+    entity list makes it rebuild on the next query.
+    """
+
+    KINDS = ('character', 'event', 'place')
+    LISTS = {'character': 'characters', 'event': 'events', 'place': 'places'}
+    FIELDS = {
+        'character': (('name', 8.0), ('aliases', 6.0), ('description', 2.0), ('notes', 1.0), ('extra_fields', 1.0)),
+        'event': (('name', 8.0), ('location', 3.0), ('description', 2.0), ('notes', 1.0), ('extra_fields', 1.0)),
+        'place': (('name', 8.0), ('description', 2.0), ('notes', 1.0), ('extra_fields', 1.0)),
+    }
+    PREFIX_FACTOR = 0.6
+    FUZZY_FACTOR = 0.4
+    PREFIX_MIN_LENGTH = 2
+    FUZZY_MIN_LENGTH = 4
+    MAX_EXPANSIONS = 200
+
+    def __init__(self, project):
+        self.project = project
+        self._postings = defaultdict(dict)  # word -> {entity: (weight, field)}
+        self._docs = {}  # entity -> (kind, words)
+        self._words = []  # sorted distinct words, for prefix lookups
+        self._deleted = defaultdict(set)  # word with one letter left out -> words
+        self._dirty = True
+        project.add_listener(self._on_project_changed)
+
+    def detach(self):
+        """Stop listening to the project"""
+        self.project.remove_listener(self._on_project_changed)
+
+    def search(self, query, limit=50, kinds=None):
+        """Best SearchHits for query, highest score first"""
+        self._ensure_built()
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        matched = None
+        for term in terms:
+            scores = self._term_scores(term)
+            if matched is None:
+                matched = scores
+                continue
+            combined = {}
+            for entity, (score, field) in matched.items():
+                other = scores.get(entity)
+                if other is not None:
+                    combined[entity] = (score + other[0], field if score >= other[0] else other[1])
+            matched = combined
+            if not matched:
+                return []
+
+        hits = []
+        for entity, (score, field) in matched.items():
+            kind = self._docs[entity][0]
+            if kinds is not None and kind not in kinds:
+                continue
+            hits.append(SearchHit(kind, entity, score, field))
+        hits.sort(key=lambda hit: (-hit.score, (getattr(hit.entity, 'name', '') or '').casefold()))
+        return hits[:limit] if limit is not None else hits
+
+    def rebuild(self):
+        self._postings.clear()
+        self._docs.clear()
+        self._words = []
+        self._deleted.clear()
+        for kind in self.KINDS:
+            for entity in getattr(self.project, self.LISTS[kind]):
+                self._add(kind, entity)
+        self._dirty = False
+
+    def __len__(self):
+        self._ensure_built()
+        return len(self._docs)
+
+    def _ensure_built(self):
+        if self._dirty:
+            self.rebuild()
+
+    def _term_scores(self, term):
+        """entity -> (score, field) for one query word"""
+        scores = {}
+
+        def collect(word, factor):
+            for entity, (weight, field) in self._postings.get(word, {}).items():
+                score = weight * factor
+                if entity not in scores or scores[entity][0] < score:
+                    scores[entity] = (score, field)
+
+        collect(term, 1.0)
+        if len(term) < self.PREFIX_MIN_LENGTH:
+            return scores
+        words = self._words
+        start = bisect_left(words, term)
+        for position in range(start, min(len(words), start + self.MAX_EXPANSIONS)):
+            word = words[position]
+            if not word.startswith(term):
+                break
+            if word != term:
+                # shorter completions are more likely what was meant
+                collect(word, self.PREFIX_FACTOR * (0.5 + 0.5 * len(term) / len(word)))
+        if not scores and len(term) >= self.FUZZY_MIN_LENGTH:
+            candidates = set(self._deleted.get(term, ()))
+            for variant in _deletes(term):
+                if variant in self._postings:
+                    candidates.add(variant)
+                candidates.update(self._deleted.get(variant, ()))
+            for word in candidates:
+                if word != term and _within_one_edit(term, word):
+                    collect(word, self.FUZZY_FACTOR)
+        return scores
+
+    def _add(self, kind, entity):
+        if entity in self._docs:
+            return
+        words = {}
+        for field, weight in self.FIELDS[kind]:
+            for text in _texts(getattr(entity, field, None)):
+                for word in tokenize(text):
+                    if word not in words or words[word][0] < weight:
+                        words[word] = (weight, field)
+        for word, entry in words.items():
+            postings = self._postings[word]
+            if not postings:
+                self._add_word(word)
+            postings[entity] = entry
+        self._docs[entity] = (kind, tuple(words))
+
+    def _remove(self, entity):
+        doc = self._docs.pop(entity, None)
+        if doc is None:
+            return
+        for word in doc[1]:
+            postings = self._postings.get(word)
+            if postings is None:
+                continue
+            postings.pop(entity, None)
+            if not postings:
+                del self._postings[word]
+                self._remove_word(word)
+
+    def _add_word(self, word):
+        insort(self._words, word)
+        if len(word) >= self.FUZZY_MIN_LENGTH:
+            for variant in _deletes(word):
+                self._deleted[variant].add(word)
+
+    def _remove_word(self, word):
+        position = bisect_left(self._words, word)
+        if position < len(self._words) and self._words[position] == word:
+            del self._words[position]
+        if len(word) >= self.FUZZY_MIN_LENGTH:
+            for variant in _deletes(word):
+                variants = self._deleted.get(variant)
+                if variants is not None:
+                    variants.discard(word)
+                    if not variants:
+                        del self._deleted[variant]
+
+    def _on_project_changed(self, kind, entity, field, old_value):
+        if self._dirty or kind not in self.FIELDS:
+            return
+        if entity is None:
+            self._dirty = True
+        elif field is None:
+            # added when it belongs to a list, removed otherwise
+            self._remove(entity)
+            if getattr(entity, '_registry', None) is not None:
+                self._add(kind, entity)
+        elif any(field == name for name, _weight in self.FIELDS[kind]):
+            self._remove(entity)
+            self._add(kind, entity)
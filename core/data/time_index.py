@@ -0,0 +1,278 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from core.data.event import Event
+
+
+def event_span(event):
+    """(mode, start, end) of an event the way the timeline places it.
+
+    Calendar events give datetimes, day sequence events day numbers. A
+    missing or earlier end, or a point event, ends at its start; start and
+    end are None when the event has no usable start.
+    """
+    mode = getattr(event, 'timeline_mode', 'calendar') or 'calendar'
+    point = getattr(event, 'display_mode', 'span') == 'point'
+    if mode == 'day_sequence':
+        try:
+            start = int(getattr(event, 'day_index', None))
+        except (TypeError, ValueError):
+            return mode, None, None
+        if start <= 0:
+            return mode, None, None
+        try:
+            end = int(getattr(event, 'day_index_end', None))
+        except (TypeError, ValueError):
+            end = start
+    else:
+        if isinstance(event, Event):
+            start, end = event.parsed_dates()
+        else:
+            start = Event.parse_date(getattr(event, 'start_date', ''))
+            end = Event.parse_date(getattr(event, 'end_date', ''))
+        if start is None:
+            return mode, None, None
+    if point or end is None or end < start:
+        end = start
+    return mode, start, end
+
+
+class _DurationBucket:
+    """Events of one mode whose durations are within a power of two of each other"""
+
+    __slots__ = ('keys', 'starts', 'events', 'durations')
+
+    def __init__(self):
+        self.keys = []  # sorted (start, name, serial)
+        self.starts = []  # start of each key
+        self.events = []  # event of each key
+        self.durations = []  # sorted end - start
+
+
+class EventTimeIndex:
+    """Events sorted by start, per timeline mode, for window queries.
+
+    Each mode keeps its events ordered by (start, lower case name) in
+    parallel lists, plus the sorted ends and durations, so the earliest
+    start, the latest end and the events overlapping a range are found by
+    bisecting instead of scanning every event. For overlap queries the
+    events are also filed in buckets by duration class (durations within a
+    power of two of each other); each bucket is searched back from the
+    range start by its own longest duration, so one very long event does
+    not make every query look back over the whole timeline.
+
+    The index listens to the project and notes the events that were added,
+    removed, renamed or had a time field changed; the next query moves just
+    those. When more than a REBUILD_FRACTION of the events changed at once
+    (e.g. switching every event to another timeline mode) or the event
+    list was replaced, the index is sorted again from scratch instead.
+    """
+
+    WATCHED_FIELDS = frozenset(Event.TIME_FIELDS + ('display_mode', 'name'))
+    REBUILD_FRACTION = 0.125
+
+    def __init__(self, project):
+        self.project = project
+        self._entries = {}  # event -> (mode, key, end)
+        self._keys = defaultdict(list)  # mode -> sorted (start, name, serial)
+        self._starts = defaultdict(list)  # mode -> start of each key
+        self._events = defaultdict(list)  # mode -> event of each key
+        self._ends = defaultdict(list)  # mode -> sorted ends
+        self._buckets = defaultdict(dict)  # mode -> duration class -> _DurationBucket
+        self._serial = 0
+        self._stale = {}  # changed events, in order
+        self._dirty = True
+        project.add_listener(self._on_project_changed)
+
+    def detach(self):
+        """Stop listening to the project"""
+        self.project.remove_listener(self._on_project_changed)
+
+    def ordered(self, mode):
+        """Events of mode by (start, lower case name)"""
+        self._ensure_built()
+        return list(self._events.get(mode, ()))
+
+    def bounds(self, mode):
+        """(earliest start, latest end) of mode, (None, None) without events"""
+        self._ensure_built()
+        starts = self._starts.get(mode)
+        if not starts:
+            return None, None
+        return starts[0], self._ends[mode][-1]
+
+    def span_of(self, event):
+        """(mode, start, end) the event is indexed with, or None"""
+        self._ensure_built()
+        entry = self._entries.get(event)
+        if entry is None:
+            return None
+        return entry[0], entry[1][0], entry[2]
+
+    def between(self, start, end=None, mode='calendar'):
+        """Events of mode overlapping [start, end], ordered by start.
+
+        Calendar bounds may be dates, which cover the whole day, or
+        datetimes; day sequence bounds are day numbers.
+        """
+        self._ensure_built()
+        if end is None:
+            end = start
+        start, end = self._bound(start, time.min), self._bound(end, time.max)
+        if end < start:
+            return []
+        found = [(key, event) for key, event in self._candidates(start, end, mode)
+                 if self._entries[event][2] >= start]
+        found.sort(key=lambda row: row[0])
+        return [event for _key, event in found]
+
+    def first_from(self, start, mode='calendar'):
+        """First event of mode starting at or after start, or None"""
+        self._ensure_built()
+        starts = self._starts.get(mode)
+        if not starts:
+            return None
+        position = bisect_left(starts, self._bound(start, time.min))
+        return self._events[mode][position] if position < len(starts) else None
+
+    def rebuild(self):
+        self._stale.clear()
+        self._entries.clear()
+        for lists in (self._keys, self._starts, self._events, self._ends, self._buckets):
+            lists.clear()
+        rows = defaultdict(list)
+        for event in self.project.events:
+            entry = self._entry(event)
+            if entry is not None and event not in self._entries:
+                self._entries[event] = entry
+                rows[entry[0]].append((entry[1], event, entry[2]))
+        for mode, mode_rows in rows.items():
+            mode_rows.sort(key=lambda row: row[0])
+            self._keys[mode] = [row[0] for row in mode_rows]
+            self._starts[mode] = [row[0][0] for row in mode_rows]
+            self._events[mode] = [row[1] for row in mode_rows]
+            self._ends[mode] = sorted(row[2] for row in mode_rows)
+            for key, event, end in mode_rows:
+                duration = end - key[0]
+                bucket = self._bucket(mode, duration)
+                bucket.keys.append(key)
+                bucket.starts.append(key[0])
+                bucket.events.append(event)
+                bucket.durations.append(duration)
+            for bucket in self._buckets[mode].values():
+                bucket.durations.sort()
+        self._dirty = False
+
+    def __len__(self):
+        self._ensure_built()
+        return len(self._entries)
+
+    def _ensure_built(self):
+        if not self._dirty and self._stale:
+            if len(self._stale) > max(16, len(self._entries) * self.REBUILD_FRACTION):
+                self._dirty = True
+            else:
+                stale, self._stale = self._stale, {}
+                for event in stale:
+                    self._remove(event)
+                    if getattr(event, '_registry', None) is not None:
+                        self._add(event)
+        if self._dirty:
+            self.rebuild()
+
+    def _candidates(self, start, end, mode):
+        """(key, event) of the events of mode starting in [start - longest duration, end] of their bucket"""
+        for bucket in self._buckets.get(mode, {}).values():
+            first = bisect_left(bucket.starts, start - bucket.durations[-1])
+            last = bisect_right(bucket.starts, end)
+            for position in range(first, last):
+                yield bucket.keys[position], bucket.events[position]
+
+    def _bucket(self, mode, duration):
+        duration_class = self._duration_class(duration)
+        bucket = self._buckets[mode].get(duration_class)
+        if bucket is None:
+            bucket = self._buckets[mode][duration_class] = _DurationBucket()
+        return bucket
+
+    @staticmethod
+    def _duration_class(duration):
+        """Durations within a power of two of each other share a class, calendar ones counted in hours"""
+        if isinstance(duration, timedelta):
+            duration = int(duration.total_seconds()) // 3600
+        return duration.bit_length()
+
+    @staticmethod
+    def _bound(value, day_time):
+        """Calendar dates become datetimes at day_time, other values stay"""
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return datetime.combine(value, day_time)
+        return value
+
+    def _entry(self, event):
+        mode, start, end = event_span(event)
+        if start is None:
+            return None
+        self._serial += 1
+        return mode, (start, (getattr(event, 'name', '') or '').lower(), self._serial), end
+
+    def _add(self, event):
+        if event in self._entries:
+            return
+        entry = self._entry(event)
+        if entry is None:
+            return
+        mode, key, end = entry
+        self._entries[event] = entry
+        position = bisect_left(self._keys[mode], key)
+        self._keys[mode].insert(position, key)
+        self._starts[mode].insert(position, key[0])
+        self._events[mode].insert(position, event)
+        self._insert_sorted(self._ends[mode], end)
+        duration = end - key[0]
+        bucket = self._bucket(mode, duration)
+        position = bisect_left(bucket.keys, key)
+        bucket.keys.insert(position, key)
+        bucket.starts.insert(position, key[0])
+        bucket.events.insert(position, event)
+        self._insert_sorted(bucket.durations, duration)
+
+    def _remove(self, event):
+        entry = self._entries.pop(event, None)
+        if entry is None:
+            return
+        mode, key, end = entry
+        position = bisect_left(self._keys[mode], key)
+        del self._keys[mode][position]
+        del self._starts[mode][position]
+        del self._events[mode][position]
+        self._remove_sorted(self._ends[mode], end)
+        duration = end - key[0]
+        duration_class = self._duration_class(duration)
+        bucket = self._buckets[mode][duration_class]
+        position = bisect_left(bucket.keys, key)
+        del bucket.keys[position]
+        del bucket.starts[position]
+        del bucket.events[position]
+        self._remove_sorted(bucket.durations, duration)
+        if not bucket.keys:
+            del self._buckets[mode][duration_class]
+
+    @staticmethod
+    def _insert_sorted(values, value):
+        values.insert(bisect_right(values, value), value)
+
+    @staticmethod
+    def _remove_sorted(values, value):
+        position = bisect_left(values, value)
+        if position < len(values) and values[position] == value:
+            del values[position]
+
+    def _on_project_changed(self, kind, entity, field, old_value):
+        if kind != 'event' or self._dirty:
+            return
+        if entity is None:
+            self._dirty = True
+        elif field is None or field in self.WATCHED_FIELDS:
+            # re-filed on the next query, or dropped when no longer in the list
+            self._stale[entity] = None
@@ -7,16 +7,20 @@ from core.logic.ui.theme_controller import ThemeController
 from core.logic.project_controller import ProjectController
 from core.logic.ui.ui_controller import UIController
 from core.utils.timeline_helpers import HelperController
+from core.utils.link_reconciler import LinkReconciler
 from core.logic.ui.menu_controller import MenuController
 from core.logic.objects.character_controller import CharacterController
 from core.logic.objects.event_controller import EventController
 from core.logic.objects.place_controller import PlaceController
 from core.logic.ui.timeline_controller import TimelineController
 from core.logic.ui.table_controller import TableController
+from core.logic.thumbnail_cache import ThumbnailCache
+from core.logic.ui.refresh_scheduler import RefreshScheduler
 from ui.navigation import NavigationController
 from ui.core.ui_mapper import map_ui_from_generated
 from ui.menu_factory import create_basic_menus
 from ui.graphics.color import build_dark_palette
+from ui.graphics.shadows import SHADOW_MIN_ZOOM
 from core.utils.validation_manager import TimelineValidationManager
 from ui.core.main_window_ui import Ui_MainWindow as UiClass
 
@@ -47,7 +51,9 @@ class MainController(QMainWindow):
         """Prepare the default state for the controller."""
         # Project state
         self.project_dirty = False
+        self.edit_generation = 0  # bumped on every edit so a finished save can tell if it is stale
         self.dark_mode_enabled = False
+        self.shadow_min_zoom = SHADOW_MIN_ZOOM
         self.timeline_mode = "calendar"
         self.timeline_mode_locked = False
         self.timeline_display_mode = "span"
@@ -126,11 +132,13 @@ class MainController(QMainWindow):
         self.place_controller = PlaceController(self)
 
         self.timeline_controller = TimelineController(self)
+        self.thumbnail_cache = ThumbnailCache(parent=self)
         self.table_controller = TableController(self)
         self.table_controller.attach_table_signals()
         self.navigation_controller = NavigationController(self)
 
         self.menu_controller = MenuController(self)
+        self.refresh_scheduler = RefreshScheduler(self)
         print(" Controllers created")
 
     def finish_startup(self):
@@ -164,6 +172,7 @@ class MainController(QMainWindow):
             self.timeline_display_mode = metadata.get('timeline_display_mode', "span")
             self.timeline_display_mode_locked = bool(metadata.get('timeline_display_mode_locked', False))
             self.dark_mode_enabled = bool(metadata.get('dark_mode_enabled', False))
+            self.shadow_min_zoom = self._zoom_setting(metadata.get('shadow_min_zoom'), SHADOW_MIN_ZOOM)
 
             self._migrate_project_ids()
             self.update_character_event_links()
@@ -205,6 +214,16 @@ class MainController(QMainWindow):
         self.project.metadata['timeline_display_mode'] = self.timeline_display_mode
         self.project.metadata['timeline_display_mode_locked'] = self.timeline_display_mode_locked
         self.project.metadata['dark_mode_enabled'] = self.dark_mode_enabled
+        self.project.metadata['shadow_min_zoom'] = self.shadow_min_zoom
+
+    @staticmethod
+    def _zoom_setting(value, default):
+        """A zoom level read from project metadata, default if it is not a number >= 0"""
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return default
+        return value if value >= 0 else default
 
     def _maybe_unlock_timeline_modes(self):
         """Unlock timeline settings when the project no longer has events."""
@@ -215,6 +234,8 @@ class MainController(QMainWindow):
 
     def mark_project_dirty(self, dirty= True):
         """Sets the project's dirty state and updates the UI."""
+        if dirty:
+            self.edit_generation += 1
         self.project_dirty = dirty
         self._update_window_title()
 
@@ -376,25 +397,14 @@ class MainController(QMainWindow):
                 places_migrated += 1
 
         if events_migrated > 0 or characters_migrated > 0 or places_migrated > 0:
+            self.project.reindex()
             print(f"Project migration: Generated {events_migrated} event IDs, {characters_migrated} character IDs, {places_migrated} place IDs")
             self.mark_dirty(True)
 
     def update_character_event_links(self):
-        """check character.associated_events is synced with event.participants"""
-        for character in self.project.characters:
-            if not hasattr(character, 'associated_events'):
-                character.associated_events = []
-            else:
-                character.associated_events.clear()
-
-        for event in self.project.events:
-            if hasattr(event, 'participants') and event.participants:
-                for char_id in event.participants:
-                    character = next((ch for ch in self.project.characters if ch.id == char_id), None)
-                    if character:
-                        if not hasattr(character, 'associated_events'):
-                            character.associated_events = []
-                        if event.id not in character.associated_events:
-                            character.associated_events.append(event.id)
-
+        """check character and place links are synced with event participants and places"""
+        report = LinkReconciler(self.project).reconcile()
         print("Character-event associations synced.")
+        if report.changed or report.dangling:
+            print(report.summary())
+        return report
@@ -3,6 +3,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QMessageBox,QInputDialog,QDialog,QFormLayout,QLineEdit,QTextEdit,QSpinBox,QDialogButtonBox
 from core.data.character import Character
 from core.utils.timeline_helpers import HelperController
+from core.utils.link_reconciler import LinkReconciler
 from core.logic.objects.base_controller import BaseEntityController
 from typing import Any, Dict, List
 
@@ -34,13 +35,13 @@ class CharacterController(BaseEntityController):
 
         if hasattr(character, "associated_events"):
             if target_event.id not in character.associated_events:
-                character.associated_events.insert(0, target_event.id)
+                character.associated_events = [target_event.id] + character.associated_events
             if source_event.id in character.associated_events:
                 character.associated_events = [eid for eid in character.associated_events if eid != source_event.id]
 
         self.main_controller._update_character_places_from_events(character)
         self.main_controller.mark_project_dirty()
-        self.main_controller._update_ui()
+        self._refresh_after_move()
         return True
 
     def move_to_top_now(self, character, event):
@@ -75,29 +76,20 @@ class CharacterController(BaseEntityController):
         event.participants = new_list
 
         self.main_controller.mark_project_dirty()
-        self.main_controller._update_ui()
+        self._refresh_after_move()
         return True
+
+    def _refresh_after_move(self):
+        """Redraw after a participant move; the tables follow the change themselves"""
+        scheduler = getattr(self.main_controller, 'refresh_scheduler', None)
+        if scheduler:
+            scheduler.request('timeline')
+        else:
+            self.main_controller._update_ui()
         
     def sync_character_events(self, character, previous_events=None):
         """helper to sync character's events"""
-        if previous_events is None:
-            previous_events = set()
-        current_events = set(character.associated_events or [])
-
-        for event in getattr(self.main_controller.project, "events", []):
-            participants = getattr(event, "participants", None)
-            if not isinstance(participants, list):
-                event.participants = []
-                participants = event.participants
-
-            if event.id in current_events:
-                self.main_controller.helper_controller.append_unique(event.participants, character.id)
-            elif event.id in previous_events and character.id in participants:
-                filtered = []
-                for cid in participants:
-                    if cid != character.id:
-                        filtered.append(cid)
-                event.participants = filtered
+        LinkReconciler(self.main_controller.project).sync_character(character, previous_events or ())
     def apply_form_to_character(self, character, form_data, *, fallback_name=None):
         """helper to apply form data to character"""
         if fallback_name is None:
@@ -159,11 +151,7 @@ class CharacterController(BaseEntityController):
         if not event_id:
             return
         
-        target_event = None
-        for evt in self.main_controller.project.events:
-            if getattr(evt, "id", None) == event_id:
-                target_event = evt
-                break
+        target_event = self.main_controller.project.events.get(event_id)
         if target_event is None:
             QMessageBox.warning(self.main_controller, 'Event Not Found', 'Could not locate the selected event.')
             return
@@ -222,10 +210,7 @@ class CharacterController(BaseEntityController):
         if "(" in selected_item and selected_item.endswith(")"):
             start = selected_item.rfind("(") + 1
             char_id = selected_item[start:-1]
-            for char in characters:
-                if char.id == char_id:
-                    chosen_character = char
-                    break
+            chosen_character = characters.get(char_id)
 
         if chosen_character is None:
             selected_name = selected_item.split(" (")[0]
@@ -263,12 +248,7 @@ class CharacterController(BaseEntityController):
         if not character_id:
             return
 
-        character = None
-        for ch in self.main_controller.project.characters:
-            if getattr(ch, "id", None) == character_id:
-                character = ch
-                break
-
+        character = self.main_controller.project.characters.get(character_id)
         if character is None:
             QMessageBox.warning(self.main_controller, "Character Not Found", "Could not locate the selected character.")
             return
@@ -405,11 +385,7 @@ class CharacterController(BaseEntityController):
         events_list = getattr(self.main_controller.project, "events", [])
         if events_list:
             if force_event_id is not None:
-                forced_event = None
-                for event in events_list:
-                    if getattr(event, "id", None) == force_event_id:
-                        forced_event = event
-                        break
+                forced_event = events_list.get(force_event_id)
                 forced_name = "(Unknown event)"
                 if forced_event is not None and getattr(forced_event, "name", ""):
                     forced_name = forced_event.name
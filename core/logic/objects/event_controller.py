@@ -4,6 +4,7 @@ from PySide6.QtGui import QTextOption
 from PySide6.QtWidgets import QComboBox,QDialog,QDialogButtonBox,QFormLayout,QInputDialog,QLineEdit,QMessageBox,QTextEdit
 from core.data.event import Event
 from core.logic.objects.base_controller import BaseEntityController
+from core.utils.link_reconciler import LinkReconciler
 
 class EventController(BaseEntityController):
     """Basic for events."""
@@ -108,28 +109,10 @@ class EventController(BaseEntityController):
             self.main_controller.timeline_display_mode_locked = True
 
     def update_char_links(self, event, previous_participants):
-        current_participants = set(getattr(event, "participants", []))
-        for character in self.main_controller.project.characters:
-            if not hasattr(character, "associated_events"):
-                character.associated_events = []
-
-            if character.id in current_participants:
-                self.main_controller._append_unique(character.associated_events, event.id)
-                self.main_controller._update_character_places_from_events(character)
-            elif character.id in previous_participants and event.id in character.associated_events:
-                character.associated_events = [eid for eid in character.associated_events if eid != event.id]
-                self.main_controller._update_character_places_from_events(character)
+        LinkReconciler(self.main_controller.project).sync_event_characters(event, previous_participants)
 
     def update_place_links(self, event, previous_places):
-        current_places = set(getattr(event, "associated_places", []))
-        for place in self.main_controller.project.places:
-            if not hasattr(place, "associated_events"):
-                place.associated_events = []
-
-            if place.id in current_places:
-                self.main_controller._append_unique(place.associated_events, event.id)
-            elif place.id in previous_places and event.id in place.associated_events:
-                place.associated_events = [eid for eid in place.associated_events if eid != event.id]
+        LinkReconciler(self.main_controller.project).sync_event_places(event, previous_places)
 
     def update_after_change(self):
         self.main_controller._sync_timeline_settings()
@@ -376,10 +359,7 @@ class EventController(BaseEntityController):
         chosen_event = None
         if "(" in selected and selected.endswith(")"):
             event_id = selected[selected.rfind("(") + 1:-1]
-            for event in events:
-                if event.id == event_id:
-                    chosen_event = event
-                    break
+            chosen_event = events.get(event_id)
         if chosen_event is None:
             event_name = selected.split(" (")[0]
             for event in events:
@@ -391,9 +371,9 @@ class EventController(BaseEntityController):
         return chosen_event
 
     def get_event_by_id(self, event_id):
-        for event in self.main_controller.project.events:
-            if getattr(event, "id", None) == event_id:
-                return event
+        event = self.main_controller.project.events.get(event_id)
+        if event is not None:
+            return event
         QMessageBox.warning(
             self.main_controller,
             "Event Not Found",
@@ -415,10 +395,7 @@ class EventController(BaseEntityController):
         project = getattr(self.main_controller, "project", None)
         if not project:
             return
-        places = getattr(project, "places", [])
-        places_by_id = {}
-        for place in places:
-            places_by_id[place.id] = place
+        places_by_id = project.places.mapping()
         for event in getattr(project, "events", []):
             self.ensure_place(event, places_by_id)
 
@@ -435,9 +412,7 @@ class EventController(BaseEntityController):
         primary = place_ids[0]
         event.associated_places = [primary]
         if places_by_id is None:
-            places_by_id = {}
-            for place in self.main_controller.project.places:
-                places_by_id[place.id] = place
+            places_by_id = self.main_controller.project.places.mapping()
 
         primary_place = places_by_id.get(primary)
         if primary_place is not None:
@@ -459,10 +434,3 @@ class EventController(BaseEntityController):
         if filtered_ids:
             return [filtered_ids[0]]
         return []
-
-    def resolve_place(self, event, lane_map):
-        """which place an event should appear in"""
-        for place_id in getattr(event, "associated_places", []):
-            if place_id in lane_map:
-                return place_id
-        return "__NO_PLACE__"
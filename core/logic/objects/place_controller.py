@@ -50,10 +50,7 @@ class PlaceController(BaseEntityController):
         chosen_place = None
         if '(' in selected_item and selected_item.endswith(')'):
             place_id = selected_item[selected_item.rfind('(') + 1:-1]
-            for candidate in places:
-                if candidate.id == place_id:
-                    chosen_place = candidate
-                    break
+            chosen_place = places.get(place_id)
         if chosen_place is None:
             selected_name = selected_item.split(' (')[0]
             for candidate in places:
@@ -82,11 +79,7 @@ class PlaceController(BaseEntityController):
 
     def edit_by_id(self, place_id):
         """Edit place by id"""
-        place = None
-        for candidate in self.main_controller.project.places:
-            if getattr(candidate, 'id', None) == place_id:
-                place = candidate
-                break
+        place = self.main_controller.project.places.get(place_id)
         if place is None:
             QMessageBox.warning(self.main_controller, 'Place Not Found', 'Could not locate the selected place.')
             return
@@ -185,9 +178,9 @@ class PlaceController(BaseEntityController):
         character_names = []
         project = getattr(self.main_controller, 'project', None)
         if project and getattr(project, 'characters', None):
-            id_to_name = {char.id: getattr(char, 'name', char.id) for char in project.characters}
             for character_id in characters_in_events or []:
-                character_names.append(id_to_name.get(character_id, character_id))
+                character = project.characters.get(character_id)
+                character_names.append(getattr(character, 'name', character_id) if character else character_id)
         characters_text = ", ".join(character_names) if character_names else "No characters participate in events at this place"
 
         characters_display = QTextEdit()
@@ -1,15 +1,26 @@
-import json
 import os
 import re
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QFileDialog, QMessageBox, QInputDialog, QLineEdit
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QInputDialog, QLineEdit, QProgressDialog
+from core.data import binary_format
+from core.data.binary_format import BinaryProjectLoader
 from core.data.project import Project
+from core.data.project_loader import StreamingProjectLoader
+from core.logic.save_worker import SaveWorker
+from core.utils.atomic_file import write_atomic
 
 class ProjectController:
     """Handles creating, opening and saving projects."""
 
+    PROGRESS_STEPS = 1000
+    JSON_FILTER = "Timeline Projects (*.json)"
+    BINARY_FILTER = "Compact Timeline Projects (*.tlbin)"
+
     def __init__(self, main_controller):
         self.main_controller = main_controller
+        self._active_load = None
+        self._active_save = None
+        self._queued_save = None
 
     def new(self):
         """Create a new empty project"""
@@ -34,7 +45,7 @@ class ProjectController:
             return
         dialog = QFileDialog(self.main_controller)
         dialog.setWindowTitle("Open Project")
-        dialog.setNameFilter("Timeline Projects (*.json)")
+        dialog.setNameFilters(["Timeline Projects (*.json *.tlbin)", self.JSON_FILTER, self.BINARY_FILTER])
         dialog.setFileMode(QFileDialog.ExistingFile)
         dialog.setModal(True)
         dialog.setWindowModality(Qt.ApplicationModal)
@@ -53,7 +64,13 @@ class ProjectController:
         if not self._validate_path(filepath, for_reading=True):
             self._bring_window_to_front()
             return
-        project = self._load_project_from_file(filepath)
+        self._load_project_in_background(filepath, self._finish_open)
+
+    def _finish_open(self, filepath, project, canceled=False):
+        if canceled:
+            print(f"Loading cancelled: {filepath}")
+            self._bring_window_to_front()
+            return
         if not project:
             QMessageBox.warning(self.main_controller, "Error", "Failed to load project!")
             self._bring_window_to_front()
@@ -67,33 +84,75 @@ class ProjectController:
         print(f"Project loaded successfully: {filepath}")
         self._bring_window_to_front()
 
-    def save(self):
-        """Save the current project to its current filename."""
+    def save(self, *, wait=False):
+        """Save the current project to its current filename.
+
+        The file is written on a worker thread unless wait is True.
+        Returns False if the project was not saved.
+        """
         self._call_main("_sync_timeline_settings")
 
         if not getattr(self.main_controller, "current_file", None):
-            self.save_as()
-            return
+            return self.save_as(wait=wait)
 
         is_dirty = bool(getattr(self.main_controller, "project_dirty", False))
         if not is_dirty:
             self._show_already_saved()
-            return
+            return True
 
         file_path = self.main_controller.current_file
-        if self._save_project_to_file(self.main_controller.project, file_path):
-            print(f"Project saved successfully: {file_path}")
-            self._call_main("mark_project_dirty", False)
-            self._show_save_success()
-        else:
+        generation = getattr(self.main_controller, "edit_generation", 0)
+        if wait:
+            self.wait_for_saves()
+            if not self._save_project_to_file(self.main_controller.project, file_path):
+                QMessageBox.warning(self.main_controller, "Error", "Failed to save project!")
+                return False
+            self._on_save_finished(generation, file_path, "")
+            return True
+
+        if self._active_save is not None:
+            # one write at a time, the latest state is saved once it is done
+            self._queued_save = file_path
+            return True
+        snapshot = self._snapshot_for(file_path)(self.main_controller.project)
+        worker = SaveWorker(snapshot, file_path, self._serializer_for(file_path), generation)
+        worker.signals.finished.connect(self._on_save_finished)
+        self._active_save = worker
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def wait_for_saves(self):
+        """Block until a running background save has written its file"""
+        if self._active_save is not None:
+            QThreadPool.globalInstance().waitForDone()
+
+    def _on_save_finished(self, generation, file_path, error):
+        if self._active_save is not None and self._active_save.generation == generation:
+            self._active_save = None
+        if error:
+            print("Error saving project:", error)
             QMessageBox.warning(self.main_controller, "Error", "Failed to save project!")
+        else:
+            print(f"Project saved successfully: {file_path}")
+            # edits made while the file was written keep the project dirty
+            if getattr(self.main_controller, "edit_generation", 0) == generation:
+                self._call_main("mark_project_dirty", False)
+                self._show_save_success()
+
+        queued, self._queued_save = self._queued_save, None
+        if queued and self._active_save is None and getattr(self.main_controller, "project_dirty", False):
+            if queued == getattr(self.main_controller, "current_file", None):
+                self.save()
 
-    def save_as(self):
+    def save_as(self, *, wait=False):
         """Prompt for a new filename and save the project there."""
         dialog = QFileDialog(self.main_controller)
         dialog.setWindowTitle("Save Project")
-        dialog.setNameFilter("Timeline Projects (*.json)")
+        dialog.setNameFilters([self.JSON_FILTER, self.BINARY_FILTER])
         dialog.setDefaultSuffix("json")
+        dialog.filterSelected.connect(
+            lambda name_filter: dialog.setDefaultSuffix("tlbin" if name_filter == self.BINARY_FILTER else "json")
+        )
         dialog.setAcceptMode(QFileDialog.AcceptSave)
         dialog.setModal(True)
         dialog.setWindowModality(Qt.ApplicationModal)
@@ -103,6 +162,9 @@ class ProjectController:
 
         current_file = getattr(self.main_controller, "current_file", None)
         if current_file:
+            if self._is_binary_path(current_file):
+                dialog.selectNameFilter(self.BINARY_FILTER)
+                dialog.setDefaultSuffix("tlbin")
             dialog.selectFile(current_file)
         else:
             suggested = os.path.join(default_dir, self._suggest_project_filename())
@@ -112,21 +174,24 @@ class ProjectController:
         dialog.activateWindow()
 
         if dialog.exec() != QFileDialog.Accepted:
-            return
+            return False
 
         selected_files = dialog.selectedFiles()
         if not selected_files:
-            return
+            return False
 
         filepath = selected_files[0]
-        if not filepath.endswith(".json"):
-            filepath += ".json"
+        if not filepath.endswith((".json", binary_format.FILE_EXTENSION)):
+            if dialog.selectedNameFilter() == self.BINARY_FILTER:
+                filepath += binary_format.FILE_EXTENSION
+            else:
+                filepath += ".json"
 
         if not self._validate_path(filepath, for_reading=False):
-            return
+            return False
 
         self.main_controller.current_file = os.path.abspath(filepath)
-        self.save()
+        return self.save(wait=wait)
 
     def edit_project_name(self):
         """Prompt the user to rename the current project."""
@@ -212,8 +277,8 @@ class ProjectController:
 
     def _save_project_to_file(self, project, file_path):
         try:
-            with open(file_path, "w", encoding="utf-8") as handle:
-                handle.write(project.to_json())
+            data = binary_format.snapshot(project) if self._is_binary_path(file_path) else project.to_dict()
+            write_atomic(file_path, self._serializer_for(file_path)(data))
             return True
         except Exception as error:
             print("Error saving project:", error)
@@ -221,16 +286,78 @@ class ProjectController:
 
     def _load_project_from_file(self, file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as handle:
-                raw = handle.read()
-            if not raw.strip():
-                raise ValueError("Project file is empty.")
-            data = json.loads(raw)
-            return Project.from_json(data)
+            return self._loader_for(file_path).load()
         except Exception as error:
             print("Error loading project:", error)
             return None
 
+    @staticmethod
+    def _is_binary_path(file_path):
+        return file_path.lower().endswith(binary_format.FILE_EXTENSION)
+
+    def _snapshot_for(self, file_path):
+        """Function that copies a project for the serializer of file_path"""
+        if self._is_binary_path(file_path):
+            return binary_format.snapshot
+        return Project.snapshot
+
+    def _serializer_for(self, file_path):
+        """Function that turns Project.to_dict() data, or its snapshot, into the file contents for file_path"""
+        if self._is_binary_path(file_path):
+            return binary_format.dumps
+        return Project.dict_to_json
+
+    @staticmethod
+    def _loader_for(file_path):
+        # go by the file header, a renamed file still opens
+        if binary_format.is_binary_file(file_path):
+            return BinaryProjectLoader(file_path)
+        return StreamingProjectLoader(file_path)
+
+    def _load_project_in_background(self, file_path, on_done):
+        """Load file_path in small steps between GUI events and call on_done(file_path, project, canceled)"""
+        if self._active_load is not None:
+            return
+        loader = self._loader_for(file_path)
+        steps = loader.steps()
+
+        progress = QProgressDialog("Loading project...", "Cancel", 0, self.PROGRESS_STEPS, self.main_controller)
+        progress.setWindowTitle("Open Project")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+
+        timer = QTimer(self.main_controller)
+        timer.setInterval(0)
+
+        def finish(project, canceled=False):
+            timer.stop()
+            steps.close()
+            progress.close()
+            self._active_load = None
+            on_done(file_path, project, canceled)
+
+        def pump():
+            if progress.wasCanceled():
+                finish(None, canceled=True)
+                return
+            try:
+                done, total = next(steps)
+            except StopIteration:
+                finish(loader.project)
+                return
+            except Exception as error:
+                print("Error loading project:", error)
+                finish(None)
+                return
+            if total:
+                progress.setValue(min(self.PROGRESS_STEPS, int(done * self.PROGRESS_STEPS / total)))
+
+        timer.timeout.connect(pump)
+        self._active_load = (timer, progress)
+        timer.start()
+
     def _ask_for_project_name(self, initial_text):
         current_text = initial_text
         while True:
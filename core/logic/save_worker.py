@@ -0,0 +1,28 @@
+from PySide6.QtCore import QObject, QRunnable, Signal
+from core.utils.atomic_file import write_atomic
+
+
+class SaveSignals(QObject):
+    """finished(generation, file_path, error); error is empty on success"""
+    finished = Signal(int, str, str)
+
+
+class SaveWorker(QRunnable):
+    """Serializes a project snapshot and writes it atomically off the GUI thread"""
+
+    def __init__(self, snapshot, file_path, serialize, generation):
+        super().__init__()
+        self.snapshot = snapshot
+        self.file_path = file_path
+        self.serialize = serialize
+        self.generation = generation
+        self.signals = SaveSignals()
+        self.setAutoDelete(False)
+
+    def run(self):
+        error = ""
+        try:
+            write_atomic(self.file_path, self.serialize(self.snapshot))
+        except Exception as exc:
+            error = str(exc) or exc.__class__.__name__
+        self.signals.finished.emit(self.generation, self.file_path, error)
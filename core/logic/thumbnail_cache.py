@@ -0,0 +1,160 @@
+import hashlib
+import os
+from PySide6.QtCore import QObject, QRunnable, QSize, QStandardPaths, QThreadPool, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QImageReader, QPainter, QPixmap
+from core.utils.lru_cache import ByteSizeLRU
+
+
+def image_suffixes():
+    return {bytes(fmt).decode().lower() for fmt in QImageReader.supportedImageFormats()}
+
+
+class ThumbnailSignals(QObject):
+    """finished(key, image); the image is null if the file could not be decoded"""
+    finished = Signal(object, QImage)
+
+
+class ThumbnailJob(QRunnable):
+    """Decodes one thumbnail off the GUI thread, from the disk cache when possible"""
+
+    def __init__(self, key, path, size, disk_path):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.size = size
+        self.disk_path = disk_path
+        self.signals = ThumbnailSignals()
+        self.setAutoDelete(False)
+
+    def run(self):
+        image = QImage()
+        try:
+            if self.disk_path and os.path.exists(self.disk_path):
+                image = QImage(self.disk_path)
+            if image.isNull():
+                image = self.decode()
+                if not image.isNull() and self.disk_path:
+                    self.store(image)
+        except Exception as exc:
+            print(f"Error creating thumbnail for {self.path}: {exc}")
+            image = QImage()
+        self.signals.finished.emit(self.key, image)
+
+    def decode(self):
+        """Let the image plugin decode straight to the thumbnail size"""
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        original = reader.size()
+        if original.isValid() and (original.width() > self.size.width() or original.height() > self.size.height()):
+            reader.setScaledSize(original.scaled(self.size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            return image
+        if image.width() > self.size.width() or image.height() > self.size.height():
+            # formats without scaled decoding, or a rotated orientation tag
+            image = image.scaled(self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+    def store(self, image):
+        os.makedirs(os.path.dirname(self.disk_path), exist_ok=True)
+        temp_path = f"{self.disk_path}.{os.getpid()}.{id(self)}.tmp"
+        if image.save(temp_path, "PNG"):
+            os.replace(temp_path, self.disk_path)
+        elif os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class ThumbnailCache(QObject):
+    """Scaled image previews decoded on a thread pool.
+
+    `thumbnail()` answers from memory and otherwise queues a job and returns
+    a placeholder; `thumbnail_ready` is emitted with the file path once the
+    real thumbnail is in memory. Thumbnails are keyed by path, modification
+    time, file size and thumbnail size, kept in a memory LRU bounded by
+    bytes and written as PNG files to the user cache directory.
+    """
+
+    thumbnail_ready = Signal(str)
+
+    MEMORY_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, cache_dir=None, max_bytes=MEMORY_BYTES, parent=None):
+        super().__init__(parent)
+        if cache_dir is None:
+            location = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+            cache_dir = os.path.join(location, "thumbnails") if location else ""
+        self.cache_dir = cache_dir
+        self._memory = ByteSizeLRU(max_bytes)
+        self._failed = set()
+        self._jobs = {}
+        self._placeholders = {}
+        self._suffixes = image_suffixes()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, QThreadPool.globalInstance().maxThreadCount() - 1))
+
+    def is_image(self, path):
+        return bool(path) and os.path.splitext(path)[1][1:].lower() in self._suffixes
+
+    def thumbnail(self, path, size):
+        """The thumbnail of path fitting size, a placeholder while it loads, or None"""
+        if not self.is_image(path):
+            return None
+        key = self.key_for(path, size)
+        if key is None or key in self._failed:
+            return None
+        pixmap = self._memory.get(key)
+        if pixmap is not None:
+            return pixmap
+        if key not in self._jobs:
+            job = ThumbnailJob(key, path, QSize(size), self._disk_path(key))
+            job.signals.finished.connect(self._on_finished)
+            self._jobs[key] = job
+            self.pool.start(job)
+        return self.placeholder(size)
+
+    def cached(self, path, size):
+        """The thumbnail if it is already in memory, without queuing a job"""
+        key = self.key_for(path, size)
+        return self._memory.get(key) if key is not None else None
+
+    def placeholder(self, size):
+        size = QSize(size)
+        key = (size.width(), size.height())
+        pixmap = self._placeholders.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(size)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QColor(128, 128, 128, 160))
+            painter.setBrush(QColor(128, 128, 128, 60))
+            painter.drawRoundedRect(pixmap.rect().adjusted(1, 1, -1, -1), 6, 6)
+            painter.end()
+            self._placeholders[key] = pixmap
+        return pixmap
+
+    def wait_for_done(self, msecs=-1):
+        return self.pool.waitForDone(msecs)
+
+    @staticmethod
+    def key_for(path, size):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        size = QSize(size)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, size.width(), size.height())
+
+    def _disk_path(self, key):
+        if not self.cache_dir:
+            return ""
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest + ".png")
+
+    def _on_finished(self, key, image):
+        self._jobs.pop(key, None)
+        if image.isNull():
+            self._failed.add(key)
+        else:
+            self._memory.put(key, QPixmap.fromImage(image), image.sizeInBytes())
+        self.thumbnail_ready.emit(key[0])
@@ -1,73 +1,145 @@
+from bisect import bisect_right
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QPen
+from PySide6.QtWidgets import QGraphicsLineItem, QGraphicsRectItem
+
 
 class TimelineDragDropManager:
     """Manages drag & drop"""
 
+    PREVIEW_COLOR = "#ff4500"
+
     def __init__(self, timeline_controller):
         self.timeline_controller = timeline_controller
         self.scene = timeline_controller.scene
         self.main_controller = getattr(timeline_controller, 'main_controller', None)
+        self._preview = None
 
-    def get_drop_target(self, char_rect):
-        """Get drop target info"""
-        scene_rect = char_rect.sceneBoundingRect()
-        items_in_region = []
-        for scene_item in self.scene.items(scene_rect, Qt.IntersectsItemShape):
-            items_in_region.append(scene_item)
+    def get_drop_target(self, scene_rect, source=None):
+        """Get drop target info for a chip dragged to scene_rect; source is (character, event)"""
+        geometry = getattr(self.timeline_controller, 'geometry', None)
+        if geometry is None:
+            return None
+        left, top = scene_rect.left(), scene_rect.top()
+        right, bottom = scene_rect.right(), scene_rect.bottom()
 
         best_event = None
         best_overlap = 0.0
-        for item in items_in_region:
-            if item == char_rect:
-                continue
-            data = item.data(0)
-            if not data:
+        for position in geometry.events_in(left, top, scene_rect.width(), scene_rect.height()):
+            x, y, width, height = geometry.rect(position)
+            overlap_width = min(right, x + width) - max(left, x)
+            overlap_height = min(bottom, y + height) - max(top, y)
+            if overlap_width <= 0 or overlap_height <= 0:
                 continue
-            if not isinstance(data, dict):
-                continue
-            if data.get('kind') != 'event':
-                continue
-            other_rect = item.sceneBoundingRect()
-            overlap = scene_rect.intersected(other_rect)
-            if overlap.isValid():
-                overlap_area = overlap.width() * overlap.height()
-            else:
-                overlap_area = 0.0
+            overlap_area = overlap_width * overlap_height
             if overlap_area > best_overlap:
                 best_overlap = overlap_area
-                best_event = data.get('event')
+                best_event = geometry.events[position]
 
         if not best_event:
             return None
 
         drop_center_y = scene_rect.center().y()
-        insert_index = self.calc_insert_indx(best_event, drop_center_y, char_rect)
+        insert_index = self.calc_insert_indx(best_event, drop_center_y, source)
         return {
             'event': best_event,
             'index': insert_index,
         }
 
-    def calc_insert_indx(self, event, drop_center_y, dragged_item):
+    def _dragged_id(self, event, source):
+        """Id of the dragged character when it is dropped back into its own event"""
+        if source is not None and source[1] is event:
+            return source[0].id
+        return None
+
+    def calc_insert_indx(self, event, drop_center_y, source=None):
         """Estimate insert index based on drop position."""
         participants = getattr(event, 'participants', None)
         if not participants:
             return 0
+        geometry = getattr(self.timeline_controller, 'geometry', None)
+        position = geometry.position_of(event.id) if geometry is not None else None
+        if position is None:
+            return 0
 
-        candidate_positions = []
-        for item in self.scene.items():
-            if item is dragged_item:
-                continue
-            data = item.data(0)
-            if not data or not isinstance(data, dict):
-                continue
-            if data.get('kind') != 'character':
-                continue
-            if data.get('event') is not event:
-                continue
-            candidate_positions.append(item.sceneBoundingRect().center().y())
+        centers = geometry.block_centers[position]
+        index = bisect_right(centers, drop_center_y)
+        # the dragged block does not count when it is dropped back into its own event
+        dragged_id = self._dragged_id(event, source)
+        if dragged_id is not None:
+            for character, center_y in zip(geometry.event_participants[position], centers):
+                if character.id == dragged_id:
+                    if center_y <= drop_center_y:
+                        index -= 1
+                    break
+        return index
+
+    def preview_drop(self, scene_rect, source=None):
+        """Outline the event a dragged block would drop into and mark its insert slot"""
+        target = self.get_drop_target(scene_rect, source)
+        geometry = getattr(self.timeline_controller, 'geometry', None)
+        position = geometry.position_of(target['event'].id) if target and geometry is not None else None
+        if position is None:
+            self.clear_preview()
+            return
+        x, y, width, height = geometry.rect(position)
+        slot_y = self._slot_y(geometry, position, target['index'], self._dragged_id(target['event'], source))
+        outline, marker = self._preview_items()
+        outline.setRect(x, y, width, height)
+        marker.setLine(x + 8.0, slot_y, x + width - 8.0, slot_y)
+
+    def clear_preview(self):
+        if self._preview is None:
+            return
+        for item in self._preview:
+            try:
+                if item.scene() is self.scene:
+                    self.scene.removeItem(item)
+            except RuntimeError:
+                pass  # already deleted with the scene
+        self._preview = None
+
+    def _preview_items(self):
+        if self._preview is not None:
+            try:
+                if all(item.scene() is self.scene for item in self._preview):
+                    return self._preview
+            except RuntimeError:
+                pass
+            self.clear_preview()
+        color = QColor(self.PREVIEW_COLOR)
+        outline_pen = QPen(color, 2.5, Qt.DashLine)
+        outline_pen.setCosmetic(True)
+        outline = QGraphicsRectItem()
+        outline.setPen(outline_pen)
+        outline.setBrush(Qt.NoBrush)
+        outline.setZValue(999)
+        marker_pen = QPen(color, 3)
+        marker_pen.setCosmetic(True)
+        marker_pen.setCapStyle(Qt.RoundCap)
+        marker = QGraphicsLineItem()
+        marker.setPen(marker_pen)
+        marker.setZValue(999)
+        for item in (outline, marker):
+            item.setAcceptedMouseButtons(Qt.NoButton)
+            self.scene.addItem(item)
+        self._preview = (outline, marker)
+        return self._preview
 
-        candidate_positions.sort()
-        for index, center_y in enumerate(candidate_positions):
-            if drop_center_y < center_y:
-                return index
-        return len(candidate_positions)
+    def _slot_y(self, geometry, position, index, dragged_id):
+        """Scene y between the participant blocks where a block dropped at index goes"""
+        engine = self.timeline_controller.layout_engine
+        blocks = [
+            (center_y, engine.participant_block_height(character) / 2.0)
+            for character, center_y in zip(geometry.event_participants[position], geometry.block_centers[position])
+            if character.id != dragged_id
+        ]
+        if not blocks:
+            return geometry.content_tops[position] + 4.0
+        if index <= 0:
+            center_y, half_height = blocks[0]
+            return center_y - half_height - 1.0
+        if index >= len(blocks):
+            center_y, half_height = blocks[-1]
+            return center_y + half_height + 1.0
+        return (blocks[index - 1][0] + blocks[index][0]) / 2.0
@@ -1,12 +1,16 @@
 from PySide6.QtWidgets import QMessageBox
 from PySide6.QtGui import QAction
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QScrollArea, QWidget,QCheckBox, QPushButton, QLabel
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QScrollArea, QWidget,QCheckBox, QPushButton, QLabel, QInputDialog
+from datetime import date
+from core.data.event import Event
+from ui.find_dialog import FindDialog
 
 class MenuController:
     """Manages menu creation, actions, and signal connections"""
 
     def __init__(self, main_controller):
         self.main_controller = main_controller
+        self.find_dialog = None
 
     def config_edit_menu(self, edit_menu=None):
         """configure Edit menu if it has right actions."""
@@ -97,6 +101,15 @@ class MenuController:
         if hasattr(self.main_controller, 'actionEditProject') and self.main_controller.actionEditProject:
             self.main_controller.actionEditProject.triggered.connect(self.main_controller.project_controller.edit_project)
 
+        if hasattr(self.main_controller, 'actionFind_Ctrl_F') and self.main_controller.actionFind_Ctrl_F:
+            self.main_controller.actionFind_Ctrl_F.triggered.connect(self.show_find_dialog)
+        if hasattr(self.main_controller, 'actionGoToDate') and self.main_controller.actionGoToDate:
+            self.main_controller.actionGoToDate.triggered.connect(self.show_go_to_dialog)
+        if hasattr(self.main_controller, 'actionGoToToday') and self.main_controller.actionGoToToday:
+            self.main_controller.actionGoToToday.triggered.connect(self.go_to_today)
+        if hasattr(self.main_controller, 'actionShadowZoom') and self.main_controller.actionShadowZoom:
+            self.main_controller.actionShadowZoom.triggered.connect(self.show_shadow_zoom_dialog)
+
         #Filter menu
         if hasattr(self.main_controller, 'actionFilterCharacters') and self.main_controller.actionFilterCharacters:
             self.main_controller.actionFilterCharacters.triggered.connect(lambda: self.main_controller.apply_filter('characters'))
@@ -129,6 +142,50 @@ class MenuController:
         if hasattr(self.main_controller, 'btnZoomOut') and self.main_controller.btnZoomOut:
             self.main_controller.btnZoomOut.clicked.connect(self.main_controller.navigation_controller.zoom_out)
 
+    def show_find_dialog(self):
+        """Open the search dialog, kept between uses so the last query stays"""
+        if self.find_dialog is None:
+            self.find_dialog = FindDialog(self.main_controller)
+        self.find_dialog.open_search()
+
+    def show_go_to_dialog(self):
+        """Ask for a date (or a day number in day sequence mode) and scroll the timeline there"""
+        day_sequence = getattr(self.main_controller, 'timeline_mode', 'calendar') == 'day_sequence'
+        label = 'Day number:' if day_sequence else 'Date (YYYY-MM-DD):'
+        text, ok = QInputDialog.getText(self.main_controller, 'Go to Date', label)
+        if not ok or not text.strip():
+            return
+        if day_sequence:
+            value = Event.parse_day_index(text.strip())
+        else:
+            parsed = Event.parse_date(text.strip())
+            value = parsed.date() if parsed else None
+        if value is None:
+            QMessageBox.warning(self.main_controller, 'Go to Date', f'"{text.strip()}" is not a valid {label[:-1].lower()}')
+            return
+        self._go_to(value)
+
+    def go_to_today(self):
+        """Scroll the timeline to today, or to Day 1 in day sequence mode"""
+        day_sequence = getattr(self.main_controller, 'timeline_mode', 'calendar') == 'day_sequence'
+        self._go_to(1 if day_sequence else date.today())
+
+    def _go_to(self, value):
+        navigation = getattr(self.main_controller, 'navigation_controller', None)
+        if navigation is not None and not navigation.go_to(value):
+            QMessageBox.information(self.main_controller, 'Go to Date', f'{value} is not on the timeline')
+
+    def show_shadow_zoom_dialog(self):
+        """Ask for the zoom level below which the timeline skips shadows"""
+        value, ok = QInputDialog.getDouble(
+            self.main_controller,
+            'Shadow Zoom Level',
+            'Hide shadows below zoom (0 always shows them):',
+            self.main_controller.shadow_min_zoom, 0.0, 10.0, 2,
+        )
+        if ok:
+            self.main_controller.timeline_controller.set_shadow_min_zoom(value)
+
     def show_help(self):
         """Show help dialog"""
         QMessageBox.information(
@@ -141,6 +198,9 @@ class MenuController:
             '• Edit Menu: Modify existing items\n\n'
             '• View Menu: To see the lists of characters, events or places\n\n'
             '• Filter Menu: Focus on specific character/characters in the timeline\n\n'
+            '• Find (Ctrl+F): Search names, descriptions and notes and jump to a match\n\n'
+            '• Go to Date (Ctrl+G): Scroll the timeline to a date or day number\n\n'
+            '• Shadow Zoom Level: Hide shadows when zoomed out further than this, which keeps large timelines fast\n\n'
             '• Use the ⚏ , ▦  to switch views\n\n'
             '• Use + , -  to navigate timeline\n\n'
             '• Left Mouse Click: Default behavior (selects/moves items).\n\n'
@@ -199,11 +259,7 @@ class MenuController:
         checkboxes = {}
         current_filtered = getattr(self.main_controller, '_filtered_characters', set())
 
-        characters_in_events = set()
-        for event in self.main_controller.project.events:
-            if hasattr(event, 'participants'):
-                for participant_id in event.participants:
-                    characters_in_events.add(participant_id)
+        characters_in_events = set(self.main_controller.project.aggregates.participating_characters())
 
         avlbe_chars = []
         for character in self.main_controller.project.characters:
@@ -258,10 +314,9 @@ class MenuController:
 
         if character_ids:
             character_names = []
-            for char in self.main_controller.project.characters:
-                if char.id in character_ids:
-                    label = char.name if char.name else f"Character {char.id}"
-                    character_names.append(label)
+            for char in self.main_controller.project.characters.get_many(character_ids):
+                label = char.name if char.name else f"Character {char.id}"
+                character_names.append(label)
             names_text = ", ".join(character_names)
             QMessageBox.information(self.main_controller, 'Focus Enabled', f"Focusing on: {names_text}")
         else:
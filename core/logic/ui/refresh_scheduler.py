@@ -0,0 +1,83 @@
+from contextlib import contextmanager
+from PySide6.QtCore import QTimer
+
+
+class RefreshScheduler:
+    """Collects refresh requests and repaints once on the next event loop tick.
+
+    Callers mark regions dirty ('places', 'characters', 'events' tables and
+    the 'timeline'). Any number of requests before control returns to the
+    event loop end up as a single flush that only touches the dirty regions.
+    Inside `batch()` nothing is flushed until the outermost batch ends.
+    """
+
+    TABLES = ('places', 'characters', 'events')
+    REGIONS = TABLES + ('timeline',)
+
+    def __init__(self, main_controller):
+        self.main_controller = main_controller
+        self._dirty = set()
+        self._after = []
+        self._pending = False
+        self._batch_depth = 0
+        self.flush_count = 0
+
+    def request(self, *regions, after=None):
+        """Mark regions dirty (all of them if none given) and schedule a flush"""
+        unknown = set(regions) - set(self.REGIONS)
+        if unknown:
+            raise ValueError(f"Unknown refresh region: {', '.join(sorted(unknown))}")
+        self._dirty.update(regions or self.REGIONS)
+        if after is not None:
+            self._after.append(after)
+        self._schedule()
+
+    def request_tables(self, after=None):
+        self.request(*self.TABLES, after=after)
+
+    def request_timeline(self):
+        self.request('timeline')
+
+    @property
+    def dirty_regions(self):
+        return frozenset(self._dirty)
+
+    @contextmanager
+    def batch(self):
+        """Hold back flushes until the block is done, e.g. for bulk imports"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._schedule()
+
+    def flush(self):
+        """Repaint the dirty regions now"""
+        self._pending = False
+        if self._batch_depth or not (self._dirty or self._after):
+            return
+        dirty, self._dirty = self._dirty, set()
+        after, self._after = self._after, []
+        self.flush_count += 1
+
+        main = self.main_controller
+        main._update_window_title()
+        table_controller = getattr(main, 'table_controller', None)
+        tables = [kind for kind in self.TABLES if kind in dirty]
+        if tables and table_controller and getattr(main, 'tablePlacesData', None):
+            table_controller.update_tables(*tables)
+        timeline_controller = getattr(main, 'timeline_controller', None)
+        if 'timeline' in dirty and timeline_controller and getattr(main, 'viewTimeline', None):
+            timeline_controller.update_timeline()
+        main._sync_timeline_settings()
+
+        for callback in after:
+            callback()
+
+    def _schedule(self):
+        if self._pending or self._batch_depth or not (self._dirty or self._after):
+            return
+        self._pending = True
+        QTimer.singleShot(0, self.flush)
@@ -0,0 +1,382 @@
+import os
+from bisect import bisect_left, insort
+from datetime import datetime
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+from PySide6.QtGui import QColor
+
+# plain ints, comparing against the Qt enums costs more than building the cell text
+DISPLAY_ROLE = Qt.DisplayRole.value
+EDIT_ROLE = Qt.EditRole.value
+USER_ROLE = Qt.UserRole.value
+TOOLTIP_ROLE = Qt.ToolTipRole.value
+BACKGROUND_ROLE = Qt.BackgroundRole.value
+FOREGROUND_ROLE = Qt.ForegroundRole.value
+
+
+def wrap_text(text, words_per_line=6):
+    if not text:
+        return ""
+    lines = []
+    for paragraph in text.splitlines():
+        words = paragraph.split()
+        if not words:
+            lines.append("")
+            continue
+        for i in range(0, len(words), words_per_line):
+            lines.append(" ".join(words[i:i + words_per_line]))
+    return "\n".join(lines)
+
+
+def truncate(text, max_length=200):
+    """Truncate text to max length"""
+    if not text or len(text) <= max_length:
+        return text
+    return text[:max_length]
+
+
+def format_created(value):
+    """Return a YYYY-MM-DD string """
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value[:10]
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    try:
+        return str(value)[:10]
+    except Exception:
+        return ""
+
+
+def pick_text_color(color):
+    brightness = (
+        color.red() * 299
+        + color.green() * 587
+        + color.blue() * 114
+    ) / 1000
+    if brightness > 186:
+        return QColor("black")
+    return QColor("white")
+
+
+class TableColumn:
+    """One table column: header, how to read the value and which field an edit writes"""
+
+    def __init__(self, header, value, field=None, style="text", related=False, color=None):
+        self.header = header
+        self.value = value        # entity -> value
+        self.field = field        # attribute set by edits, None for read-only columns
+        self.style = style        # 'plain', 'text', 'long' or 'files'
+        self.related = related    # shows names of other entities
+        self.color = color        # entity -> background color, optional
+
+
+class EntityTableModel(QAbstractTableModel):
+    """Table model that reads its rows straight from one project entity list.
+
+    Cell text is only built when the view asks for it, so only the visible
+    rows cost anything. The model listens to the project and emits
+    dataChanged, rowsInserted and rowsRemoved for the rows that changed;
+    columns that show names of other entities are repainted once per event
+    loop tick when those entities change. Each subclass passes the function
+    that builds its TableColumns from the model.
+    """
+
+    kind = None
+    list_name = None
+    ROLES = frozenset((DISPLAY_ROLE, EDIT_ROLE, USER_ROLE, TOOLTIP_ROLE, BACKGROUND_ROLE, FOREGROUND_ROLE))
+
+    def __init__(self, table_controller, build_columns, parent=None):
+        super().__init__(parent)
+        self.table_controller = table_controller
+        self.columns = build_columns(self)
+        self.project = None
+        self._rows = []
+        self._row_of = None  # id(entity) -> row when built, see row_of
+        self._removed = []  # sorted rows removed since then, in the same numbering
+        self._related_pending = False
+
+    # binding
+    def set_project(self, project):
+        """Show the entities of project, returns False if it was already shown"""
+        if project is self.project:
+            return False
+        if self.project is not None:
+            self.project.remove_listener(self._on_project_changed)
+        self.project = project
+        if project is not None:
+            project.add_listener(self._on_project_changed)
+        self.reload()
+        return True
+
+    def reload(self):
+        self.beginResetModel()
+        self._rows = list(getattr(self.project, self.list_name, None) or [])
+        self._row_of = None
+        self.endResetModel()
+
+    def refresh(self):
+        """Repaint every cell, for changes the project does not report"""
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, len(self.columns) - 1))
+
+    def entity_at(self, row):
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def row_of(self, entity):
+        """Row of entity or None.
+
+        The row map is built once and then kept up to date: appended rows
+        are numbered on from the end and removed rows are remembered, so a
+        stored row only has to be moved up by the removals before it.
+        Inserting in the middle builds the map again on the next lookup.
+        """
+        if self._row_of is None:
+            self._row_of = {id(item): row for row, item in enumerate(self._rows)}
+            self._removed = []
+        stored = self._row_of.get(id(entity))
+        if stored is None or not self._removed:
+            return stored
+        return stored - bisect_left(self._removed, stored)
+
+    def column_of(self, field=None, style=None):
+        """First column that edits field, or that has style"""
+        for column, spec in enumerate(self.columns):
+            if (field is not None and spec.field == field) or (style is not None and spec.style == style):
+                return column
+        return -1
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section].header if 0 <= section < len(self.columns) else None
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if self.columns[index.column()].field:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=DISPLAY_ROLE):
+        if not isinstance(role, int):
+            role = role.value
+        if role not in self.ROLES:
+            return None
+        row = index.row()
+        if not 0 <= row < len(self._rows):
+            return None
+        entity = self._rows[row]
+        column = self.columns[index.column()]
+
+        if role == DISPLAY_ROLE:
+            return self._display_text(column, entity)
+        if role == EDIT_ROLE:
+            return column.value(entity) or ""
+        if role == USER_ROLE:
+            return column.value(entity)
+        if role == TOOLTIP_ROLE:
+            return self._tooltip(column, entity)
+        if column.color:
+            color = QColor(column.color(entity) or "")
+            if not color.isValid():
+                return None
+            return color if role == BACKGROUND_ROLE else pick_text_color(color)
+        return None
+
+    def setData(self, index, value, role=EDIT_ROLE):
+        if not isinstance(role, int):
+            role = role.value
+        if role != EDIT_ROLE or not index.isValid():
+            return False
+        column = self.columns[index.column()]
+        entity = self.entity_at(index.row())
+        if not column.field or entity is None:
+            return False
+        return self.table_controller.apply_edit(self.kind, entity, column.field, value)
+
+    # cell text
+    def _display_text(self, column, entity):
+        value = column.value(entity)
+        if column.style == "files":
+            return wrap_text(", ".join(os.path.basename(path) for path in self.files_of(value)))
+        if column.style == "long":
+            return wrap_text(truncate(value or "", 200), words_per_line=6)
+        if column.style == "text":
+            return wrap_text(value or "")
+        return "" if value is None else str(value)
+
+    def _tooltip(self, column, entity):
+        value = column.value(entity)
+        lines = []
+        if column.style == "files":
+            lines.extend(self.files_of(value))
+        elif column.style in ("text", "long") and value and value != self._display_text(column, entity):
+            lines.append(value)
+        if column.color:
+            color = QColor(column.color(entity) or "")
+            if color.isValid():
+                lines.append(f"Color: {color.name()}")
+        return "\n".join(lines) if lines else None
+
+    @staticmethod
+    def files_of(value):
+        return [path for path in (value or []) if path]
+
+    def names(self, list_name, ids):
+        entities = getattr(self.project, list_name, None)
+        if entities is None:
+            return ""
+        names = []
+        for entity_id in ids or []:
+            entity = entities.get(entity_id)
+            names.append(entity.name if entity else f"Unknown ({entity_id})")
+        return ", ".join(names)
+
+    # change tracking
+    def _on_project_changed(self, kind, entity, field, old_value):
+        if kind != self.kind:
+            self._related_changed()
+        elif entity is None:
+            self.reload()
+        elif field is None:
+            self._membership_changed(entity)
+        else:
+            row = self.row_of(entity)
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+            self._related_changed()
+
+    def _membership_changed(self, entity):
+        entities = getattr(self.project, self.list_name)
+        row = self.row_of(entity)
+        if getattr(entity, '_registry', None) is entities:
+            if row is not None:
+                return
+            if entities and entities[-1] is entity:
+                position = len(entities) - 1
+            else:
+                position = next((i for i, item in enumerate(entities) if item is entity), len(self._rows))
+            position = min(position, len(self._rows))
+            self.beginInsertRows(QModelIndex(), position, position)
+            if position == len(self._rows):
+                self._row_of[id(entity)] = position + len(self._removed)
+            else:
+                self._row_of = None
+            self._rows.insert(position, entity)
+            self.endInsertRows()
+        elif row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            insort(self._removed, self._row_of.pop(id(entity)))
+            if len(self._removed) > len(self._rows):
+                self._row_of = None  # cheaper to number the rows again
+            self.endRemoveRows()
+
+    def _related_changed(self):
+        if self._related_pending:
+            return
+        self._related_pending = True
+        QTimer.singleShot(0, self._emit_related_changed)
+
+    def _emit_related_changed(self):
+        self._related_pending = False
+        if not self._rows:
+            return
+        last_row = len(self._rows) - 1
+        for column, spec in enumerate(self.columns):
+            if spec.related:
+                self.dataChanged.emit(self.index(0, column), self.index(last_row, column))
+
+
+def place_columns(model):
+    """Columns of the place table, related names are looked up through model"""
+    return [
+        TableColumn("ID", lambda place: place.id, style="plain"),
+        TableColumn("Created", lambda place: format_created(place.created), style="plain"),
+        TableColumn("Name", lambda place: place.name, field="name"),
+        TableColumn("Description", lambda place: place.description, field="description", style="long"),
+        TableColumn("Files", lambda place: place.files, style="files"),
+        TableColumn("Events", lambda place: model.names('events', place.associated_events), related=True),
+        TableColumn(
+            "Characters",
+            lambda place: model.names('characters', model.project.relations.characters_at_place(place.id)),
+            related=True,
+        ),
+        TableColumn("Notes", lambda place: place.notes, field="notes", style="long"),
+    ]
+
+
+class PlaceTableModel(EntityTableModel):
+    kind = 'place'
+    list_name = 'places'
+
+    def __init__(self, table_controller, parent=None):
+        super().__init__(table_controller, place_columns, parent)
+
+
+def character_columns(model):
+    """Columns of the character table, related names are looked up through model"""
+    return [
+        TableColumn("ID", lambda character: character.id, style="plain"),
+        TableColumn("Created", lambda character: format_created(character.created), style="plain"),
+        TableColumn("Name", lambda character: character.name, field="name", color=lambda character: character.color),
+        TableColumn("Age", lambda character: getattr(character, 'age', None), style="plain"),
+        TableColumn("Description", lambda character: character.description, field="description", style="long"),
+        TableColumn("Files", lambda character: character.files, style="files"),
+        TableColumn(
+            "Events",
+            lambda character: model.names('events', getattr(character, 'associated_events', [])),
+            related=True,
+        ),
+        TableColumn(
+            "Places",
+            lambda character: model.names('places', getattr(character, 'associated_places', [])),
+            related=True,
+        ),
+        TableColumn("Notes", lambda character: character.notes, field="notes", style="long"),
+    ]
+
+
+class CharacterTableModel(EntityTableModel):
+    kind = 'character'
+    list_name = 'characters'
+
+    def __init__(self, table_controller, parent=None):
+        super().__init__(table_controller, character_columns, parent)
+
+
+def event_columns(model):
+    """Columns of the event table, related names are looked up through model"""
+    return [
+        TableColumn("ID", lambda event: event.id, style="plain"),
+        TableColumn("Created", lambda event: format_created(event.created), style="plain"),
+        TableColumn("Name", lambda event: event.name, field="name"),
+        TableColumn("Start Date", lambda event: event.start_date, field="start_date"),
+        TableColumn("End Date", lambda event: event.end_date, field="end_date"),
+        TableColumn("Description", lambda event: event.description, field="description", style="long"),
+        TableColumn("Files", lambda event: event.files, style="files"),
+        TableColumn("Places", lambda event: model.names('places', event.associated_places), related=True),
+        TableColumn("Characters", lambda event: model.names('characters', event.participants), related=True),
+        TableColumn("Notes", lambda event: event.notes, field="notes", style="long"),
+    ]
+
+
+class EventTableModel(EntityTableModel):
+    kind = 'event'
+    list_name = 'events'
+
+    def __init__(self, table_controller, parent=None):
+        super().__init__(table_controller, event_columns, parent)
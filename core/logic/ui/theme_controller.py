@@ -60,6 +60,10 @@ class ThemeController:
             button.setText(text)
 
     def _refresh_timeline(self):
+        scheduler = getattr(self.main_controller, "refresh_scheduler", None)
+        if scheduler:
+            scheduler.request_timeline()
+            return
         timeline = getattr(self.main_controller, "timeline_controller", None)
         if timeline:
             timeline.update_timeline()
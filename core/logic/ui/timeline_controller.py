@@ -1,7 +1,8 @@
-from PySide6.QtGui import QBrush, QColor
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor, QPen
+from PySide6.QtCore import QRectF, Qt, QTimer
+from PySide6.QtWidgets import QGraphicsRectItem
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict, Iterable, List, Set, Tuple
 from core.logic.ui.drag_drop_manager import TimelineDragDropManager
 from core.data.timeline_data import TimelineHandler
@@ -10,12 +11,15 @@ from core.logic.objects.event_controller import EventController
 from core.data.data_manager import TimelineDataManager
 from core.utils.validation_manager import TimelineValidationManager
 from ui.scene import TimelineScene
+from ui.graphics.scene_graph import RetainedSceneGraph
 from ui.graphics.color import TimelineColorManager
 from ui.graphics.render import TimelineRenderer
-from ui.graphics.layout import TimelineLayoutManager
+from ui.graphics.layout import TimelineLayoutManager, QtTextMetrics
+from core.utils.timeline_layout import LayoutCache, TimelineLayoutEngine
 from ui.info_dialogs import TimelineInfoDialogs
 from ui.click_handler import TimelineClickHandler
 from ui.navigation import NavigationController
+from ui.drag_drop import CharacterDragController
 from ui.graphics.drawing import draw_event_block
 from ui.graphics.participants import draw_participants as render_event_participants, draw_char_paths as render_character_paths
 
@@ -32,10 +36,14 @@ class TimelineController:
     LEFT_MARGIN = 180
     TOP_MARGIN = 80
     LANE_PADDING = 20
+    VIEWPORT_MARGIN = 400
+    FLASH_COLOR = "#ff4500"
+    FLASH_MS = 1500
 
     def __init__(self, main_controller):
         self.main_controller = main_controller
         self.scene = TimelineScene(self)
+        self.scene_graph = RetainedSceneGraph(self.scene)
         self.color_manager = TimelineColorManager(self)
         self.data_processor = TimelineHandler(main_controller)
         self.renderer = TimelineRenderer(self)
@@ -48,11 +56,43 @@ class TimelineController:
         self.click_handler = TimelineClickHandler(self)
         self.navigation_manager = NavigationController(main_controller)
         self.validation_manager = TimelineValidationManager(self)
+        # one drag controller for the participant chips of every event
+        self.character_drag = CharacterDragController(
+            self.scene,
+            get_drop_target=self._get_character_drop_target_event,
+            preview=self._preview_character_drop,
+            validate_move=self._validate_move,
+            move_to_event=self.character_manager.move_to_event_now,
+            move_within_event=self.character_manager.reposition_within_event_now,
+            refresh=self._refresh_after_character_drag,
+        )
+        self.layout_engine = TimelineLayoutEngine(
+            QtTextMetrics(),
+            day_width=self.DAY_WIDTH,
+            lane_height=self.LANE_HEIGHT,
+            left_margin=self.LEFT_MARGIN,
+            top_margin=self.TOP_MARGIN,
+            lane_padding=self.LANE_PADDING,
+        )
+        self.layout_cache = LayoutCache(self.layout_engine)
+        self.geometry = None
+        self._pass_inputs = None
+        self._lane_colors = {}
+
+        # virtualized mode only creates items near the visible part of the view
+        self.virtualize = True
+        self._grid_spec = None
+        self._materialized_rect = None
+        self._materialized_events = {}  # group key -> drawing position of the events with items
+        self._in_update = False
 
         view = getattr(self.main_controller, "viewTimeline", None)
         if view:
             view.setScene(self.scene)
             view.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+            for bar in (view.horizontalScrollBar(), view.verticalScrollBar()):
+                bar.valueChanged.connect(self.refresh_viewport)
+                bar.rangeChanged.connect(self.refresh_viewport)
         else:
             print("Warning: viewTimeline not found")
 
@@ -66,6 +106,7 @@ class TimelineController:
         self._places_map = {}
         self._filtered_characters = set()
         self._preserve_next_view_position = False
+        self._flash_item = None
 
     def update_timeline(self):
         view = getattr(self.main_controller, "viewTimeline", None)
@@ -89,8 +130,15 @@ class TimelineController:
             )
         self._preserve_next_view_position = False
 
-        self.scene.clear()
+        self._in_update = True
+        try:
+            self._update_timeline(view, preserve_scroll, saved_scroll, saved_v_fraction)
+        finally:
+            self._in_update = False
+        self._materialized_rect = None
+        self.refresh_viewport()
 
+    def _update_timeline(self, view, preserve_scroll, saved_scroll, saved_v_fraction):
         dark_mode = getattr(self.main_controller, "dark_mode_enabled", False)
         bg_color = QColor("#232323") if dark_mode else QColor("#ffffff")
         self.scene.setBackgroundBrush(QBrush(bg_color))
@@ -98,314 +146,172 @@ class TimelineController:
         self.color_manager.clear_caches()
 
         mode = getattr(self.main_controller, "timeline_mode", "calendar")
-        parsed_events = self._collect_events(mode)
-
-        characters = {}
-        for char in self.main_controller.project.characters:
-            characters[char.id] = char
-        places = {}
-        for place in self.main_controller.project.places:
-            places[place.id] = place
-        events_map = {}
-        for event in self.main_controller.project.events:
-            events_map[event.id] = event
-
+        project = self.main_controller.project
+        characters = project.characters.mapping()
         self._characters_map = characters
-        self._places_map = places
-        self._events_map = events_map
-
-        lane_items = self._build_lane_order(parsed_events, places)
-        lane_map = {}
-        for index, lane_info in enumerate(lane_items):
-            lane_id, _lane_label = lane_info
-            lane_map[lane_id] = index
-        lane_colors = {}
-        for lane_id, _lane_label in lane_items:
-            lane_colors[lane_id] = self.color_manager.place_color(lane_id)
-        characters_in_events = set()
-        for parsed in parsed_events:
-            event_obj = parsed.get('event')
-            participants = getattr(event_obj, 'participants', [])
-            for char_id in participants:
-                characters_in_events.add(char_id)
-
-        self.current_mode = mode
-        self.current_lane_count = max(1, len(lane_items))
-        self.current_min_date = None
-        self.current_day_count = 0
-
-        if not parsed_events:
-            day_count = 10
-            today = datetime.today()
-            min_date = datetime(today.year, today.month, today.day)
-            axis_labels = None
-            if mode == "day_sequence":
-                axis_labels = []
-                for index in range(day_count):
-                    axis_labels.append(f"Day {index + 1}")
-
-            if not lane_items:
-                lane_items = [("__NO_PLACE__", "No Place")]
-
-            lane_colors = {}
-            for lane_id, _lane_label in lane_items:
-                lane_colors[lane_id] = self.color_manager.place_color(lane_id)
-            lane_heights = []
-            for _lane in lane_items:
-                height_value = max(self.LANE_HEIGHT, 160.0)
-                lane_heights.append(height_value)
-            lane_height_map = {}
-            for idx, lane_info in enumerate(lane_items):
-                lane_id, _lane_label = lane_info
-                lane_height_map[lane_id] = lane_heights[idx]
-            lane_tops: Dict[str, float] = {}
-            current_top = self.TOP_MARGIN
-            for (lane_id, _), lane_height in zip(lane_items, lane_heights):
-                lane_tops[lane_id] = current_top
-                current_top += lane_height
-
-            total_height = current_top + 120.0
-            total_width = self.LEFT_MARGIN + day_count * self.DAY_WIDTH + 300
-
-            width = total_width
-            height = total_height
-            viewport = view.viewport()
-            if viewport:
-                width = max(width, viewport.width() / max(self.zoom_level, 1e-3))
-                height = max(height, viewport.height() / max(self.zoom_level, 1e-3))
-            self.scene.setSceneRect(0, 0, width, height)
-
-            self._draw_place_lanes(lane_items, lane_tops, lane_heights, lane_colors, day_count)
-            self._draw_day_grid(min_date, day_count, total_height, axis_labels=axis_labels)
-
-            self.current_min_date = min_date
-            self.current_day_count = day_count
-            if preserve_scroll and saved_scroll:
-                h_bar = view.horizontalScrollBar()
-                v_bar = view.verticalScrollBar()
-                if h_bar and saved_scroll[0] is not None:
-                    h_bar.setValue(saved_scroll[0])
-
-                if v_bar and saved_v_fraction is not None and v_bar.maximum() > 0:
-                    v_bar.setValue(int(saved_v_fraction * v_bar.maximum()))
+        self._places_map = project.places.mapping()
+        self._events_map = project.events.mapping()
+
+        previous = self.geometry
+        geometry = self.layout_cache.layout(project, mode, self._filtered_characters)
+        inputs = (mode, dark_mode, frozenset(self._filtered_characters))
+        changed = self.layout_cache.last_update
+        if geometry is previous and changed is not None and inputs == self._pass_inputs:
+            # only participants moved: redo the paths, visible events are compared again below
+            self._update_character_paths(geometry, characters, dark_mode)
+            self._materialize(self._visible_scene_rect(view))
             return
 
-        axis_labels = None
-        if mode == "day_sequence":
-            sequence_values = []
-            for item in parsed_events:
-                start_value = item['sequence_start']
-                end_value = item['sequence_end']
-                if start_value is not None:
-                    sequence_values.append(start_value)
-                if end_value is not None:
-                    sequence_values.append(end_value)
-            if sequence_values:
-                seq_min = min(sequence_values)
-                seq_max = max(sequence_values)
-            else:
-                seq_min = 1
-                seq_max = 1
-            day_count = max(1, seq_max - seq_min + 1)
-            axis_labels = []
-            for offset in range(day_count):
-                axis_labels.append(f"Day {seq_min + offset}")
-
-            today = datetime.today()
-            min_date = datetime(today.year, today.month, today.day)
-            max_date = min_date + timedelta(days=day_count - 1)
-        else:
-            valid_dates = []
-            for item in parsed_events:
-                if item['start'] is not None:
-                    valid_dates.append(item['start'])
-                if item['end'] is not None:
-                    valid_dates.append(item['end'])
-
-            if not valid_dates:
-                today = datetime.today()
-                min_date = datetime(today.year, today.month, today.day)
-                max_date = min_date
-            else:
-                min_date = min(valid_dates)
-                max_date = max(valid_dates)
-                if min_date > max_date:
-                    min_date, max_date = max_date, min_date
-            day_count = max(1, (max_date - min_date).days + 1)
+        self.scene_graph.begin_pass()
+        self._grid_spec = None
+        self._materialized_events = {}
+        self.geometry = geometry
+        self._pass_inputs = inputs
+        self.current_mode = mode
+        self.current_lane_count = max(1, len(geometry.lane_ids))
 
-        total_height = self.TOP_MARGIN + len(lane_items) * self.LANE_HEIGHT + 100
-        total_width = self.LEFT_MARGIN + day_count * self.DAY_WIDTH + 300
+        lane_items = geometry.lane_items()
+        lane_tops = geometry.lane_top_map()
+        lane_colors = {lane_id: self.color_manager.place_color(lane_id) for lane_id in geometry.lane_ids}
+        self._lane_colors = lane_colors
 
-        width = total_width
-        height = total_height
+        width = geometry.width
+        height = geometry.height
         viewport = view.viewport()
         if viewport:
             width = max(width, viewport.width() / max(self.zoom_level, 1e-3))
             height = max(height, viewport.height() / max(self.zoom_level, 1e-3))
         self.scene.setSceneRect(0, 0, width, height)
-        
-        lane_labels = {lane_id: label for lane_id, label in lane_items}
 
-        if mode == "day_sequence":
-            parsed_events.sort(key=lambda item: (item['sequence_start'] or 0, item['event'].name.lower()))
-        else:
-            parsed_events.sort(key=lambda item: (item['start'], item['event'].name.lower()))
+        self._update_lane_groups(lane_items, lane_tops, list(geometry.lane_heights), lane_colors, geometry.day_count)
+        self._grid_spec = (geometry.min_date, geometry.day_count, geometry.grid_height, geometry.axis_labels)
 
-        events_to_draw: List[Dict[str, Any]] = []
-        lane_event_map: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.current_min_date = geometry.min_date
+        self.current_day_count = geometry.day_count
 
-        for parsed in parsed_events:
-            event = parsed['event']
-            place_id = self._resolve_event_place(event, lane_map)
-            if place_id not in lane_map:
-                continue
-
-            if mode == "day_sequence":
-                start_offset = (parsed['sequence_start'] or 1) - 1  # Day 1 = offset 0
-                end_offset = (parsed['sequence_end'] or parsed['sequence_start'] or 1) - 1
-            else:
-                start_offset = (parsed['start'] - min_date).days
-                end_offset = max(start_offset, (parsed['end'] - min_date).days)
-
-            duration_days = max(1, end_offset - start_offset + 1)
-
-            participants: List[Any] = []
-            seen_participant_ids: Set[str] = set()
-            for c_id in event.participants:
-                if c_id in characters and c_id not in seen_participant_ids:
-                    participants.append(characters[c_id])
-                    seen_participant_ids.add(c_id)
-
-            info = {
-                'parsed': parsed,
-                'event': event,
-                'lane_id': place_id,
-                'lane_label': lane_labels.get(place_id, place_id),
-                'start_offset': start_offset,
-                'end_offset': end_offset,
-                'duration_days': duration_days,
-                'participants': participants,
-                'participant_names': [character.name for character in participants],
-                'is_point': parsed['is_point'],
-                'place_color': lane_colors.get(place_id),
-                'approx_width': max(self.DAY_WIDTH * 0.35, duration_days * self.DAY_WIDTH - 12),
-            }
-            events_to_draw.append(info)
-            lane_event_map[place_id].append(info)
-
-        for lane_id, lane_events in lane_event_map.items():
-            self.layout_manager.assign_columns(lane_events)
-
-        lane_heights, lane_tops, structural_height = self.layout_manager.lane_layout(lane_items, lane_event_map)
-        lane_height_map = {lane_id: lane_heights[idx] for idx, (lane_id, _) in enumerate(lane_items)}
-
-        total_width = self.LEFT_MARGIN + day_count * self.DAY_WIDTH + 300
-        total_height = structural_height + 40.0
-
-        width = total_width
-        height = total_height
-        viewport = view.viewport()
-        if viewport:
-            width = max(width, viewport.width() / max(self.zoom_level, 1e-3))
-            height = max(height, viewport.height() / max(self.zoom_level, 1e-3))
-        self.scene.setSceneRect(0, 0, width, height)
-
-        self._draw_place_lanes(lane_items, lane_tops, lane_heights, lane_colors, day_count, start_index=0)
-        self._draw_day_grid(min_date, day_count, structural_height, axis_labels=axis_labels)
-
-        char_points: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
-        char_bounds: Dict[str, List[Tuple[float, float, float, float]]] = defaultdict(list)
-        characters_with_event_blocks: Set[str] = set()
-
-        roster_reserved = 56.0
-
-        for info in events_to_draw:
-            lane_id = info['lane_id']
-            lane_top = lane_tops.get(lane_id, self.TOP_MARGIN)
-            lane_height = lane_height_map.get(lane_id, self.LANE_HEIGHT)
-            start_offset = info['start_offset']
-            duration_days = info['duration_days']
-            base_x = self.LEFT_MARGIN + start_offset * self.DAY_WIDTH + 6
-            base_width = max(self.DAY_WIDTH * 0.35, duration_days * self.DAY_WIDTH - 12)
-            width = base_width
-            x = base_x
-            if info['is_point']:
-                point_width = self.DAY_WIDTH * 0.35
-                width = min(width, point_width)
-                x = self.LEFT_MARGIN + start_offset * self.DAY_WIDTH + (self.DAY_WIDTH - width) / 2
-            approx_width = max(width, self.DAY_WIDTH * 0.35)
-
-            column = info.get('column', 0)
-            column_count = max(1, info.get('column_count', 1))
-            available_height = max(48.0, lane_height - 2 * self.LANE_PADDING - roster_reserved)
-            slot_height = available_height / column_count if column_count else available_height
-            desired_height = self.layout_manager.event_height(info['participants'], approx_width)
-            slot_height = max(slot_height, desired_height)
-            height = max(36.0, desired_height)
-            y = lane_top + self.LANE_PADDING + column * slot_height + (slot_height - height) / 2
-            max_y = lane_top + lane_height - roster_reserved - height - 10.0
-            y = min(y, max_y)
-
-            content_top = draw_event_block(
-                self.scene,
-                info['event'],
-                x,
-                y,
-                width,
-                height,
-                info['lane_label'],
-                info['participant_names'],
-                info.get('place_color'),
-                self._filtered_characters,
-            )
-
-            participants = info['participants']
-            if participants:
-                self._draw_event_participants(
-                    info['event'],
-                    participants,
-                    x,
-                    y,
-                    width,
-                    height,
-                    content_top,
-                    char_points,
-                    char_bounds,
-                    characters_with_event_blocks,
-                )
-
-        self.current_min_date = min_date
-        self.current_day_count = day_count
-
-        self._draw_character_paths(char_points, char_bounds, characters, characters_with_event_blocks)
+        self._update_character_paths(geometry, characters, dark_mode)
+        self._materialize(self._visible_scene_rect(view))
+        self.scene_graph.end_pass()
         if preserve_scroll and saved_scroll:
             h_bar = view.horizontalScrollBar()
             v_bar = view.verticalScrollBar()
             if h_bar and saved_scroll[0] is not None:
                 h_bar.setValue(saved_scroll[0])
-            if v_bar and saved_scroll[1] is not None:
+            if not geometry.events:
+                if v_bar and saved_v_fraction is not None and v_bar.maximum() > 0:
+                    v_bar.setValue(int(saved_v_fraction * v_bar.maximum()))
+            elif v_bar and saved_scroll[1] is not None:
                 v_bar.setValue(saved_scroll[1])
 
+    def set_shadow_min_zoom(self, zoom):
+        """Skip block and chip shadows below zoom (0 always paints them)"""
+        self.main_controller.shadow_min_zoom = max(0.0, float(zoom))
+        self.scene.update()
+
     def zoom_in(self):
         if self.navigation_manager:
             self.navigation_manager.zoom_in_view()
+            self.refresh_viewport()
 
     def zoom_out(self):
         if self.navigation_manager:
             self.navigation_manager.zoom_out_view()
+            self.refresh_viewport()
+
+    def reveal(self, kind, entity):
+        """Scroll to an event, the first block of a character or a place lane and flash it.
 
-    def _collect_events(self, mode):
-        return self.data_manager.get_events(mode)
+        Returns False when the entity is not on the timeline.
+        """
+        view = getattr(self.main_controller, "viewTimeline", None)
+        geometry = self.geometry
+        if not view or geometry is None:
+            return False
+        if kind == 'event':
+            position = geometry.position_of(entity.id)
+            if position is None:
+                return False
+            rect = QRectF(*geometry.rect(position))
+        elif kind == 'character':
+            positions = geometry.positions_of_character(entity.id)
+            if not positions:
+                return False
+            rect = QRectF(*geometry.rect(min(positions, key=lambda position: geometry.rects[position * 4])))
+        elif kind == 'place':
+            if entity.id not in geometry.lane_ids:
+                return False
+            lane = geometry.lane_ids.index(entity.id)
+            shown = view.mapToScene(view.viewport().rect()).boundingRect()
+            # keep the horizontal position, a lane is wider than the view
+            rect = QRectF(shown.left(), geometry.lane_tops[lane], shown.width(), geometry.lane_heights[lane])
+        else:
+            return False
+        view.centerOn(rect.center())
+        self.refresh_viewport()
+        self._flash(rect)
+        return True
 
-    def _parse_date(self, value):
-        return self.data_manager.parse_date(value)
+    def go_to(self, value):
+        """Scroll to a date (calendar) or day number (day sequence) and flash it.
 
-    def _extract_day_index(self, value):
-        return self.data_manager.extract_day_index(value)
+        An event starting on that day is revealed, otherwise the day column
+        is. Returns False when the day is outside the timeline.
+        """
+        view = getattr(self.main_controller, "viewTimeline", None)
+        geometry = self.geometry
+        if not view or geometry is None or geometry.min_date is None:
+            return False
+        mode = geometry.mode
+        if mode == "day_sequence":
+            offset = int(value) - 1  # Day 1 = offset 0
+        else:
+            if isinstance(value, datetime):
+                value = value.date()
+            offset = (value - geometry.min_date.date()).days
+        if not 0 <= offset < geometry.day_count:
+            return False
+
+        event = self.project.time_index.first_from(value, mode)
+        if event is not None:
+            _mode, start, _end = self.project.time_index.span_of(event)
+            if (start if mode == "day_sequence" else start.date()) == value and self.reveal('event', event):
+                return True
+        shown = view.mapToScene(view.viewport().rect()).boundingRect()
+        x = self.LEFT_MARGIN + offset * self.DAY_WIDTH
+        rect = QRectF(x, self.TOP_MARGIN - 30, self.DAY_WIDTH, max(0.0, geometry.grid_height - self.TOP_MARGIN + 30))
+        view.centerOn(rect.center().x(), shown.center().y())
+        self.refresh_viewport()
+        self._flash(rect)
+        return True
 
-    def _build_lane_order(self, parsed_events, places):
-        """Based on places and events"""
-        return self.layout_manager.build_lane_order(parsed_events, places)
+    def _flash(self, rect):
+        """Outline rect for a moment"""
+        if self._flash_item is not None:
+            try:
+                if self._flash_item.scene() is self.scene:
+                    self.scene.removeItem(self._flash_item)
+            except RuntimeError:
+                pass  # deleted with the scene contents
+        pen = QPen(QColor(self.FLASH_COLOR), 3, Qt.DashLine)
+        pen.setCosmetic(True)
+        item = QGraphicsRectItem(rect.adjusted(-4, -4, 4, 4))
+        item.setPen(pen)
+        item.setBrush(Qt.NoBrush)
+        item.setZValue(999)
+        item.setAcceptedMouseButtons(Qt.NoButton)
+        self.scene.addItem(item)
+        self._flash_item = item
+
+        def clear():
+            if self._flash_item is not item:
+                return
+            self._flash_item = None
+            try:
+                if item.scene() is self.scene:
+                    self.scene.removeItem(item)
+            except RuntimeError:
+                pass
+        QTimer.singleShot(self.FLASH_MS, clear)
 
     def _draw_place_lanes(self, lane_items: Iterable[Tuple[str, str]], lane_tops: Dict[str, float],
                           lane_heights: List[float], lane_colors: Dict[str, QColor],
@@ -413,8 +319,172 @@ class TimelineController:
         """Draw place lanes"""
         return self.renderer.draw_place_lanes(lane_items, lane_tops, lane_heights, lane_colors, day_count, start_index)
 
-    def _draw_day_grid(self, min_date, day_count, total_height, axis_labels= None):
-        return self.renderer.draw_day_grid(min_date, day_count, total_height, axis_labels)
+    def _update_lane_groups(self, lane_items, lane_tops, lane_heights, lane_colors, day_count):
+        """Draw each place lane as its own group so unchanged lanes are kept"""
+        lane_items = list(lane_items)
+        dark_mode = getattr(self.main_controller, "dark_mode_enabled", False)
+        scene_width = self.scene.sceneRect().width()
+        for index, (lane_id, label) in enumerate(lane_items):
+            color = lane_colors.get(lane_id)
+            signature = (
+                label, index, lane_tops.get(lane_id), lane_heights[index],
+                color.name() if color is not None else None,
+                day_count, scene_width, dark_mode,
+            )
+            self.scene_graph.update(
+                ('lane', lane_id),
+                signature,
+                lambda index=index: self._draw_place_lanes(
+                    lane_items[index:index + 1], lane_tops, lane_heights, lane_colors, day_count, start_index=index),
+            )
+
+    def _update_grid_groups(self, min_date, day_count, total_height, axis_labels=None, first=0, last=None):
+        """Draw one group per day column between first and last"""
+        dark_mode = getattr(self.main_controller, "dark_mode_enabled", False)
+        if last is None:
+            last = day_count
+        for index in range(max(0, first), min(day_count, last) + 1):
+            day_text = self.renderer.day_label(min_date, index, axis_labels) if index < day_count else None
+            self.scene_graph.update(
+                ('day', index),
+                (day_text, total_height, dark_mode),
+                lambda index=index, day_text=day_text: self.renderer.draw_day_column(index, day_text, total_height),
+            )
+
+    def _virtual_event(self, geometry, index, dark_mode):
+        """(key, signature, draw) of the event at index, built when it scrolls into view"""
+        event = geometry.events[index]
+        lane_id = geometry.lane_ids[geometry.event_lanes[index]]
+        participants = geometry.event_participants[index]
+        info = {
+            'event': event,
+            'lane_id': lane_id,
+            'lane_label': geometry.lane_labels[geometry.event_lanes[index]],
+            'participants': participants,
+            'participant_names': [character.name for character in participants],
+            'place_color': self._lane_colors.get(lane_id),
+        }
+        x, y, width, height = geometry.rect(index)
+        return (
+            ('event', event.id),
+            self._event_signature(info, x, y, width, height, dark_mode),
+            lambda: self._draw_event_group(info, x, y, width, height),
+        )
+
+    def _update_character_paths(self, geometry, characters, dark_mode):
+        char_points = {char_id: list(points) for char_id, points in geometry.char_points.items()}
+        self._update_path_groups(char_points, geometry.char_bounds, characters, geometry.characters_with_blocks, dark_mode)
+
+    def _event_signature(self, info, x, y, width, height, dark_mode):
+        """Everything the drawing of one event block depends on"""
+        event = info['event']
+        place_color = info.get('place_color')
+        participants = tuple(
+            (id(character), character.id, character.name, getattr(character, 'color', None))
+            for character in info['participants']
+        )
+        return (
+            id(event), event.name, getattr(event, 'start_date', None), getattr(event, 'end_date', None),
+            tuple(getattr(event, 'participants', [])),
+            x, y, width, height, info['lane_label'],
+            place_color.name() if place_color is not None else None,
+            participants, frozenset(self._filtered_characters), dark_mode,
+        )
+
+    def _draw_event_group(self, info, x, y, width, height):
+        """Draw one event with its participants"""
+        content_top = draw_event_block(
+            self.scene,
+            info['event'],
+            x,
+            y,
+            width,
+            height,
+            info['lane_label'],
+            info['participant_names'],
+            info.get('place_color'),
+            self._filtered_characters,
+        )
+        participants = info['participants']
+        if participants:
+            # path points were already collected by update_timeline
+            self._draw_event_participants(
+                info['event'], participants, x, y, width, height, content_top,
+                defaultdict(list), defaultdict(list), set(),
+            )
+
+    def refresh_viewport(self, *_args):
+        """Create items that scrolled or zoomed into view and drop the ones that left it"""
+        if self._in_update or not self.virtualize:
+            return
+        view = getattr(self.main_controller, "viewTimeline", None)
+        if not view or self._grid_spec is None:
+            return
+        visible = self._visible_scene_rect(view, margin=0)
+        if self._materialized_rect is not None and self._materialized_rect.contains(visible):
+            return
+        self._materialize(self._visible_scene_rect(view))
+
+    def _visible_scene_rect(self, view, margin=None):
+        """Scene area shown in the view plus a margin, or the whole scene when not virtualized"""
+        if not self.virtualize:
+            return self.scene.sceneRect()
+        if margin is None:
+            margin = self.VIEWPORT_MARGIN
+        viewport = view.viewport()
+        area = viewport.rect().adjusted(-margin, -margin, margin, margin)
+        return view.mapToScene(area).boundingRect()
+
+    def _materialize(self, rect):
+        """Make sure the day columns and events inside rect have items"""
+        self._materialized_rect = rect
+        graph = self.scene_graph
+        if self._grid_spec is not None:
+            min_date, day_count, total_height, axis_labels = self._grid_spec
+            first = int((rect.left() - self.LEFT_MARGIN) // self.DAY_WIDTH)
+            last = int((rect.right() - self.LEFT_MARGIN) // self.DAY_WIDTH) + 1
+            self._update_grid_groups(min_date, day_count, total_height, axis_labels, first, last)
+            for key in graph.keys('day'):
+                if not max(0, first) <= key[1] <= min(day_count, last):
+                    graph.remove(key)
+        geometry = self.geometry
+        if geometry is None:
+            return
+        dark_mode = self._pass_inputs[1]
+        # candidates come from the geometry's grid; only those and the events drawn before are visited
+        visible = geometry.events_in(rect.x(), rect.y(), rect.width(), rect.height())
+        wanted = set(visible)
+        materialized = self._materialized_events
+        for key, position in list(materialized.items()):
+            if position not in wanted:
+                graph.remove(key)
+                del materialized[key]
+        for position in visible:
+            key, signature, draw = self._virtual_event(geometry, position, dark_mode)
+            graph.update(key, signature, draw)
+            materialized[key] = position
+
+    def _update_path_groups(self, char_points, char_bounds, characters, characters_with_blocks, dark_mode):
+        """Draw the connecting paths of all characters as one group"""
+        filtered = frozenset(self._filtered_characters)
+        scene_right = self.scene.sceneRect().right()
+        signatures = []
+        for char_id, points in char_points.items():
+            character = characters.get(char_id)
+            if not character or not points:
+                continue
+            points.sort(key=lambda item: item[0])
+            bounds = char_bounds.get(char_id, [])
+            signatures.append((
+                id(character), character.name, getattr(character, 'color', None),
+                tuple(points), tuple(bounds), char_id in characters_with_blocks,
+                char_id in filtered, None if bounds else scene_right,
+            ))
+        self.scene_graph.update(
+            ('paths',),
+            (tuple(signatures), bool(filtered), dark_mode),
+            lambda: self._draw_character_paths(char_points, char_bounds, characters, characters_with_blocks),
+        )
 
     def _draw_event_participants(self, event, participants: List[Any], x: float, y: float,
                                  width: float, height: float, content_top: float,
@@ -432,33 +502,6 @@ class TimelineController:
                               characters_with_blocks: Set[str]):
         render_character_paths(self, char_points, char_bounds, characters, characters_with_blocks)
 
-    def _resolve_event_place(self, event, lane_map):
-        """which lane/place an event should be placed in"""
-        return self.event_manager.resolve_place(event, lane_map)
-
-    def _assign_parallel_columns(self, lane_events):
-        if not lane_events:
-            return
-
-        lane_events.sort(key=lambda item: (item['start_offset'], -(item['end_offset'] - item['start_offset'])))
-        columns_end: List[int] = []
-
-        for info in lane_events:
-            assigned = None
-            for index, last_end in enumerate(columns_end):
-                if info['start_offset'] > last_end:
-                    assigned = index
-                    columns_end[index] = info['end_offset']
-                    break
-            if assigned is None:
-                assigned = len(columns_end)
-                columns_end.append(info['end_offset'])
-            info['column'] = assigned
-
-        column_count = max(1, len(columns_end))
-        for info in lane_events:
-            info['column_count'] = column_count
-
     def handle_click(self, payload):
         """Handle graphics click events"""
         return self.click_handler.handle_click(payload)
@@ -488,12 +531,12 @@ class TimelineController:
         """Get character names in events at this place"""
         if not hasattr(self.project, 'events') or not hasattr(self.project, 'characters'):
             return []
-        char_ids = set()
-        for event in self.project.events:
-            if hasattr(event, 'associated_places') and place_id in getattr(event, 'associated_places', []):
-                char_ids.update(getattr(event, 'participants', []))
-        id_to_name = {char.id: char.name for char in self.project.characters}
-        return [id_to_name.get(cid, cid) for cid in char_ids]
+        char_ids = self.project.relations.characters_at_place(place_id)
+        names = []
+        for cid in char_ids:
+            character = self.project.characters.get(cid)
+            names.append(character.name if character else cid)
+        return names
 
     def _events_overlap(self, event1, event2):
         """Check event overlap via the main controller helper."""
@@ -502,19 +545,20 @@ class TimelineController:
             return overlap_checker(event1, event2)
         return True
 
-    def _required_event_height(self, participants, available_width):
-        base_height = 44.0
-        participants = list(participants or [])
-        if not participants:
-            return base_height + 8.0
-        measurements, _, _, _, _, _, block_spacing = self._measure_participant_blocks(participants, available_width)
-        blocks_height = sum(height for height, _ in measurements)
-        spacing = block_spacing * (len(measurements) - 1) if len(measurements) > 1 else 0.0
-        return base_height + blocks_height + spacing + 8.0
-
-    def _get_character_drop_target_event(self, char_rect):
-        """Get drop metadata for a dragged character graphic."""
-        return self.drag_drop_manager.get_drop_target(char_rect)
+    def _get_character_drop_target_event(self, scene_rect, source=None):
+        """Get drop metadata for a dragged character chip."""
+        return self.drag_drop_manager.get_drop_target(scene_rect, source)
+
+    def _preview_character_drop(self, scene_rect, source=None):
+        """Mark the drop target of a dragged character, or clear the mark for None"""
+        if scene_rect is None:
+            self.drag_drop_manager.clear_preview()
+        else:
+            self.drag_drop_manager.preview_drop(scene_rect, source)
+
+    def _refresh_after_character_drag(self):
+        self._preserve_next_view_position = True
+        self.navigation_manager.refresh_timeline()
 
 
     def _move_character_to_top_immediate(self, character, event):
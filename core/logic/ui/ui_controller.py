@@ -3,9 +3,10 @@ import re
 from PySide6.QtGui import QTextOption
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget, QGraphicsView,QTableWidget, QPushButton, 
+    QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget, QGraphicsView,QTableView, QPushButton, 
     QListWidget, QListWidgetItem, QFileDialog,QMessageBox, QLineEdit, QTextEdit,QComboBox
 )
+from core.utils import date_parser
 
 class UIController:
     """Manages UI"""
@@ -72,27 +73,21 @@ class UIController:
         #Places table
         places_table_widget = QWidget()
         places_layout = QVBoxLayout(places_table_widget)
-        self.main_controller.tablePlacesData = QTableWidget(0, 8)
-        self.main_controller.tablePlacesData.setHorizontalHeaderLabels(["ID", "Created", "Name", "Description", "Files", "Events", "Characters", "Notes"])
+        self.main_controller.tablePlacesData = QTableView()
         places_layout.addWidget(self.main_controller.tablePlacesData)
         self.main_controller.stackTables.addWidget(places_table_widget)
 
         #Characters table
         characters_table_widget = QWidget()
         characters_layout = QVBoxLayout(characters_table_widget)
-        self.main_controller.tableCharactersData = QTableWidget(0, 8)
-        self.main_controller.tableCharactersData.setHorizontalHeaderLabels(["ID", "Created", "Name", "Description", "Files", "Events", "Places", "Notes"])
+        self.main_controller.tableCharactersData = QTableView()
         characters_layout.addWidget(self.main_controller.tableCharactersData)
         self.main_controller.stackTables.addWidget(characters_table_widget)
 
         #Events table
         events_table_widget = QWidget()
         events_layout = QVBoxLayout(events_table_widget)
-        self.main_controller.tableEventsData = QTableWidget(0, 10)
-        self.main_controller.tableEventsData.setHorizontalHeaderLabels([
-            "ID", "Created", "Name", "Start Date", "End Date",
-            "Description", "Files", "Places", "Characters", "Notes"
-        ])
+        self.main_controller.tableEventsData = QTableView()
         events_layout.addWidget(self.main_controller.tableEventsData)
         self.main_controller.stackTables.addWidget(events_table_widget)
 
@@ -101,7 +96,11 @@ class UIController:
         self.main_controller.resize(1100, 700)
 
     def update_ui(self):
-        """Update UI elements"""
+        """Update UI elements, on the next event loop tick when a scheduler is available"""
+        scheduler = getattr(self.main_controller, 'refresh_scheduler', None)
+        if scheduler:
+            scheduler.request()
+            return
         self.main_controller._update_window_title()
         
         if hasattr(self.main_controller, 'tablePlacesData') and self.main_controller.tablePlacesData:
@@ -258,8 +257,7 @@ class UIController:
         if not date_string:
             return True, ""
         # Check for Day format
-        day_pattern = r'^Day\s+(\d+)$'
-        day_match = re.match(day_pattern, date_string, re.IGNORECASE)
+        day_match = date_parser.DAY_RE.match(date_string)
         if day_match:
             day_num = int(day_match.group(1))
             if day_num < 1:
@@ -269,12 +267,12 @@ class UIController:
             return True, ""
         # Check for date formats
         date_patterns = [
-            r'^(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})$',  # YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD
-            r'^(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})$',  # DD-MM-YYYY, DD/MM/YYYY, DD.MM.YYYY
-            r'^(\d{4})$',                              # Just year
+            date_parser.YMD_RE,   # YYYY-MM-DD, YYYY/MM/DD, YYYY.MM.DD
+            date_parser.DMY_RE,   # DD-MM-YYYY, DD/MM/YYYY, DD.MM.YYYY
+            date_parser.YEAR_RE,  # Just year
         ]
         for pattern in date_patterns:
-            match = re.match(pattern, date_string)
+            match = pattern.match(date_string)
             if match:
                 groups = match.groups()
                 # year format
@@ -284,7 +282,7 @@ class UIController:
                         return False, f"{field_name} year must be between 1 and 9999."
                     return True, ""
                 # Full format
-                if pattern.startswith(r'^(\d{4})'):  # YYYY-MM-DD format
+                if pattern is date_parser.YMD_RE:
                     year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
                 else:  # DD-MM-YYYY format
                     day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
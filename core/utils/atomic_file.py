@@ -0,0 +1,62 @@
+import os
+import tempfile
+
+
+def _current_umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# read once at import: setting the umask to read it is not safe while a
+# background save creates files on another thread
+_UMASK = _current_umask()
+
+
+def write_atomic(file_path, content, encoding="utf-8"):
+    """Write content to file_path so that readers see either the old or the new file.
+
+    The data goes to a temporary file in the same directory, is flushed to
+    disk with fsync and then renamed over the target, which is atomic on the
+    same file system. A crash part way leaves the previous file untouched.
+    """
+    if isinstance(content, str):
+        content = content.encode(encoding)
+    directory = os.path.dirname(os.path.abspath(file_path))
+    handle, temp_path = tempfile.mkstemp(
+        dir=directory, prefix="." + os.path.basename(file_path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        if os.path.exists(file_path):
+            os.chmod(temp_path, os.stat(file_path).st_mode & 0o777)
+        else:
+            # mkstemp creates 0600, give new files the mode open() would
+            os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    _sync_directory(directory)
+
+
+def _sync_directory(directory):
+    """Make the rename itself durable, where the platform allows it"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
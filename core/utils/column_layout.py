@@ -0,0 +1,46 @@
+import heapq
+
+
+def assign_columns(intervals):
+    """Partition closed (start, end) intervals into as few columns as possible.
+
+    Intervals are placed in order of start, longest first on ties, each in
+    the lowest numbered column that is free again, i.e. whose last interval
+    ended before this one starts. Busy columns sit in a min-heap by end and
+    free ones in a min-heap by number, so the pass is O(n log n).
+
+    Overlapping intervals form clusters that are laid out independently: a
+    cluster ends when every column is free again. Returns `(columns,
+    column_counts)` in input order, where column_counts holds the number of
+    columns of the cluster each interval belongs to.
+    """
+    count = len(intervals)
+    columns = [0] * count
+    column_counts = [1] * count
+    if not count:
+        return columns, column_counts
+
+    order = sorted(range(count), key=lambda i: (intervals[i][0], intervals[i][0] - intervals[i][1], i))
+    busy = []  # (end, column)
+    free = []  # column numbers
+    cluster = []
+    cluster_columns = 0
+    for index in order:
+        start, end = intervals[index]
+        while busy and busy[0][0] < start:
+            heapq.heappush(free, heapq.heappop(busy)[1])
+        if not busy and cluster:
+            # nothing overlaps any more, start numbering columns from zero
+            for member in cluster:
+                column_counts[member] = cluster_columns
+            cluster = []
+            cluster_columns = 0
+            free = []
+        column = heapq.heappop(free) if free else len(busy) + len(free)
+        heapq.heappush(busy, (max(start, end), column))
+        columns[index] = column
+        cluster.append(index)
+        cluster_columns = max(cluster_columns, column + 1)
+    for member in cluster:
+        column_counts[member] = cluster_columns
+    return columns, column_counts
@@ -0,0 +1,134 @@
+"""Date parsing shared by the data model, the timeline and the forms.
+
+Common shapes (YYYY-MM-DD, YYYY/MM/DD, YYYY-MM-DDTHH:MM[:SS] and Day N)
+are read by slicing the string instead of trying strptime formats one by
+one, so no exceptions are raised for valid input. Anything else falls back
+to datetime.fromisoformat; a UTC offset there is dropped, keeping the time
+as written, so every result is naive and can be compared with the others.
+Results are memoized because projects repeat the same dates a lot.
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+
+MEMO_SIZE = 8192
+
+# used by form validation, which accepts a few more shapes than the parser
+DAY_RE = re.compile(r'^Day\s+(\d+)$', re.IGNORECASE)
+YMD_RE = re.compile(r'^(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})$')
+DMY_RE = re.compile(r'^(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})$')
+YEAR_RE = re.compile(r'^(\d{4})$')
+
+_DIGITS = frozenset("0123456789")
+
+
+def parse_datetime(value):
+    """Date string to datetime, None if it cannot be read"""
+    if not isinstance(value, str):
+        return None
+    return _parse_datetime_text(value)
+
+
+def parse_date(value):
+    """Date string to date, None if it cannot be read"""
+    parsed = parse_datetime(value)
+    return parsed.date() if parsed is not None else None
+
+
+def parse_day_index(value):
+    """Day number from 'Day 3' or '3', None if there is none"""
+    if value is None:
+        return None
+    return _parse_day_text(str(value))
+
+
+def parse_many(values, parser=parse_datetime):
+    """Parse a whole column of values, each distinct value only once"""
+    seen = {}
+    results = []
+    for value in values:
+        try:
+            parsed = seen[value]
+        except KeyError:
+            parsed = seen[value] = parser(value)
+        except TypeError:
+            # unhashable values are simply parsed every time
+            parsed = parser(value)
+        results.append(parsed)
+    return results
+
+
+def clear_memo():
+    _parse_datetime_text.cache_clear()
+    _parse_day_text.cache_clear()
+
+
+def _is_digits(text):
+    return bool(text) and _DIGITS.issuperset(text)
+
+
+def _ymd(text):
+    """datetime from 'YYYY-MM-DD' or 'YYYY/MM/DD' (month and day may be one digit)"""
+    if len(text) == 10 and text[4] == text[7] and text[4] in '-/':
+        digits = text[0:4] + text[5:7] + text[8:10]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+        year, month, day = int(digits[0:4]), int(digits[4:6]), int(digits[6:8])
+    else:
+        separator = '-' if '-' in text else '/'
+        parts = text.split(separator)
+        if len(parts) != 3 or not all(_is_digits(part) for part in parts):
+            return None
+        if len(parts[0]) != 4 or len(parts[1]) > 2 or len(parts[2]) > 2:
+            return None
+        year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        # e.g. February 30th
+        return None
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _parse_datetime_text(value):
+    text = value.strip()
+    if not text:
+        return None
+
+    date_part, separator, time_part = text.partition('T')
+    if len(date_part) <= 10:
+        parsed = _ymd(date_part)
+        if parsed is not None:
+            if not separator:
+                return parsed
+            # HH:MM or HH:MM:SS
+            if len(time_part) in (5, 8) and time_part[2] == ':' and (len(time_part) == 5 or time_part[5] == ':'):
+                digits = time_part.replace(':', '')
+                if digits.isascii() and digits.isdigit():
+                    hour, minute = int(digits[0:2]), int(digits[2:4])
+                    second = int(digits[4:6]) if len(digits) == 6 else 0
+                    if hour < 24 and minute < 60 and second < 60:
+                        return parsed.replace(hour=hour, minute=minute, second=second)
+
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=None)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _parse_day_text(value):
+    text = value.strip()
+    if not text:
+        return None
+    if text[:3].lower() == "day":
+        digits = "".join(character for character in text if character.isdigit())
+        if digits:
+            return max(1, int(digits))
+    if text.isdigit():
+        return max(1, int(text))
+    return None
@@ -0,0 +1,191 @@
+from bisect import bisect_right
+from collections import defaultdict
+from core.data.event import Event
+
+
+class IntervalIndex:
+    """Closed intervals by key with fast overlap queries.
+
+    Intervals are kept sorted by start together with a max-end segment tree,
+    so a query only visits the branches that can still overlap. The sorted
+    arrays are rebuilt lazily on the first query after a change.
+    """
+
+    def __init__(self, intervals=()):
+        self._intervals = {}
+        self._dirty = True
+        self._starts = []
+        self._entries = []
+        self._tree = []
+        self._size = 0
+        for key, start, end in intervals:
+            self.add(key, start, end)
+
+    def add(self, key, start, end=None):
+        if end is None or end < start:
+            end = start
+        self._intervals[key] = (start, end)
+        self._dirty = True
+
+    def remove(self, key):
+        if self._intervals.pop(key, None) is not None:
+            self._dirty = True
+
+    def get(self, key):
+        return self._intervals.get(key)
+
+    def clear(self):
+        self._intervals.clear()
+        self._dirty = True
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def __contains__(self, key):
+        return key in self._intervals
+
+    def overlapping(self, start, end=None, exclude=()):
+        """Keys of all intervals that overlap [start, end], ordered by start"""
+        if end is None or end < start:
+            end = start
+        if self._dirty:
+            self._build()
+        count = bisect_right(self._starts, end)
+        if count == 0:
+            return []
+        found = []
+        tree = self._tree
+        size = self._size
+        stack = [(1, 0, size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= count or tree[node] is None or tree[node] < start:
+                continue
+            if node >= size:
+                key = self._entries[lo][2]
+                if key not in exclude:
+                    found.append((lo, key))
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        found.sort()
+        return [key for _index, key in found]
+
+    def first_overlap(self, start, end=None, exclude=()):
+        """Key of the earliest overlapping interval, or None"""
+        overlaps = self.overlapping(start, end, exclude)
+        return overlaps[0] if overlaps else None
+
+    def _build(self):
+        entries = sorted(
+            ((start, end, key) for key, (start, end) in self._intervals.items()),
+            key=lambda item: item[0],
+        )
+        size = 1
+        while size < len(entries):
+            size *= 2
+        tree = [None] * (2 * size)
+        for index, (_start, end, _key) in enumerate(entries):
+            tree[size + index] = end
+        for node in range(size - 1, 0, -1):
+            left, right = tree[2 * node], tree[2 * node + 1]
+            if left is None:
+                tree[node] = right
+            elif right is None or left >= right:
+                tree[node] = left
+            else:
+                tree[node] = right
+        self._entries = entries
+        self._starts = [entry[0] for entry in entries]
+        self._tree = tree
+        self._size = size
+        self._dirty = False
+
+
+class CharacterSchedule:
+    """Per character interval indexes of the events they take part in.
+
+    Indexes are built lazily from `character.associated_events` and dropped
+    when the project reports a change to the character or to one of its
+    events, or when the id list no longer matches the one indexed. Ranges
+    come from `time_range(event)` which returns (mode, start, end); events
+    of different modes never overlap.
+    """
+
+    def __init__(self, project, time_range):
+        self.project = project
+        self.time_range = time_range
+        self._indexes = {}
+        self._char_events = {}
+        self._event_chars = defaultdict(set)
+        project.add_listener(self._on_project_changed)
+
+    def detach(self):
+        """Stop listening to the project"""
+        self.project.remove_listener(self._on_project_changed)
+
+    def conflicts(self, character, mode, start, end=None, exclude=()):
+        """Events of character that overlap the given range"""
+        if start is None:
+            return []
+        index = self._index_for(character).get(mode)
+        if index is None:
+            return []
+        return self.project.events.get_many(index.overlapping(start, end, exclude))
+
+    def event_conflicts(self, character, event, exclude=()):
+        """Events of character that overlap event, the event itself excluded"""
+        mode, start, end = self.time_range(event)
+        exclude = set(exclude)
+        if getattr(event, 'id', None) is not None:
+            exclude.add(event.id)
+        return self.conflicts(character, mode, start, end, exclude)
+
+    def invalidate(self, character_id=None):
+        """Forget one character's index, or all of them"""
+        if character_id is None:
+            self._indexes.clear()
+            self._char_events.clear()
+            self._event_chars.clear()
+            return
+        self._indexes.pop(character_id, None)
+        for event_id in self._char_events.pop(character_id, ()):
+            self._event_chars[event_id].discard(character_id)
+
+    def _index_for(self, character):
+        event_ids = tuple(getattr(character, 'associated_events', None) or [])
+        indexes = self._indexes.get(character.id)
+        if indexes is not None:
+            # the list is sometimes edited in place, which the project does not see
+            if self._char_events.get(character.id) == event_ids:
+                return indexes
+            self.invalidate(character.id)
+        indexes = {}
+        for event_id in event_ids:
+            self._event_chars[event_id].add(character.id)
+            event = self.project.events.get(event_id)
+            if event is None:
+                continue
+            mode, start, end = self.time_range(event)
+            if start is None:
+                continue
+            indexes.setdefault(mode, IntervalIndex()).add(event_id, start, end)
+        self._indexes[character.id] = indexes
+        self._char_events[character.id] = event_ids
+        return indexes
+
+    def _on_project_changed(self, kind, entity, field, old_value):
+        if entity is None:
+            self.invalidate()
+        elif kind == 'character':
+            if field in (None, 'id', 'associated_events'):
+                self.invalidate(entity.id)
+                if field == 'id':
+                    self.invalidate(old_value)
+        elif kind == 'event':
+            if field is None or field == 'id' or field in Event.TIME_FIELDS:
+                event_ids = [entity.id, old_value] if field == 'id' else [entity.id]
+                for event_id in event_ids:
+                    for character_id in list(self._event_chars.get(event_id, ())):
+                        self.invalidate(character_id)
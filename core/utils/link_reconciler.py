@@ -0,0 +1,184 @@
+class LinkReport:
+    """What a reconcile pass changed, or would change in check-only mode"""
+
+    def __init__(self, check_only=False):
+        self.check_only = check_only
+        self.fixes = []      # (kind, entity_id, field, added_ids, removed_ids)
+        self.dangling = []   # (kind, entity_id, field, missing_id)
+
+    @property
+    def changed(self):
+        return bool(self.fixes)
+
+    def add_fix(self, kind, entity_id, field, old_ids, new_ids):
+        old_set = set(old_ids)
+        new_set = set(new_ids)
+        added = [item for item in new_ids if item not in old_set]
+        removed = [item for item in old_ids if item not in new_set]
+        self.fixes.append((kind, entity_id, field, added, removed))
+
+    def summary(self):
+        verb = "Would fix" if self.check_only else "Fixed"
+        if not self.fixes and not self.dangling:
+            return "All links are consistent."
+        lines = [f"{verb} {len(self.fixes)} link lists, {len(self.dangling)} references to missing entities."]
+        for kind, entity_id, field, added, removed in self.fixes:
+            lines.append(f"  {kind} {entity_id}.{field}: +{len(added)} -{len(removed)}")
+        for kind, entity_id, field, missing_id in self.dangling:
+            lines.append(f"  {kind} {entity_id}.{field}: unknown id {missing_id}")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.summary()
+
+
+class LinkReconciler:
+    """Keeps the character, event and place link lists consistent.
+
+    Event participants and event places are the source of truth for
+    `character.associated_events`, `character.associated_places` and
+    `place.associated_events`. Links added from the place dialog are kept
+    as long as the event still exists. `reconcile()` checks the whole
+    project in one pass over hash maps, the `sync_*` methods only touch
+    the entities involved in a single edit.
+    """
+
+    def __init__(self, project):
+        self.project = project
+
+    def reconcile(self, check_only=False):
+        """Rebuild every derived link list, returns a LinkReport"""
+        report = LinkReport(check_only)
+        project = self.project
+        characters = project.characters.mapping()
+        places = project.places.mapping()
+
+        # dicts keep insertion order and make the duplicate check O(1)
+        events_by_character = {character_id: {} for character_id in characters}
+        events_by_place = {place_id: {} for place_id in places}
+        places_by_event = {}
+        for event in project.events:
+            for character_id in self._ids(event, 'participants'):
+                linked = events_by_character.get(character_id)
+                if linked is None:
+                    report.dangling.append(('event', event.id, 'participants', character_id))
+                else:
+                    linked[event.id] = None
+            event_places = self._ids(event, 'associated_places')
+            places_by_event[event.id] = event_places
+            for place_id in event_places:
+                linked = events_by_place.get(place_id)
+                if linked is None:
+                    report.dangling.append(('event', event.id, 'associated_places', place_id))
+                else:
+                    linked[event.id] = None
+
+        for character_id, character in characters.items():
+            event_ids = list(events_by_character[character_id])
+            self._apply(report, 'character', character, 'associated_events', event_ids)
+            place_ids = self._places_of(event_ids, places_by_event)
+            self._apply(report, 'character', character, 'associated_places', place_ids)
+
+        for place_id, place in places.items():
+            linked = events_by_place[place_id]
+            manual = [
+                event_id for event_id in self._ids(place, 'associated_events')
+                if event_id in places_by_event and event_id not in linked
+            ]
+            self._apply(report, 'place', place, 'associated_events', list(linked) + manual)
+        return report
+
+    def sync_event(self, event, previous_participants=(), previous_places=()):
+        """Update the characters and places an edited event was or is linked to"""
+        self.sync_event_characters(event, previous_participants)
+        self.sync_event_places(event, previous_places)
+
+    def sync_event_characters(self, event, previous_participants=()):
+        participants = set(self._ids(event, 'participants'))
+        for character_id in participants | set(previous_participants or ()):
+            character = self.project.characters.get(character_id)
+            if character is None:
+                continue
+            event_ids = self._ids(character, 'associated_events')
+            if character_id in participants:
+                if event.id not in event_ids:
+                    character.associated_events = [event.id] + event_ids
+            elif event.id in event_ids:
+                character.associated_events = [eid for eid in event_ids if eid != event.id]
+            self.update_character_places(character)
+
+    def sync_event_places(self, event, previous_places=()):
+        event_places = set(self._ids(event, 'associated_places'))
+        for place_id in event_places | set(previous_places or ()):
+            place = self.project.places.get(place_id)
+            if place is None:
+                continue
+            event_ids = self._ids(place, 'associated_events')
+            if place_id in event_places:
+                if event.id not in event_ids:
+                    place.associated_events = [event.id] + event_ids
+            elif event.id in event_ids:
+                place.associated_events = [eid for eid in event_ids if eid != event.id]
+
+    def sync_character(self, character, previous_events=()):
+        """Add or remove character in the participants of its current and previous events"""
+        current = set(self._ids(character, 'associated_events'))
+        for event_id in current | set(previous_events or ()):
+            event = self.project.events.get(event_id)
+            if event is None:
+                continue
+            participants = self._ids(event, 'participants')
+            if event_id in current:
+                if character.id not in participants:
+                    event.participants = [character.id] + participants
+            elif character.id in participants:
+                event.participants = [cid for cid in participants if cid != character.id]
+
+    def character_places(self, character):
+        """Places of the character's events, in order of first appearance"""
+        places_by_event = {}
+        for event_id in self._ids(character, 'associated_events'):
+            event = self.project.events.get(event_id)
+            if event is not None:
+                places_by_event[event_id] = self._ids(event, 'associated_places')
+        return self._places_of(self._ids(character, 'associated_events'), places_by_event)
+
+    def update_character_places(self, character):
+        place_ids = self.character_places(character)
+        if place_ids != self._ids(character, 'associated_places'):
+            character.associated_places = place_ids
+
+    @staticmethod
+    def _ids(entity, field):
+        ids = getattr(entity, field, None)
+        return list(ids) if isinstance(ids, (list, tuple)) else []
+
+    @staticmethod
+    def _places_of(event_ids, places_by_event):
+        place_ids = []
+        seen = set()
+        for event_id in event_ids:
+            for place_id in places_by_event.get(event_id, ()):
+                if place_id not in seen:
+                    seen.add(place_id)
+                    place_ids.append(place_id)
+        return place_ids
+
+    @staticmethod
+    def _apply(report, kind, entity, field, ids):
+        """Set entity.field to ids, keeping the current order of the ids it already has"""
+        old_ids = getattr(entity, field, None)
+        if not isinstance(old_ids, list):
+            # never stored in the file, derived on load
+            if not report.check_only:
+                setattr(entity, field, list(ids))
+            return
+        wanted = set(ids)
+        kept = [item for item in old_ids if item in wanted]
+        kept_set = set(kept)
+        new_ids = kept + [item for item in ids if item not in kept_set]
+        if new_ids == old_ids:
+            return
+        report.add_fix(kind, entity.id, field, old_ids, new_ids)
+        if not report.check_only:
+            setattr(entity, field, new_ids)
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+
+class ByteSizeLRU:
+    """Least recently used cache bounded by the total size of its values.
+
+    Every entry is stored with its size in bytes; adding an entry evicts
+    the least recently used ones until the total fits in max_bytes again.
+    An entry larger than the whole budget is kept until the next put so a
+    caller can still use what it just stored.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._total = 0
+
+    @property
+    def total_bytes(self):
+        return self._total
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, size):
+        self.pop(key)
+        self._entries[key] = (value, size)
+        self._total += size
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            _key, (_value, evicted_size) = self._entries.popitem(last=False)
+            self._total -= evicted_size
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self._total -= entry[1]
+        return entry[0]
+
+    def clear(self):
+        self._entries.clear()
+        self._total = 0
+
+
+class CountLRU:
+    """Least recently used cache bounded by its number of entries"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,25 @@
+def simplify_polyline(coords, tolerance):
+    """Drop points of a flat [x0, y0, x1, y1, ...] polyline that are closer
+    than tolerance to the last point kept.
+
+    The first and last points are always kept, so the simplified line starts
+    and ends where the original does. One O(n) pass; meant for drawing at low
+    zoom, where points less than a pixel or two apart cannot be told apart.
+    """
+    count = len(coords) // 2
+    if count <= 2 or tolerance <= 0:
+        return list(coords[:count * 2])
+    limit = tolerance * tolerance
+    last_x, last_y = coords[0], coords[1]
+    result = [last_x, last_y]
+    for index in range(2, count * 2 - 2, 2):
+        x, y = coords[index], coords[index + 1]
+        dx = x - last_x
+        dy = y - last_y
+        if dx * dx + dy * dy >= limit:
+            result.append(x)
+            result.append(y)
+            last_x, last_y = x, y
+    result.append(coords[count * 2 - 2])
+    result.append(coords[count * 2 - 1])
+    return result
@@ -0,0 +1,75 @@
+from collections import defaultdict
+
+
+class GridIndex:
+    """Rectangles bucketed into a uniform grid for fast area queries.
+
+    Every rect is added to the cells it covers, so a query only looks at
+    the rects sharing a cell with the query area instead of all of them.
+    Keys can be anything hashable; rects are (x, y, width, height).
+    """
+
+    def __init__(self, cell_size=240.0):
+        self.cell_size = float(cell_size)
+        self._cells = defaultdict(list)
+        self._rects = {}
+
+    def _cell_range(self, x, y, width, height):
+        size = self.cell_size
+        return (
+            int(x // size), int((x + max(0.0, width)) // size),
+            int(y // size), int((y + max(0.0, height)) // size),
+        )
+
+    def insert(self, key, x, y, width, height):
+        if key in self._rects:
+            self.remove(key)
+        self._rects[key] = (x, y, width, height)
+        first_col, last_col, first_row, last_row = self._cell_range(x, y, width, height)
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                self._cells[(col, row)].append(key)
+
+    def remove(self, key):
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        first_col, last_col, first_row, last_row = self._cell_range(*rect)
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self._cells.get((col, row))
+                if cell is not None:
+                    cell.remove(key)
+                    if not cell:
+                        del self._cells[(col, row)]
+
+    def rect(self, key):
+        return self._rects.get(key)
+
+    def query(self, x, y, width, height):
+        """Keys whose rect intersects the given area, each once"""
+        found = []
+        seen = set()
+        right = x + width
+        bottom = y + height
+        first_col, last_col, first_row, last_row = self._cell_range(x, y, width, height)
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                for key in self._cells.get((col, row), ()):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    rect_x, rect_y, rect_width, rect_height = self._rects[key]
+                    if rect_x < right and x < rect_x + rect_width and rect_y < bottom and y < rect_y + rect_height:
+                        found.append(key)
+        return found
+
+    def clear(self):
+        self._cells.clear()
+        self._rects.clear()
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, key):
+        return key in self._rects
@@ -1,5 +1,7 @@
-from datetime import datetime
 from PySide6.QtWidgets import QMessageBox
+from core.data.event import Event
+from core.utils import date_parser
+from core.utils.link_reconciler import LinkReconciler
 
 class HelperController:
     """helper for controllers."""
@@ -28,7 +30,7 @@ class HelperController:
         if reply == QMessageBox.Yes:
             project_controller = getattr(self.main_controller, "project_controller", None)
             if project_controller and hasattr(project_controller, "save"):
-                return project_controller.save()
+                return project_controller.save(wait=True)
             return False
         if reply == QMessageBox.No:
             return True
@@ -66,17 +68,7 @@ class HelperController:
         if not project:
             character.associated_places = []
             return
-        associated_events = getattr(character, "associated_events", [])
-        place_ids = set()
-        for event_id in associated_events:
-            event = self._find_event_by_id(event_id)
-            if not event:
-                continue
-            event_places = getattr(event, "associated_places", [])
-            for place_id in event_places:
-                place_ids.add(place_id)
-
-        character.associated_places = list(place_ids)
+        LinkReconciler(project).update_character_places(character)
 
     def check_char_overlap(self, character, new_event):
         if not character or not new_event:
@@ -96,36 +88,17 @@ class HelperController:
         project = self.project
         if not project:
             return []
-        character_ids = set()
-        for event in project.events:
-            places = getattr(event, "associated_places", [])
-            if place_id in places:
-                participants = getattr(event, "participants", [])
-                for participant_id in participants:
-                    character_ids.add(participant_id)
-        return list(character_ids)
+        return project.relations.characters_at_place(place_id)
 
     def get_char_places(self, character):
         project = self.project
         if not project:
             return "—"
-        associated_events = getattr(character, "associated_events", [])
-        place_ids = set()
-
-        for event_id in associated_events:
-            event = self._find_event_by_id(event_id)
-            if not event:
-                continue
-            event_places = getattr(event, "associated_places", [])
-            for place_id in event_places:
-                place_ids.add(place_id)
-
+        # works from associated_events so dialogs can preview unsaved selections
+        place_ids = LinkReconciler(project).character_places(character)
         if not place_ids:
             return "—"
-        place_names = []
-        for place in project.places:
-            if place.id in place_ids:
-                place_names.append(place.name)
+        place_names = [place.name for place in project.places.get_many(place_ids)]
         if not place_names:
             return "—"
 
@@ -133,40 +106,12 @@ class HelperController:
 
     def next_day_index(self):
         project = self.project
-        if not project or not hasattr(project, "events"):
-            return 1
-        highest_index = 0
-        for event in project.events:
-            for attribute in ("day_index", "day_index_end"):
-                value = getattr(event, attribute, None)
-                number = self._parse_day_index(value)
-                if number is not None and number > highest_index:
-                    highest_index = number
-        if highest_index >= 1:
-            return highest_index + 1
-        else:
+        if not project or not hasattr(project, "aggregates"):
             return 1
+        return project.aggregates.next_day_index()
 
     def _parse_day_index(self, value):
-        if value is None:
-            return None
-        text = str(value).strip()
-        if not text:
-            return None
-        lowered = text.lower()
-        if lowered.startswith("day"):
-            digits = "".join(character for character in text if character.isdigit())
-            if digits:
-                try:
-                    return max(1, int(digits))
-                except ValueError:
-                    return None
-        if text.isdigit():
-            try:
-                return max(1, int(text))
-            except ValueError:
-                return None
-        return None
+        return date_parser.parse_day_index(value)
 
     @staticmethod
     def deduplicate_ids(id_list):
@@ -185,27 +130,7 @@ class HelperController:
 
     @staticmethod
     def parse_date(value):
-        if value is None:
-            return None
-        text = value.strip()
-        if not text:
-            return None
-
-        formats = [
-            "%Y-%m-%d",
-            "%Y/%m/%d",
-            "%Y-%m-%dT%H:%M",
-            "%Y-%m-%dT%H:%M:%S",
-        ]
-        for fmt in formats:
-            try:
-                return datetime.strptime(text, fmt).date()
-            except ValueError:
-                continue
-        try:
-            return datetime.fromisoformat(text).date()
-        except ValueError:
-            return None
+        return date_parser.parse_date(value)
 
     def _events_overlap(self, first_event, second_event):
         mode_a, start_a, end_a = self._event_time_range(first_event)
@@ -220,47 +145,16 @@ class HelperController:
         return False
 
     def _event_time_range(self, event):
-        mode = getattr(event, "timeline_mode", "calendar") or "calendar"
-
-        if mode == "day_sequence":
-            start = getattr(event, "day_index", None)
-            end = getattr(event, "day_index_end", None)
-            if start is None:
-                start_str = getattr(event, "start_date", "")
-                start = self._parse_day_index(start_str) if start_str else None
-            
-            if end is None:
-                end_str = getattr(event, "end_date", "")
-                end = self._parse_day_index(end_str) if end_str else None
-            if start is None:
-                return mode, None, None
-            try:
-                start = int(start)
-                if end is not None:
-                    end = int(end)
-            except (ValueError, TypeError):
-                return mode, None, None
-            
-            if end is None or end < start:
-                end = start
-            return mode, start, end
-
-        start_date = self.parse_date(getattr(event, "start_date", ""))
-        end_date = self.parse_date(getattr(event, "end_date", ""))
-        if start_date is None:
-            return mode, None, None
-        if end_date is None or end_date < start_date:
-            end_date = start_date
-        return mode, start_date, end_date
+        time_range = getattr(event, "time_range", None)
+        if callable(time_range):
+            return time_range()
+        return Event.range_of(event)
 
     def _find_event_by_id(self, event_id):
         project = self.project
         if not project:
             return None
-        for event in project.events:
-            if getattr(event, "id", None) == event_id:
-                return event
-        return None
+        return project.events.get(event_id)
 
 def resolve_event_names(data_manager, identifiers):
     return data_manager.event_names(identifiers)
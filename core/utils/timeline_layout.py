@@ -0,0 +1,588 @@
+from array import array
+from bisect import insort
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta
+from core.data.timeline_data import collect_events
+from core.utils.column_layout import assign_columns
+from core.utils.spatial_index import GridIndex
+
+NO_PLACE = "__NO_PLACE__"
+
+
+class TextMetrics:
+    """Text sizes the layout depends on, fixed values for running without Qt.
+
+    The Qt renderer passes metrics measured with the fonts it paints with,
+    so the layout matches the painted items exactly.
+    """
+
+    TITLE_HEIGHT = 24.0
+    HIGHLIGHT_TITLE_HEIGHT = 27.0
+    LINE_HEIGHT = 13.0
+
+    def title_height(self, highlight):
+        """Height of an event title, bigger for highlighted events"""
+        return self.HIGHLIGHT_TITLE_HEIGHT if highlight else self.TITLE_HEIGHT
+
+    def line_height(self, text):
+        """Height of one line of participant text"""
+        return self.LINE_HEIGHT if text else 0.0
+
+
+class TimelineGeometry:
+    """Result of one layout pass, plain lists and arrays without Qt objects.
+
+    Lanes are stored in display order, events in drawing order with their
+    rect as four consecutive values of `rects`. `char_points` and
+    `char_bounds` hold the anchor of every participant block per character,
+    which the character paths are drawn through; `block_centers` holds the
+    vertical centers of the participant blocks of each event, top to bottom.
+    """
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.min_date = None
+        self.day_count = 0
+        self.axis_labels = None
+        self.lane_ids = []
+        self.lane_labels = []
+        self.lane_tops = array('d')
+        self.lane_heights = array('d')
+        self.grid_height = 0.0
+        self.width = 0.0
+        self.height = 0.0
+        self.events = []
+        self.event_lanes = array('l')
+        self.event_participants = []
+        self.start_offsets = array('l')
+        self.end_offsets = array('l')
+        self.columns = array('l')
+        self.column_counts = array('l')
+        self.is_point = []
+        self.rects = array('d')
+        self.content_tops = array('d')
+        self.block_centers = []
+        self.char_points = {}
+        self.char_bounds = {}
+        self._event_index = None
+        self._positions = None
+        self._character_positions = None
+
+    @property
+    def event_count(self):
+        return len(self.events)
+
+    @property
+    def characters_with_blocks(self):
+        return set(self.char_points)
+
+    def rect(self, index):
+        """(x, y, width, height) of the event at index"""
+        offset = index * 4
+        return tuple(self.rects[offset:offset + 4])
+
+    def events_in(self, x, y, width, height):
+        """Positions of the events whose rect intersects the area, from a grid built on first use"""
+        if self._event_index is None:
+            index = GridIndex()
+            for position in range(len(self.events)):
+                index.insert(position, *self.rect(position))
+            self._event_index = index
+        return self._event_index.query(x, y, width, height)
+
+    def position_of(self, event_id):
+        """Drawing position of an event, or None when it is not on the timeline"""
+        if self._positions is None:
+            self._positions = {event.id: position for position, event in enumerate(self.events)}
+        return self._positions.get(event_id)
+
+    def positions_of_character(self, char_id):
+        """Drawing positions of the events a character has a block in, built on first use"""
+        if self._character_positions is None:
+            positions = defaultdict(list)
+            for position, participants in enumerate(self.event_participants):
+                for character in participants:
+                    positions[character.id].append(position)
+            self._character_positions = positions
+        return self._character_positions.get(char_id, [])
+
+    def lane_items(self):
+        return list(zip(self.lane_ids, self.lane_labels))
+
+    def lane_top_map(self):
+        return dict(zip(self.lane_ids, self.lane_tops))
+
+    def lane_height_map(self):
+        return dict(zip(self.lane_ids, self.lane_heights))
+
+
+def build_lane_order(events, places):
+    """(lane_id, label) pairs: places in reverse order, then unknown places, 'No Place' first if needed"""
+    lanes = [(place.id, place.name) for place in reversed(list(places.values()))]
+    lane_labels = dict(lanes)
+
+    has_no_place = False
+    for item in events:
+        assoc = getattr(item['event'], 'associated_places', None)
+        if not assoc:
+            has_no_place = True
+            continue
+        for place_id in assoc:
+            if place_id not in lane_labels:
+                lane_labels[place_id] = "Place " + str(place_id)
+                lanes.append((place_id, lane_labels[place_id]))
+
+    if not lanes or has_no_place:
+        lanes = [(NO_PLACE, "No Place")] + [lane for lane in lanes if lane[0] != NO_PLACE]
+    return lanes
+
+
+def event_height(participant_count):
+    """Height an event needs for its title and participant blocks"""
+    base_height = 44.0
+    if not participant_count:
+        return base_height + 8.0
+    spacing = 6.0 * (participant_count - 1)
+    return base_height + 28.0 * participant_count + spacing + 8.0
+
+
+def participant_slots(x, y, width, height, content_top, block_heights, block_spacing=2.0):
+    """(left, top, width, height) of each participant block inside an event"""
+    zone_top = max(content_top + 10.0, y + 30.0)
+    zone_bottom = y + height - 12.0
+    block_width = max(32.0, width - 16.0)
+    needed_height = sum(block_heights)
+    if len(block_heights) > 1:
+        needed_height += block_spacing * (len(block_heights) - 1)
+    if needed_height > (zone_bottom - zone_top):
+        zone_top = max(y + 24.0, zone_bottom - needed_height)
+
+    slots = []
+    current_top = zone_top
+    for block_height in block_heights:
+        slots.append((x + 8.0, current_top, block_width, block_height))
+        current_top += block_height + block_spacing
+    return slots
+
+
+class TimelineLayoutEngine:
+    """Computes timeline geometry from a project without touching Qt.
+
+    `layout()` collects the events for the mode, orders the lanes, assigns
+    overlap columns, sizes the lanes and places every event block and
+    participant anchor. The renderer only turns the resulting
+    TimelineGeometry into scene items.
+    """
+
+    MIN_LANE_HEIGHT = 160.0
+    ROSTER_RESERVED = 56.0
+    BLOCK_SPACING = 2.0
+    BLOCK_PADDING_Y = 6.0
+    EMPTY_DAY_COUNT = 10
+
+    def __init__(self, metrics=None, day_width=120, lane_height=120, left_margin=180,
+                 top_margin=80, lane_padding=20):
+        self.metrics = metrics or TextMetrics()
+        self.day_width = day_width
+        self.lane_height = lane_height
+        self.left_margin = left_margin
+        self.top_margin = top_margin
+        self.lane_padding = lane_padding
+
+    def layout(self, project, mode="calendar", filtered_characters=(), today=None):
+        geometry = TimelineGeometry(mode)
+        filtered = frozenset(filtered_characters or ())
+        today = today or datetime.today()
+        today = datetime(today.year, today.month, today.day)
+
+        parsed_events = collect_events(project, mode)
+        places = project.places.mapping()
+        lane_items = build_lane_order(parsed_events, places)
+        geometry.lane_ids = [lane_id for lane_id, _label in lane_items]
+        geometry.lane_labels = [label for _lane_id, label in lane_items]
+
+        if not parsed_events:
+            self._layout_empty(geometry, mode, today)
+            return geometry
+
+        bounds = None
+        ordered = self._indexed_order(project, parsed_events, mode)
+        if ordered is not None:
+            parsed_events = ordered
+            bounds = project.time_index.bounds(mode)
+        elif mode == "day_sequence":
+            parsed_events.sort(key=lambda item: (item['sequence_start'] or 0, item['event'].name.lower()))
+        else:
+            parsed_events.sort(key=lambda item: (item['start'], item['event'].name.lower()))
+
+        min_date, day_count, axis_labels = self._time_axis(parsed_events, mode, today, bounds)
+        geometry.min_date = min_date
+        geometry.day_count = day_count
+        geometry.axis_labels = axis_labels
+
+        characters = project.characters.mapping()
+        lane_index = {lane_id: index for index, lane_id in enumerate(geometry.lane_ids)}
+        lane_events = defaultdict(list)
+        placed = []
+        for parsed in parsed_events:
+            event = parsed['event']
+            place_id = NO_PLACE
+            for candidate in getattr(event, 'associated_places', []):
+                if candidate in lane_index:
+                    place_id = candidate
+                    break
+            if place_id not in lane_index:
+                continue
+            if mode == "day_sequence":
+                start_offset = (parsed['sequence_start'] or 1) - 1  # Day 1 = offset 0
+                end_offset = (parsed['sequence_end'] or parsed['sequence_start'] or 1) - 1
+            else:
+                start_offset = (parsed['start'] - min_date).days
+                end_offset = max(start_offset, (parsed['end'] - min_date).days)
+
+            participants = self._participants_of(event, characters)
+            entry = [event, lane_index[place_id], start_offset, end_offset, participants, parsed['is_point'], 0, 1]
+            placed.append(entry)
+            lane_events[place_id].append(entry)
+
+        # columns per lane, in the same start/longest-first order as before
+        for entries in lane_events.values():
+            entries.sort(key=lambda entry: (entry[2], -(entry[3] - entry[2])))
+            columns, column_counts = assign_columns([(entry[2], entry[3]) for entry in entries])
+            for entry, column, column_count in zip(entries, columns, column_counts):
+                entry[6] = column
+                entry[7] = column_count
+
+        lane_heights = [self.MIN_LANE_HEIGHT] * len(lane_items)
+        for entry in placed:
+            needed = self._needed_lane_height(len(entry[4]), entry[7])
+            if needed > lane_heights[entry[1]]:
+                lane_heights[entry[1]] = needed
+        structural_height = self._stack_lanes(geometry, lane_heights)
+        geometry.grid_height = structural_height
+        geometry.height = structural_height + 40.0
+        geometry.width = self.left_margin + day_count * self.day_width + 300
+
+        char_points = defaultdict(list)
+        char_bounds = defaultdict(list)
+        for event, lane, start_offset, end_offset, participants, is_point, column, column_count in placed:
+            x, y, width, height = self._event_rect(
+                geometry, lane, start_offset, end_offset, is_point, column, column_count, len(participants))
+            content_top = self._content_top(event, y, filtered)
+
+            geometry.events.append(event)
+            geometry.event_lanes.append(lane)
+            geometry.event_participants.append(participants)
+            geometry.start_offsets.append(start_offset)
+            geometry.end_offsets.append(end_offset)
+            geometry.columns.append(column)
+            geometry.column_counts.append(column_count)
+            geometry.is_point.append(is_point)
+            geometry.rects.extend((x, y, width, height))
+            geometry.content_tops.append(content_top)
+
+            anchors = self._participant_anchors(participants, x, y, width, height, content_top)
+            geometry.block_centers.append(tuple(center_y for _center_x, center_y in anchors))
+            bounds = (x + 4.0, x + width - 4.0, y + 4.0, y + height - 4.0)
+            for character, anchor in zip(participants, anchors):
+                char_points[character.id].append(anchor)
+                char_bounds[character.id].append(bounds)
+        geometry.char_points = dict(char_points)
+        geometry.char_bounds = dict(char_bounds)
+        return geometry
+
+    def update_participants(self, geometry, project, events, filtered_characters=()):
+        """Refresh the participant blocks of some events of a finished layout in place.
+
+        Only valid when nothing but the participant lists of these events
+        changed since the layout: dates, lanes and columns are kept, the
+        events are resized and the paths of the characters that joined or
+        left them are rebuilt. Returns False without touching geometry when
+        a lane would change height, the caller then lays out from scratch.
+        """
+        filtered = frozenset(filtered_characters or ())
+        characters = project.characters.mapping()
+        changes = []
+        shrinking_lanes = set()
+        for event in events:
+            position = geometry.position_of(event.id)
+            if position is None:
+                continue
+            old = geometry.event_participants[position]
+            new = self._participants_of(event, characters)
+            lane = geometry.event_lanes[position]
+            lane_height = geometry.lane_heights[lane]
+            column_count = geometry.column_counts[position]
+            old_needed = self._needed_lane_height(len(old), column_count)
+            needed = self._needed_lane_height(len(new), column_count)
+            if needed > lane_height:
+                return False
+            if needed < old_needed and old_needed >= lane_height and lane_height > self.MIN_LANE_HEIGHT:
+                shrinking_lanes.add(lane)
+            changes.append((position, old, new))
+        if shrinking_lanes:
+            # a lane keeps its height only if another of its events still needs it
+            counts = {position: len(new) for position, _old, new in changes}
+            tallest = dict.fromkeys(shrinking_lanes, self.MIN_LANE_HEIGHT)
+            for position, lane in enumerate(geometry.event_lanes):
+                if lane in tallest:
+                    count = counts.get(position, len(geometry.event_participants[position]))
+                    tallest[lane] = max(tallest[lane], self._needed_lane_height(count, geometry.column_counts[position]))
+            if any(height != geometry.lane_heights[lane] for lane, height in tallest.items()):
+                return False
+
+        touched = set()
+        for position, old, new in changes:
+            geometry.event_participants[position] = new
+            x, y, width, height = self._event_rect(
+                geometry, geometry.event_lanes[position], geometry.start_offsets[position],
+                geometry.end_offsets[position], geometry.is_point[position], geometry.columns[position],
+                geometry.column_counts[position], len(new))
+            geometry.rects[position * 4:position * 4 + 4] = array('d', (x, y, width, height))
+            geometry.content_tops[position] = self._content_top(geometry.events[position], y, filtered)
+            if geometry._event_index is not None:
+                geometry._event_index.insert(position, x, y, width, height)
+            old_ids = {character.id for character in old}
+            new_ids = {character.id for character in new}
+            if geometry._character_positions is not None:
+                for char_id in old_ids - new_ids:
+                    geometry._character_positions[char_id].remove(position)
+                for char_id in new_ids - old_ids:
+                    insort(geometry._character_positions[char_id], position)
+            touched |= old_ids | new_ids
+        if not touched:
+            return True
+
+        char_points = defaultdict(list)
+        char_bounds = defaultdict(list)
+        positions = {position for position, _old, _new in changes}
+        for char_id in touched:
+            positions.update(geometry.positions_of_character(char_id))
+        for position in sorted(positions):
+            participants = geometry.event_participants[position]
+            x, y, width, height = geometry.rect(position)
+            anchors = self._participant_anchors(participants, x, y, width, height, geometry.content_tops[position])
+            geometry.block_centers[position] = tuple(center_y for _center_x, center_y in anchors)
+            bounds = (x + 4.0, x + width - 4.0, y + 4.0, y + height - 4.0)
+            for character, anchor in zip(participants, anchors):
+                if character.id in touched:
+                    char_points[character.id].append(anchor)
+                    char_bounds[character.id].append(bounds)
+        for char_id in touched:
+            if char_id in char_points:
+                geometry.char_points[char_id] = char_points[char_id]
+                geometry.char_bounds[char_id] = char_bounds[char_id]
+            else:
+                geometry.char_points.pop(char_id, None)
+                geometry.char_bounds.pop(char_id, None)
+        return True
+
+    def _participants_of(self, event, characters):
+        """Known characters of an event in list order, each once"""
+        participants = []
+        seen = set()
+        for char_id in event.participants:
+            if char_id in characters and char_id not in seen:
+                participants.append(characters[char_id])
+                seen.add(char_id)
+        return participants
+
+    def _needed_lane_height(self, participant_count, column_count):
+        return 32.0 + event_height(participant_count) * max(1, column_count) + 56.0
+
+    def _content_top(self, event, y, filtered):
+        highlight = bool(filtered) and any(char_id in filtered for char_id in getattr(event, 'participants', []))
+        return y + 6 + self.metrics.title_height(highlight)
+
+    def _participant_anchors(self, participants, x, y, width, height, content_top):
+        """Center of every participant block of an event"""
+        if not participants:
+            return []
+        block_heights = [self.participant_block_height(character) for character in participants]
+        slots = participant_slots(x, y, width, height, content_top, block_heights, self.BLOCK_SPACING)
+        return [(left + block_width / 2.0, top + block_height / 2.0) for left, top, block_width, block_height in slots]
+
+    def participant_block_height(self, character):
+        return max(20.0, self.metrics.line_height(character.name) + 2 * self.BLOCK_PADDING_Y)
+
+    def _layout_empty(self, geometry, mode, today):
+        day_count = self.EMPTY_DAY_COUNT
+        geometry.min_date = today
+        geometry.day_count = day_count
+        if mode == "day_sequence":
+            geometry.axis_labels = [f"Day {index + 1}" for index in range(day_count)]
+        if not geometry.lane_ids:
+            geometry.lane_ids = [NO_PLACE]
+            geometry.lane_labels = ["No Place"]
+        lane_heights = [max(self.lane_height, self.MIN_LANE_HEIGHT)] * len(geometry.lane_ids)
+        total_height = self._stack_lanes(geometry, lane_heights)
+        geometry.grid_height = total_height
+        geometry.height = total_height
+        geometry.width = self.left_margin + day_count * self.day_width + 300
+
+    def _stack_lanes(self, geometry, lane_heights):
+        """Fill in lane tops and heights, returns the height of the lane area"""
+        current_top = self.top_margin
+        for lane_height in lane_heights:
+            geometry.lane_tops.append(current_top)
+            geometry.lane_heights.append(lane_height)
+            current_top += lane_height
+        return current_top + 120.0
+
+    @staticmethod
+    def _indexed_order(project, parsed_events, mode):
+        """parsed_events in the project's time index order, or None to sort them here"""
+        index = getattr(project, 'time_index', None)
+        if index is None:
+            return None
+        by_event = {id(item['event']): item for item in parsed_events}
+        ordered = [by_event.get(id(event)) for event in index.ordered(mode)]
+        if len(ordered) != len(parsed_events) or None in ordered:
+            return None
+        return ordered
+
+    def _time_axis(self, parsed_events, mode, today, bounds=None):
+        """(min_date, day_count, axis_labels) covering every event.
+
+        bounds is the (earliest start, latest end) of the events when
+        already known, e.g. from the project's time index.
+        """
+        if mode == "day_sequence":
+            if bounds is not None:
+                seq_min, seq_max = bounds
+            else:
+                values = []
+                for item in parsed_events:
+                    for value in (item['sequence_start'], item['sequence_end']):
+                        if value is not None:
+                            values.append(value)
+                seq_min = min(values) if values else 1
+                seq_max = max(values) if values else 1
+            day_count = max(1, seq_max - seq_min + 1)
+            axis_labels = [f"Day {seq_min + offset}" for offset in range(day_count)]
+            return today, day_count, axis_labels
+
+        if bounds is not None:
+            min_date, max_date = bounds
+            return min_date, max(1, (max_date - min_date).days + 1), None
+        valid_dates = []
+        for item in parsed_events:
+            if item['start'] is not None:
+                valid_dates.append(item['start'])
+            if item['end'] is not None:
+                valid_dates.append(item['end'])
+        if not valid_dates:
+            return today, 1, None
+        min_date = min(valid_dates)
+        max_date = max(valid_dates)
+        return min_date, max(1, (max_date - min_date).days + 1), None
+
+    def _event_rect(self, geometry, lane, start_offset, end_offset, is_point, column, column_count, participant_count):
+        day_width = self.day_width
+        duration_days = max(1, end_offset - start_offset + 1)
+        width = max(day_width * 0.35, duration_days * day_width - 12)
+        x = self.left_margin + start_offset * day_width + 6
+        if is_point:
+            width = min(width, day_width * 0.35)
+            x = self.left_margin + start_offset * day_width + (day_width - width) / 2
+
+        lane_top = geometry.lane_tops[lane]
+        lane_height = geometry.lane_heights[lane]
+        column_count = max(1, column_count)
+        available_height = max(48.0, lane_height - 2 * self.lane_padding - self.ROSTER_RESERVED)
+        desired_height = event_height(participant_count)
+        slot_height = max(available_height / column_count, desired_height)
+        height = max(36.0, desired_height)
+        y = lane_top + self.lane_padding + column * slot_height + (slot_height - height) / 2
+        max_y = lane_top + lane_height - self.ROSTER_RESERVED - height - 10.0
+        return x, min(y, max_y), width, height
+
+
+class LayoutCache:
+    """Remembers the last few layouts of a project.
+
+    Entries are keyed by the project revision and the layout inputs (mode,
+    focus filter and the current day), so redraws that change nothing the
+    layout depends on - theme toggles, zooming, switching a focus filter
+    back and forth - reuse the geometry instead of recomputing it.
+
+    The cache also listens to the project. When the only changes since the
+    last layout are reordered or moved participants (a character drag) or
+    character fields other than the name, the last geometry is patched with
+    `TimelineLayoutEngine.update_participants` instead of laid out again.
+    `last_update` then holds the positions of the patched events, so the
+    renderer can redraw just those; it is None after any other layout.
+    """
+
+    def __init__(self, engine, size=4):
+        self.engine = engine
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+        self.last_update = None
+        self._project = None
+        self._entries = OrderedDict()
+        self._base_revision = None
+        self._changed_events = {}
+        self._structural = True
+        self._restyled = False
+
+    def layout(self, project, mode="calendar", filtered_characters=(), today=None):
+        if project is not self._project:
+            self._watch(project)
+        today = today or datetime.today()
+        inputs = (mode, frozenset(filtered_characters or ()), today.date() if isinstance(today, datetime) else today)
+        key = (project.revision,) + inputs
+        geometry = self._entries.get(key)
+        self.last_update = None
+        if geometry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return geometry
+
+        if not self._structural:
+            base = self._entries.pop((self._base_revision,) + inputs, None)
+            changed = list(self._changed_events.values())
+            if base is not None and self.engine.update_participants(base, project, changed, inputs[1]):
+                geometry = base
+                self.updates += 1
+                if not self._restyled:
+                    positions = (geometry.position_of(event.id) for event in changed)
+                    self.last_update = tuple(sorted(position for position in positions if position is not None))
+        if geometry is None:
+            self.misses += 1
+            geometry = self.engine.layout(project, mode, inputs[1], today)
+        # collecting events normalizes their fields, which can bump the revision
+        self._entries[(project.revision,) + inputs] = geometry
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+        self._base_revision = project.revision
+        self._changed_events = {}
+        self._structural = False
+        self._restyled = False
+        return geometry
+
+    def clear(self):
+        self._watch(None)
+
+    def _watch(self, project):
+        if self._project is not None:
+            self._project.remove_listener(self._note_change)
+        self._project = project
+        self._entries.clear()
+        self._changed_events = {}
+        self._structural = True
+        self.last_update = None
+        if project is not None:
+            project.add_listener(self._note_change)
+
+    def _note_change(self, kind, entity, field, old_value):
+        if entity is None or field is None:
+            self._structural = True
+        elif kind == 'event' and field == 'participants':
+            self._changed_events[entity.id] = entity
+        elif kind == 'character' and field == 'color':
+            self._restyled = True  # same layout, but every block of the character looks different
+        elif kind != 'character' or field == 'name':
+            self._structural = True
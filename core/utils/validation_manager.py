@@ -1,36 +1,55 @@
 from PySide6.QtWidgets import QMessageBox
+from core.utils.interval_index import CharacterSchedule
 
 class TimelineValidationManager:
     """validation for timeline operations."""
 
     def __init__(self, timeline_controller):
         self.timeline_controller = timeline_controller
+        self._schedule = None
+
+    @property
+    def schedule(self):
+        """Character schedule for the current project"""
+        project = self.timeline_controller.project
+        if self._schedule is None or self._schedule.project is not project:
+            if self._schedule is not None:
+                self._schedule.detach()
+            self._schedule = CharacterSchedule(project, self._time_range)
+        return self._schedule
+
+    def _time_range(self, event):
+        helper = getattr(self.timeline_controller.main_controller, 'helper_controller', None)
+        if helper is None:
+            return getattr(event, 'timeline_mode', 'calendar'), None, None
+        return helper._event_time_range(event)
 
     def validate_char_events(self, selected_event_ids):
         """Validate that selected events don't overlap in time."""
         if not selected_event_ids or len(selected_event_ids) < 2:
             return True
-        events_by_id = {}
-        for event in self.timeline_controller.project.events:
-            events_by_id[event.id] = event
-
-        selected_events = []
-        for event_id in selected_event_ids:
-            if event_id in events_by_id:
-                selected_events.append(events_by_id[event_id])
-
-        event_count = len(selected_events)
-        for index in range(event_count):
-            first = selected_events[index]
-            for other_index in range(index + 1, event_count):
-                second = selected_events[other_index]
-                if self.timeline_controller._events_overlap(first, second):
+        selected_events = self.timeline_controller.project.events.get_many(selected_event_ids)
+
+        # sweep each mode by start, tracking the event that reaches furthest
+        by_mode = {}
+        for event in selected_events:
+            mode, start, end = self._time_range(event)
+            if start is not None:
+                by_mode.setdefault(mode, []).append((start, end, event))
+        for ranges in by_mode.values():
+            ranges.sort(key=lambda item: item[0])
+            furthest = None
+            for start, end, event in ranges:
+                if furthest is not None and start <= furthest[1]:
+                    first, second = furthest[2], event
                     QMessageBox.warning(
                         None,
                         'Event Overlap',
                         f'"{first.name}" and "{second.name}" overlap in time. Please pick events that do not occur simultaneously.'
                     )
                     return False
+                if furthest is None or end > furthest[1]:
+                    furthest = (start, end, event)
         return True
 
     def validate_events(self, selected_event_ids):
@@ -40,17 +59,7 @@ class TimelineValidationManager:
         """Check if character has overlapping events with the given event."""
         if not hasattr(character, 'associated_events'):
             return False
-        character_events = getattr(character, 'associated_events', [])
-        for event_id in character_events:
-            existing_event = None
-            for candidate in self.timeline_controller.project.events:
-                if candidate.id == event_id:
-                    existing_event = candidate
-                    break
-            if existing_event and existing_event.id != event.id:
-                if self.timeline_controller._events_overlap(existing_event, event):
-                    return True
-        return False
+        return bool(self.schedule.event_conflicts(character, event))
 
     def validate_event_chars(
         self,
@@ -75,33 +84,27 @@ class TimelineValidationManager:
         temp_event.day_index = day_index
         temp_event.day_index_end = day_index_end
         temp_event.id = event_id
+        mode, start, end = self._time_range(temp_event)
+        if start is None:
+            return True
+        exclude = {event_id} if event_id else ()
 
         for char_id in character_ids:
-            character = None
-            for candidate in self.timeline_controller.project.characters:
-                if candidate.id == char_id:
-                    character = candidate
-                    break
+            character = self.timeline_controller.project.characters.get(char_id)
             if not character or not hasattr(character, 'associated_events'):
                 continue
 
-            for existing_event_id in character.associated_events:
-                if event_id and existing_event_id == event_id:
-                    continue
-                existing_event = None
-                for event in self.timeline_controller.project.events:
-                    if event.id == existing_event_id:
-                        existing_event = event
-                        break
-                if existing_event and self.timeline_controller._events_overlap(temp_event, existing_event):
-                    QMessageBox.warning(
-                        None,
-                        'Character Conflict',
-                        f'Character "{character.name}" is already participating in event "{existing_event.name}" '
-                        f'which overlaps with "{event_name}".\n\n'
-                        f'Characters cannot participate in events that occur simultaneously.'
-                    )
-                    return False
+            conflicts = self.schedule.conflicts(character, mode, start, end, exclude)
+            if conflicts:
+                existing_event = conflicts[0]
+                QMessageBox.warning(
+                    None,
+                    'Character Conflict',
+                    f'Character "{character.name}" is already participating in event "{existing_event.name}" '
+                    f'which overlaps with "{event_name}".\n\n'
+                    f'Characters cannot participate in events that occur simultaneously.'
+                )
+                return False
         return True
 
     def validate_move(self, character, target_event, source_event=None):
@@ -114,33 +117,19 @@ class TimelineValidationManager:
                 print(f"Character {character.name} already exists in event {target_event.name}")
                 return False
             if hasattr(character, 'associated_events'):
-                character_event_ids = list(character.associated_events)
-
-                if target_event.id in character_event_ids:
-                    character_event_ids.remove(target_event.id)
+                exclude = {source_event.id} if source_event else ()
+                conflicts = self.schedule.event_conflicts(character, target_event, exclude)
 
-                if source_event and source_event.id in character_event_ids:
-                    character_event_ids.remove(source_event.id)
-
-                events_by_id = {}
-                for event in self.timeline_controller.project.events:
-                    events_by_id[event.id] = event
-
-                remaining_events = []
-                for event_id in character_event_ids:
-                    if event_id in events_by_id:
-                        remaining_events.append(events_by_id[event_id])
-
-                for existing_event in remaining_events:
-                    if self.timeline_controller._events_overlap(target_event, existing_event):
-                        QMessageBox.warning(
-                            None,
-                            'Event Overlap',
-                            f'Cannot move character "{character.name}" to "{target_event.name}".\n\n'
-                            f'"{target_event.name}" and "{existing_event.name}" overlap. '
-                            f'Characters cannot participate in events that occur simultaneously.'
-                        )
-                        return False
+                if conflicts:
+                    existing_event = conflicts[0]
+                    QMessageBox.warning(
+                        None,
+                        'Event Overlap',
+                        f'Cannot move character "{character.name}" to "{target_event.name}".\n\n'
+                        f'"{target_event.name}" and "{existing_event.name}" overlap. '
+                        f'Characters cannot participate in events that occur simultaneously.'
+                    )
+                    return False
             return True
         except Exception as error:
             print(f"Error validating character move: {error}")
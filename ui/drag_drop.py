@@ -1,102 +1,133 @@
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QCursor
+from ui.graphics.roster import ChipGhostItem
 
-def attach_char_drag(
-    char_rect,
-    *,
-    character,
-    source_event,
-    get_drop_target,
-    validate_move,
-    move_to_event,
-    move_within_event,
-    refresh,
-):
-    orig_press = char_rect.mousePressEvent
-    orig_release = char_rect.mouseReleaseEvent
-    drag_info = {
-        "dragging": False,
-        "start_pos": None,
-        "start_scene_pos": None,
-        "orig_pos": None,
-        "orig_label_pos": None,
-    }
-    
-    def on_press(event):
-        if orig_press:
-            orig_press(event)
-        if event.button() == Qt.LeftButton:
-            drag_info["dragging"] = True
-            drag_info["start_pos"] = event.pos()
-            drag_info["start_scene_pos"] = event.scenePos()
-            drag_info["orig_pos"] = char_rect.pos()
-            drag_info["orig_z"] = char_rect.zValue()
-            if hasattr(char_rect, "_character_label"):
-                drag_info["orig_label_pos"] = char_rect._character_label.pos()
-                drag_info["orig_label_z"] = char_rect._character_label.zValue()
-            char_rect.setCursor(QCursor(Qt.ClosedHandCursor))
-            char_rect.setZValue(1000)
-            if hasattr(char_rect, "_character_label"):
-                char_rect._character_label.setZValue(1001)
 
-    def on_release(event):
-        if event.button() == Qt.LeftButton and drag_info.get("dragging"):
-            drag_info["dragging"] = False
-            drag_info["start_scene_pos"] = None
-            char_rect.setCursor(QCursor(Qt.OpenHandCursor))
-            char_rect.setZValue(drag_info.get("orig_z", 0))
-            if hasattr(char_rect, "_character_label") and "orig_label_z" in drag_info:
-                char_rect._character_label.setZValue(drag_info["orig_label_z"])
+class CharacterDragController:
+    """Drags participant chips between and within events.
 
-            drop_target = get_drop_target(char_rect)
-            target_event = None
-            insert_index = None
-            if isinstance(drop_target, dict):
-                target_event = drop_target.get("event")
-                insert_index = drop_target.get("index")
-            else:
-                target_event = drop_target
-            moved = False
-            need_refresh = False
-            if target_event and target_event != source_event:
-                if validate_move(character, target_event, source_event):
-                    try:
-                        if move_to_event(character, source_event, target_event, insert_index):
-                            print(f"Moved {character.name} from {source_event.name} to {target_event.name}")
-                            moved = True
-                            need_refresh = True
-                    except Exception as error:
-                        print(f"Error moving character: {error}")
-                else:
-                    print(f"Cannot move {character.name} to {target_event.name} - not allowed")
-            elif target_event == source_event and target_event is not None:
+    One controller serves every roster item of a scene: a roster hands over
+    the pressed chip index and the mouse positions, the controller moves a
+    single ghost chip with the mouse and resolves the drop when the button
+    is released. `get_drop_target` and `preview` get the scene rect of the
+    dragged chip and the (character, source event) being dragged.
+    """
+
+    def __init__(
+        self,
+        scene,
+        *,
+        get_drop_target,
+        validate_move,
+        move_to_event,
+        move_within_event,
+        refresh,
+        preview=None,
+    ):
+        self.scene = scene
+        self.get_drop_target = get_drop_target
+        self.validate_move = validate_move
+        self.move_to_event = move_to_event
+        self.move_within_event = move_within_event
+        self.refresh = refresh
+        self.preview = preview
+        self._drag = None
+        self._ghost = None
+
+    def press(self, roster, index, scene_pos):
+        self.cancel()
+        chip = roster.chips[index]
+        self._drag = {
+            "roster": roster,
+            "chip": chip,
+            "source": (chip.character, roster.event),
+            "start_scene_pos": scene_pos,
+            "moved": False,
+        }
+        roster.setCursor(QCursor(Qt.ClosedHandCursor))
+
+    def move(self, scene_pos):
+        drag = self._drag
+        if drag is None:
+            return
+        if not drag["moved"]:
+            drag["moved"] = True
+            drag["roster"].set_dragged(drag["roster"].chips.index(drag["chip"]))
+            self._ghost_item().set_chip(drag["chip"], drag["roster"].font)
+        self._ghost.setPos(scene_pos - drag["start_scene_pos"])
+        if self.preview:
+            # show where the block would land while it is dragged
+            self.preview(self._dragged_rect(scene_pos), drag["source"])
+
+    def release(self, scene_pos):
+        drag = self._drag
+        if drag is None:
+            return
+        dragged_rect = self._dragged_rect(scene_pos)
+        self.cancel()
+        if not drag["moved"]:
+            return  # a click, not a drag
+        character, source_event = drag["source"]
+
+        drop_target = self.get_drop_target(dragged_rect, drag["source"])
+        target_event = None
+        insert_index = None
+        if isinstance(drop_target, dict):
+            target_event = drop_target.get("event")
+            insert_index = drop_target.get("index")
+        else:
+            target_event = drop_target
+        moved = False
+        if target_event and target_event != source_event:
+            if self.validate_move(character, target_event, source_event):
                 try:
-                    if move_within_event(character, source_event, insert_index):
-                        print(f"Reordered {character.name} in {source_event.name}")
+                    if self.move_to_event(character, source_event, target_event, insert_index):
+                        print(f"Moved {character.name} from {source_event.name} to {target_event.name}")
                         moved = True
-                        need_refresh = True
                 except Exception as error:
-                    print(f"Error reordering character: {error}")
-            if not moved:
-                char_rect.setPos(drag_info["orig_pos"])
-                if hasattr(char_rect, "_character_label") and drag_info.get("orig_label_pos"):
-                    char_rect._character_label.setPos(drag_info["orig_label_pos"])
-                print(f"Character {character.name} returned to original position")
-            if orig_release:
-                try:
-                    orig_release(event)
-                except RuntimeError as e:
-                    if 'already deleted' not in str(e):
-                        raise
-            if need_refresh:
-                refresh()
-            return
-        if orig_release:
+                    print(f"Error moving character: {error}")
+            else:
+                print(f"Cannot move {character.name} to {target_event.name} - not allowed")
+        elif target_event == source_event and target_event is not None:
             try:
-                orig_release(event)
-            except RuntimeError as e:
-                if 'already deleted' not in str(e):
-                    raise
+                if self.move_within_event(character, source_event, insert_index):
+                    print(f"Reordered {character.name} in {source_event.name}")
+                    moved = True
+            except Exception as error:
+                print(f"Error reordering character: {error}")
+        if moved:
+            self.refresh()
+        else:
+            print(f"Character {character.name} returned to original position")
 
-    char_rect.mousePressEvent = on_press
-    char_rect.mouseReleaseEvent = on_release
+    def cancel(self):
+        """Drop the current drag without moving anything"""
+        drag = self._drag
+        self._drag = None
+        if drag is None:
+            return
+        if self.preview:
+            self.preview(None)
+        try:
+            if self._ghost is not None:
+                self._ghost.set_chip(None, None)
+            drag["roster"].set_dragged(None)
+            drag["roster"].setCursor(QCursor(Qt.OpenHandCursor))
+        except RuntimeError:
+            pass  # the items were deleted with the scene contents
+
+    def _dragged_rect(self, scene_pos):
+        drag = self._drag
+        offset = scene_pos - drag["start_scene_pos"]
+        return drag["roster"].mapRectToScene(drag["chip"].rect).translated(offset)
+
+    def _ghost_item(self):
+        if self._ghost is not None:
+            try:
+                if self._ghost.scene() is self.scene:
+                    return self._ghost
+            except RuntimeError:
+                pass  # deleted with the scene contents
+        self._ghost = ChipGhostItem()
+        self.scene.addItem(self._ghost)
+        return self._ghost
@@ -0,0 +1,128 @@
+from PySide6.QtWidgets import (
+    QDialog, QHBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem, QPushButton, QVBoxLayout,
+)
+from core.data.search_index import field_text, tokenize
+
+KIND_LABELS = {'character': 'Character', 'event': 'Event', 'place': 'Place'}
+FIELD_LABELS = {
+    'aliases': 'Alias', 'description': 'Description', 'notes': 'Notes',
+    'location': 'Location', 'extra_fields': 'Field',
+}
+
+
+def snippet(text, words, width=60):
+    """Part of text around the first of words found in it"""
+    text = " ".join((text or "").split())
+    lowered = text.casefold()
+    start = 0
+    for word in words:
+        found = lowered.find(word)
+        if found >= 0:
+            start = max(0, found - width // 3)
+            break
+    part = text[start:start + width]
+    if start > 0:
+        part = "…" + part
+    if start + width < len(text):
+        part += "…"
+    return part
+
+
+class FindDialog(QDialog):
+    """Search box over all characters, events and places.
+
+    Results come from the project's SearchIndex and update while typing.
+    Enter or a double click shows the selected hit on the timeline; entities
+    that are not on the timeline are shown in their table instead.
+    """
+
+    RESULT_LIMIT = 50
+
+    def __init__(self, main_controller):
+        super().__init__(main_controller)
+        self.main_controller = main_controller
+        self._hits = []
+        self.setWindowTitle('Find')
+        self.resize(460, 420)
+
+        layout = QVBoxLayout(self)
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText('Search names, descriptions, notes…')
+        self.query_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.query_edit)
+        self.result_list = QListWidget()
+        layout.addWidget(self.result_list)
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        button_layout = QHBoxLayout()
+        self.timeline_btn = QPushButton('Show on Timeline')
+        self.table_btn = QPushButton('Show in Table')
+        close_btn = QPushButton('Close')
+        button_layout.addWidget(self.timeline_btn)
+        button_layout.addWidget(self.table_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        for button in (self.timeline_btn, self.table_btn, close_btn):
+            # Enter in the search box already opens the current hit
+            button.setAutoDefault(False)
+
+        self.query_edit.textChanged.connect(self.run_search)
+        self.query_edit.returnPressed.connect(lambda: self.show_current(in_table=False))
+        self.result_list.itemActivated.connect(lambda _item: self.show_current(in_table=False))
+        self.result_list.currentRowChanged.connect(self._update_buttons)
+        self.timeline_btn.clicked.connect(lambda: self.show_current(in_table=False))
+        self.table_btn.clicked.connect(lambda: self.show_current(in_table=True))
+        close_btn.clicked.connect(self.close)
+        self._update_buttons()
+
+    def open_search(self):
+        """Show the dialog with the query selected, ready for typing"""
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self.query_edit.setFocus()
+        self.query_edit.selectAll()
+        # the project may have been replaced or edited since the last search
+        self.run_search(self.query_edit.text())
+
+    def run_search(self, query):
+        project = getattr(self.main_controller, 'project', None)
+        self._hits = project.search(query, self.RESULT_LIMIT) if project is not None and query.strip() else []
+        words = tokenize(query)
+        self.result_list.clear()
+        for hit in self._hits:
+            text = f"{KIND_LABELS.get(hit.kind, hit.kind)}: {hit.entity.name or hit.entity.id}"
+            if hit.field != 'name':
+                label = FIELD_LABELS.get(hit.field, hit.field)
+                text += f"\n    {label}: {snippet(field_text(hit.entity, hit.field), words)}"
+            self.result_list.addItem(QListWidgetItem(text))
+        if self._hits:
+            self.result_list.setCurrentRow(0)
+        if not query.strip():
+            self.status_label.setText('')
+        elif not self._hits:
+            self.status_label.setText('No matches')
+        elif len(self._hits) >= self.RESULT_LIMIT:
+            self.status_label.setText(f'First {len(self._hits)} matches')
+        else:
+            self.status_label.setText(f'{len(self._hits)} match' + ('es' if len(self._hits) != 1 else ''))
+        self._update_buttons()
+
+    def current_hit(self):
+        row = self.result_list.currentRow()
+        return self._hits[row] if 0 <= row < len(self._hits) else None
+
+    def show_current(self, in_table=False):
+        hit = self.current_hit()
+        if hit is None:
+            return
+        navigation = getattr(self.main_controller, 'navigation_controller', None)
+        if navigation is not None:
+            navigation.show_entity(hit.kind, hit.entity, in_table=in_table)
+
+    def _update_buttons(self, *_args):
+        has_hit = self.current_hit() is not None
+        self.timeline_btn.setEnabled(has_hit)
+        self.table_btn.setEnabled(has_hit)
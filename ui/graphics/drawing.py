@@ -1,16 +1,46 @@
-from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsTextItem, QGraphicsDropShadowEffect, QGraphicsBlurEffect
+from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsTextItem
 from PySide6.QtGui import QBrush, QPen, QFont, QColor, QLinearGradient, QFontMetrics
 from PySide6.QtCore import Qt
+from ui.graphics.shadows import ShadowRectItem
+
+_title_heights = {}
+
+
+def _is_highlighted(event, filtered_chars):
+    if not filtered_chars:
+        return False
+    for char_id in getattr(event, 'participants', []):
+        if char_id in filtered_chars:
+            return True
+    return False
+
+
+def _title_font(highlight):
+    if highlight:
+        return QFont("Arial", 12, QFont.Bold)
+    return QFont("Arial", 10, QFont.Bold)
+
+
+def title_height(highlight, text=" "):
+    """Height of an event title item, measured once per font"""
+    height = _title_heights.get(highlight)
+    if height is None:
+        probe = QGraphicsTextItem(text or " ")
+        probe.setFont(_title_font(highlight))
+        height = probe.boundingRect().height()
+        _title_heights[highlight] = height
+    return height
+
+
+def event_content_top(event, y, filtered_chars=None):
+    """Where the content below the title starts, without drawing the block."""
+    highlight = _is_highlighted(event, filtered_chars)
+    return y + 6 + title_height(highlight, event.name)
+
 
 def draw_event_block(scene, event, x, y, width, height, place_name, participant_list, place_color, filtered_chars=None):
     """Draw event block on timeline scene."""
-    event_participants = getattr(event, 'participants', [])
-    highlight = False
-    if filtered_chars and event_participants:
-        for char_id in event_participants:
-            if char_id in filtered_chars:
-                highlight = True
-                break
+    highlight = _is_highlighted(event, filtered_chars)
     if place_color:
         base_color = place_color
     else:
@@ -21,7 +51,6 @@ def draw_event_block(scene, event, x, y, width, height, place_name, participant_
         pen_width = 4.0
         pen_color = QColor("#ff4500")
         opacity = 1.0
-        blur_radius = 0.0
         shadow_blur = 30.0
         shadow_color = QColor(255, 69, 0, 160)
         shadow_offset = (4, 8)
@@ -29,13 +58,11 @@ def draw_event_block(scene, event, x, y, width, height, place_name, participant_
         if filtered_chars:
             base_color = base_color.darker(220)
             opacity = 0.25
-            blur_radius = 0.0
             shadow_blur = 8.0
             shadow_color = QColor(0, 0, 0, 40)
             shadow_offset = (0, 2)
         else:
             opacity = 1.0
-            blur_radius = 0.0
             shadow_blur = 16.0
             shadow_color = QColor(0, 0, 0, 90)
             shadow_offset = (0, 4)
@@ -45,7 +72,7 @@ def draw_event_block(scene, event, x, y, width, height, place_name, participant_
     gradient = QLinearGradient(x, y, x, y + height)
     gradient.setColorAt(0.0, base_color.lighter(112))
     gradient.setColorAt(1.0, base_color)
-    rect = QGraphicsRectItem(x, y, width, height)
+    rect = ShadowRectItem(x, y, width, height)
     rect.setBrush(QBrush(gradient))
     pen = QPen(pen_color)
     pen.setWidthF(pen_width)
@@ -54,17 +81,7 @@ def draw_event_block(scene, event, x, y, width, height, place_name, participant_
     rect.setFlag(QGraphicsRectItem.ItemIsMovable, False)
     rect.setFlag(QGraphicsRectItem.ItemIsSelectable, True)
     rect.setOpacity(opacity)
-
-    if blur_radius > 0:
-        blur = QGraphicsBlurEffect()
-        blur.setBlurRadius(blur_radius)
-        rect.setGraphicsEffect(blur)
-    else:
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(shadow_blur)
-        shadow.setColor(shadow_color)
-        shadow.setOffset(shadow_offset[0], shadow_offset[1])
-        rect.setGraphicsEffect(shadow)
+    rect.set_shadow(shadow_blur, shadow_color, shadow_offset)
     tooltip = [event.name]
     if place_name:
         tooltip.append("Place: " + str(place_name))
@@ -77,11 +94,10 @@ def draw_event_block(scene, event, x, y, width, height, place_name, participant_
     rect.setToolTip("\n".join(tooltip))
     scene.addItem(rect)
 
+    title_font = _title_font(highlight)
     if highlight:
-        title_font = QFont("Arial", 12, QFont.Bold)
         text_color = QColor("#000000")
     else:
-        title_font = QFont("Arial", 10, QFont.Bold)
         if filtered_chars:
             text_color = QColor("#999999")
         else:
@@ -100,10 +116,6 @@ def draw_event_block(scene, event, x, y, width, height, place_name, participant_
     title_item.setPos(x + 6, y + 6)
     title_item.setData(0, {'kind': 'event', 'id': getattr(event, 'id', None)})
     title_item.setOpacity(opacity)
-    if blur_radius > 0:
-        blur_text = QGraphicsBlurEffect()
-        blur_text.setBlurRadius(blur_radius)
-        title_item.setGraphicsEffect(blur_text)
     scene.addItem(title_item)
     title_rect = title_item.boundingRect()
     return y + 6 + title_rect.height()
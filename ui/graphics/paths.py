@@ -0,0 +1,156 @@
+import math
+from array import array
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QFont, QFontMetrics, QPainterPath, QPen, QPolygonF
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+from core.utils.lru_cache import CountLRU
+from core.utils.polyline import simplify_polyline
+
+# pens by color and width, bounded so colors of a previous theme or project fall out
+PEN_LIMIT = 512
+_pens = CountLRU(PEN_LIMIT)
+_label_font = None
+_label_metrics = None
+
+
+def path_pen(color, width):
+    """Cosmetic round pen for a character path, shared between paths of the same color and width"""
+    key = (color.rgba(), width)
+    pen = _pens.get(key)
+    if pen is None:
+        pen = QPen(color, width)
+        pen.setCosmetic(True)
+        pen.setCapStyle(Qt.RoundCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        _pens.put(key, pen)
+    return pen
+
+
+def label_font():
+    """Font and metrics of the name labels under character paths, created once"""
+    global _label_font, _label_metrics
+    if _label_font is None:
+        _label_font = QFont("Arial", 9, QFont.Bold)
+        _label_metrics = QFontMetrics(_label_font)
+    return _label_font, _label_metrics
+
+
+class CharacterPathsItem(QGraphicsItem):
+    """Paints the connecting paths of all characters in one item.
+
+    Points of every path are stored back to back in one flat coordinate
+    buffer, `starts` gives the first point of each path. Only paths whose
+    bounds meet the exposed area are painted. The smooth curve of a path is
+    built the first time it is painted at full detail and kept; when zoomed
+    out below DETAIL_LOD the item draws a simplified polyline instead, with
+    points closer than SIMPLIFY_PIXELS on screen merged, and below
+    HAIRLINE_LOD with one pixel wide pens.
+    """
+
+    DETAIL_LOD = 0.5
+    HAIRLINE_LOD = 0.15
+    SIMPLIFY_PIXELS = 3.0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setZValue(-1)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.coords = array('d')
+        self.starts = array('l', [0])
+        self._styles = []
+        self._bounds = []
+        self._curves = {}
+        self._polylines = {}
+        self._rect = QRectF()
+
+    def set_paths(self, paths):
+        """Replace the painted paths by (points, color, width, opacity) entries, points sorted by x"""
+        self.prepareGeometryChange()
+        coords = array('d')
+        starts = array('l', [0])
+        styles = []
+        bounds = []
+        rect = QRectF()
+        for points, color, width, opacity in paths:
+            if len(points) < 2:
+                continue
+            xs = [point[0] for point in points]
+            ys = [point[1] for point in points]
+            for x, y in points:
+                coords.append(x)
+                coords.append(y)
+            starts.append(len(coords) // 2)
+            styles.append((path_pen(color, width), path_pen(color, 0), opacity))
+            # the curves stay inside the box of their points
+            path_rect = QRectF(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)).adjusted(-width, -width, width, width)
+            bounds.append(path_rect)
+            rect = rect.united(path_rect)
+        self.coords = coords
+        self.starts = starts
+        self._styles = styles
+        self._bounds = bounds
+        self._curves = {}
+        self._polylines = {}
+        self._rect = rect
+        self.update()
+
+    def path_count(self):
+        return len(self._styles)
+
+    def points(self, index):
+        first = self.starts[index] * 2
+        last = self.starts[index + 1] * 2
+        return self.coords[first:last]
+
+    def boundingRect(self):
+        return self._rect
+
+    def shape(self):
+        # paths are decoration, clicks go to the items below
+        return QPainterPath()
+
+    def paint(self, painter, option, widget=None):
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        exposed = option.exposedRect
+        tolerance = None
+        if lod < self.DETAIL_LOD:
+            # power of two buckets so a zoom step does not rebuild every polyline
+            tolerance = 2.0 ** math.ceil(math.log2(self.SIMPLIFY_PIXELS / max(lod, 1e-6)))
+        hairline = lod < self.HAIRLINE_LOD
+        base_opacity = painter.opacity()
+        painter.setBrush(Qt.NoBrush)
+        for index, (pen, thin_pen, opacity) in enumerate(self._styles):
+            if not exposed.intersects(self._bounds[index]):
+                continue
+            painter.setPen(thin_pen if hairline else pen)
+            painter.setOpacity(base_opacity * opacity)
+            if tolerance is None:
+                painter.drawPath(self._curve(index))
+            else:
+                painter.drawPolyline(self._polyline(index, tolerance))
+        painter.setOpacity(base_opacity)
+
+    def _curve(self, index):
+        path = self._curves.get(index)
+        if path is None:
+            coords = self.points(index)
+            path = QPainterPath()
+            x_prev, y_prev = coords[0], coords[1]
+            path.moveTo(x_prev, y_prev)
+            for offset in range(2, len(coords), 2):
+                x_curr, y_curr = coords[offset], coords[offset + 1]
+                mid_x = (x_prev + x_curr) / 2.0
+                path.cubicTo(mid_x, y_prev, mid_x, y_curr, x_curr, y_curr)
+                x_prev, y_prev = x_curr, y_curr
+            self._curves[index] = path
+        return path
+
+    def _polyline(self, index, tolerance):
+        key = (index, tolerance)
+        polygon = self._polylines.get(key)
+        if polygon is None:
+            coords = simplify_polyline(self.points(index), tolerance)
+            polygon = QPolygonF([QPointF(coords[offset], coords[offset + 1]) for offset in range(0, len(coords), 2)])
+            self._polylines[key] = polygon
+        return polygon
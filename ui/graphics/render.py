@@ -1,8 +1,7 @@
-from PySide6.QtGui import QBrush, QColor, QFont, QFontMetrics, QLinearGradient, QPainterPath, QPen
+from PySide6.QtGui import QBrush, QColor, QFont, QFontMetrics, QPainterPath, QPen
 from PySide6.QtWidgets import QGraphicsLineItem, QGraphicsPathItem, QGraphicsRectItem, QGraphicsTextItem
 from PySide6.QtCore import Qt
 from datetime import timedelta
-from ui.drag_drop import attach_char_drag
 
 class TimelineRenderer:
     """Handles all drawing for timeline"""
@@ -94,146 +93,39 @@ class TimelineRenderer:
             baseline.setPen(QPen(baseline_color))
             self.scene.addItem(baseline)
 
-    def draw_day_grid(self, min_date, day_count, total_height, axis_labels=None):
-        """Draw the vertical grid lines and day names on the timeline."""
+    def day_label(self, min_date, index, axis_labels=None):
+        """Text shown above the day column at index"""
+        if axis_labels is not None:
+            if index < len(axis_labels):
+                return axis_labels[index]
+            return "Day " + str(index + 1)
+        current_date = min_date + timedelta(days=index)
+        return current_date.strftime("%Y-%m-%d")
+
+    def draw_day_column(self, index, day_text, total_height):
+        """Draw one grid line and, if given, the day name to the right of it."""
         dark_mode = getattr(self.main_controller, "dark_mode_enabled", False)
         grid_color = QColor("#555555") if dark_mode else QColor("#dddddd")
         text_color = QColor("#cccccc") if dark_mode else QColor("#666666")
 
-        for i in range(day_count + 1):
-            x = self.LEFT_MARGIN + i * self.DAY_WIDTH
-            if i == 0:
-                line = QGraphicsLineItem(x - 20, self.TOP_MARGIN - 30, x - 20, total_height)
-            else:
-                line = QGraphicsLineItem(x, self.TOP_MARGIN - 30, x, total_height)
-            line.setPen(QPen(grid_color))
-            self.scene.addItem(line)
-
-            if i < day_count:
-                if axis_labels is not None:
-                    if i < len(axis_labels):
-                        day_text = axis_labels[i]
-                    else:
-                        day_text = "Day " + str(i + 1)
-                else:
-                    current_date = min_date + timedelta(days=i)
-                    day_text = current_date.strftime("%Y-%m-%d")
-
-                text_item = QGraphicsTextItem(day_text)
-                text_item.setDefaultTextColor(text_color)
-                font = QFont("Arial", 10)
-                text_item.setFont(font)
-                text_rect = text_item.boundingRect()
-                text_x = x + (self.DAY_WIDTH - text_rect.width()) / 2
-                text_y = self.TOP_MARGIN - 28
-                text_item.setPos(text_x, text_y)
-                self.scene.addItem(text_item)
-
-    def draw_participants(self, event, participants, x, y, width, height, event_color):
-        """Draws small colored boxes for each participant in event"""
-        participant_limit = 10
-        participants_to_show = []
-        for i in range(min(participant_limit, len(participants))):
-            participants_to_show.append(participants[i])
-        if len(participants) > participant_limit:
-            extra = len(participants) - participant_limit
-            participants_to_show.append("+" + str(extra) + " more")
-
-        if len(participants_to_show) > 0:
-            char_size = min(16, max(8, int(height // max(len(participants_to_show), 1) - 2)))
+        x = self.LEFT_MARGIN + index * self.DAY_WIDTH
+        if index == 0:
+            line = QGraphicsLineItem(x - 20, self.TOP_MARGIN - 30, x - 20, total_height)
         else:
-            char_size = 8
-        padding = 2
-        start_y = y + padding
-
-        for i in range(len(participants_to_show)):
-            p = participants_to_show[i]
-            char_y = start_y + i * (char_size + padding)
-            if char_y + char_size > y + height:
-                break
-
-            if isinstance(p, str) and p.startswith("+"):
-                text_item = QGraphicsTextItem(p)
-                text_item.setFont(QFont("Arial", max(6, char_size - 2)))
-                text_item.setDefaultTextColor(QColor("#666666"))
-                text_item.setPos(x + width + 4, char_y)
-                text_item.setData(0, {'kind': 'event_extra', 'event_id': event.id})
-                self.scene.addItem(text_item)
-                continue
-
-            char_color = self.timeline_controller.color_manager.safe_char_color(p)
-            char_rect = QGraphicsRectItem(x + width + 4, char_y, char_size, char_size)
-            char_rect.setBrush(QBrush(char_color))
-            char_rect.setPen(QPen(char_color.darker(120)))
-            char_rect.setData(0, {'kind': 'character', 'id': p.id, 'name': p.name})
-            self.scene.addItem(char_rect)
-
-            attach_char_drag(char_rect, p.id, p.name)
-
-            char_label_color = self.timeline_controller.color_manager.char_label_color(char_color, char_color)
-            label_text = QGraphicsTextItem(p.name[:8] + ("..." if len(p.name) > 8 else ""))
-            label_text.setFont(QFont("Arial", max(6, char_size - 2)))
-            label_text.setDefaultTextColor(char_label_color)
-            label_text.setPos(x + width + char_size + 8, char_y)
-            label_text.setData(0, {'kind': 'character', 'id': p.id, 'name': p.name})
-            self.scene.addItem(label_text)
+            line = QGraphicsLineItem(x, self.TOP_MARGIN - 30, x, total_height)
+        line.setPen(QPen(grid_color))
+        self.scene.addItem(line)
 
-    def draw_lane_characters(self, lane_items, lane_map, lane_tops, lane_heights):
-        """Draws characters in their places"""
-        characters_map = self.timeline_controller._characters_map
-        for character in characters_map.values():
-            if hasattr(character, 'associated_places'):
-                character_places = character.associated_places
-            else:
-                character_places = []
-            if not character_places:
-                continue
-            char_color = self.timeline_controller.color_manager.safe_char_color(character)
-            for place_id in character_places:
-                if place_id not in lane_map:
-                    continue
-                lane_index = lane_map[place_id]
-                y = lane_tops.get(place_id, self.TOP_MARGIN + lane_index * self.LANE_HEIGHT)
-                lane_height = lane_heights[lane_index]
-                # Count how many characters before this one in the same lane
-                count = 0
-                for c in characters_map.values():
-                    if hasattr(c, 'associated_places') and place_id in c.associated_places and c.id < character.id:
-                        count += 1
-                char_x = 30 + count * 20
-                char_y = y + lane_height - 30
-                char_size = 16
-                char_rect = QGraphicsRectItem(char_x, char_y, char_size, char_size)
-                char_rect.setBrush(QBrush(char_color))
-                char_rect.setPen(QPen(char_color.darker(120)))
-                char_rect.setData(0, {'kind': 'character', 'id': character.id, 'name': character.name})
-                self.scene.addItem(char_rect)
-                attach_char_drag(char_rect, character.id, character.name)
-
-    def draw_event_block(self, event, x, y, width, height, event_color, participants):
-        """Draws a block for an event, with title and participants"""
-        dark_mode = getattr(self.main_controller, "dark_mode_enabled", False)
-        rect = QGraphicsRectItem(x, y, width, height)
-        if not dark_mode:
-            gradient = QLinearGradient(0, 0, 0, height)
-            gradient.setColorAt(0, event_color.lighter(110))
-            gradient.setColorAt(1, event_color.darker(110))
-            rect.setBrush(QBrush(gradient))
-        else:
-            rect.setBrush(QBrush(event_color))
-        rect.setPen(QPen(event_color.darker(140), 1.5))
-        rect.setData(0, {'kind': 'event', 'id': event.id})
-        self.scene.addItem(rect)
-        title_text = event.name[:20] + ("..." if len(event.name) > 20 else "")
-        text_item = QGraphicsTextItem(title_text)
-        text_item.setFont(QFont("Arial", 10, QFont.Bold))
-        text_color = self.timeline_controller.color_manager.ensure_readable(QColor("#000000"), event_color, 4.5)
-        text_item.setDefaultTextColor(text_color)
-        text_item.setPos(x + 5, y + 5)
-        text_item.setData(0, {'kind': 'event', 'id': event.id})
-        self.scene.addItem(text_item)
-        if participants:
-            self.draw_participants(event, participants, x, y, width, height, event_color)
+        if day_text is not None:
+            text_item = QGraphicsTextItem(day_text)
+            text_item.setDefaultTextColor(text_color)
+            font = QFont("Arial", 10)
+            text_item.setFont(font)
+            text_rect = text_item.boundingRect()
+            text_x = x + (self.DAY_WIDTH - text_rect.width()) / 2
+            text_y = self.TOP_MARGIN - 28
+            text_item.setPos(text_x, text_y)
+            self.scene.addItem(text_item)
 
     def draw_char_paths(self, char_points, opacity=0.7):
         """Draws dashed paths for characters across events"""
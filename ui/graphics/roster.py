@@ -0,0 +1,198 @@
+from bisect import bisect_right
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QBrush, QCursor, QPainterPath, QPen, QStaticText
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+from core.utils.lru_cache import CountLRU
+from ui.graphics.shadows import paint_shadow, shadow_margin, shadow_min_zoom
+
+# below this zoom level chip names are too small to read and are not painted
+TEXT_MIN_ZOOM = 0.3
+
+# laid out chip names, bounded so renamed characters and old widths fall out
+STATIC_TEXT_LIMIT = 4096
+_static_texts = CountLRU(STATIC_TEXT_LIMIT)
+
+
+def chip_text(name, width, metrics):
+    """Name elided to width as a QStaticText, laid out once per name and width"""
+    key = (name, width)
+    text = _static_texts.get(key)
+    if text is None:
+        elided = metrics.elidedText(name, Qt.ElideRight, width) if width > 0 else name
+        text = QStaticText(elided)
+        text.setTextFormat(Qt.PlainText)
+        text.setPerformanceHint(QStaticText.AggressiveCaching)
+        _static_texts.put(key, text)
+    return text
+
+
+class RosterChip:
+    """One participant block of a roster: where it is and how it is painted"""
+
+    __slots__ = ('character', 'rect', 'brush', 'pen', 'text_pen', 'opacity', 'text', 'text_pos', 'shadow', 'tooltip')
+
+    def __init__(self, character, rect, brush, pen, text_pen, opacity, text, text_pos, shadow, tooltip):
+        self.character = character
+        self.rect = rect
+        self.brush = brush
+        self.pen = pen
+        self.text_pen = text_pen
+        self.opacity = opacity
+        self.text = text
+        self.text_pos = text_pos
+        self.shadow = shadow
+        self.tooltip = tooltip
+
+
+def paint_chip(painter, chip, font, zoom, opacity=1.0):
+    painter.setOpacity(opacity * chip.opacity)
+    painter.setPen(chip.pen)
+    painter.setBrush(chip.brush)
+    painter.drawRect(chip.rect)
+    if zoom >= TEXT_MIN_ZOOM:
+        painter.setFont(font)
+        painter.setPen(chip.text_pen)
+        painter.drawStaticText(chip.text_pos, chip.text)
+
+
+class ParticipantRosterItem(QGraphicsItem):
+    """Paints all participant blocks of one event in a single item.
+
+    Replaces a rect and a text item per participant. Chips are stacked top
+    to bottom, so the chip under a point is found by bisecting their tops.
+    Clicks and drags on a chip are handed to the shared `drag` controller
+    with the chip index; `data_at()` gives the payload the per participant
+    items used to carry in data(0).
+    """
+
+    def __init__(self, event, font, metrics, drag=None, parent=None):
+        super().__init__(parent)
+        self.event = event
+        self.font = font
+        self.metrics = metrics
+        self.drag = drag
+        self.chips = []
+        self._tops = []
+        self._rect = QRectF()
+        self._dragged = None
+        self.setAcceptHoverEvents(True)
+        self.setAcceptedMouseButtons(Qt.LeftButton)
+        self.setCursor(QCursor(Qt.OpenHandCursor))
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def add_chip(self, character, left, top, width, height, background, pen, text_color, opacity,
+                 text_width, padding_x, shadow=None, tooltip=None):
+        """Append a chip below the previous one; shadow is (blur, color, (dx, dy)) or None"""
+        self.prepareGeometryChange()
+        rect = QRectF(left, top, width, height)
+        text = chip_text(character.name, int(max(0.0, text_width)), self.metrics)
+        text_pos = QPointF(left + padding_x, top + max(0.0, (height - self.metrics.height()) / 2.0))
+        chip = RosterChip(
+            character, rect, QBrush(background), pen, QPen(text_color), opacity, text, text_pos, shadow, tooltip,
+        )
+        self.chips.append(chip)
+        self._tops.append(top)
+        bounds = rect.adjusted(-pen.widthF(), -pen.widthF(), pen.widthF(), pen.widthF())
+        if shadow is not None:
+            blur_radius, _color, (dx, dy) = shadow
+            margin = shadow_margin(blur_radius)
+            bounds = bounds.united(rect.translated(dx, dy).adjusted(-margin, -margin, margin, margin))
+        self._rect = self._rect.united(bounds)
+        return chip
+
+    def chip_at(self, pos):
+        """Index of the chip under pos in item coordinates, or None"""
+        index = bisect_right(self._tops, pos.y()) - 1
+        if index < 0 or not self.chips[index].rect.contains(pos):
+            return None
+        return index
+
+    def data_at(self, scene_pos):
+        """Item payload of the participant under scene_pos, or None"""
+        index = self.chip_at(self.mapFromScene(scene_pos))
+        if index is None:
+            return None
+        character = self.chips[index].character
+        return {'kind': 'character', 'id': character.id, 'character': character, 'event': self.event}
+
+    def set_dragged(self, index):
+        """Fade the chip being dragged, None to show it normally again"""
+        if index != self._dragged:
+            self._dragged = index
+            self.update()
+
+    def boundingRect(self):
+        return self._rect
+
+    def shape(self):
+        path = QPainterPath()
+        for chip in self.chips:
+            path.addRect(chip.rect)
+        return path
+
+    def paint(self, painter, option, widget=None):
+        zoom = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        exposed = option.exposedRect
+        base_opacity = painter.opacity()
+        if zoom >= shadow_min_zoom(self):
+            # shadows first so a glow never covers the chip above it
+            for chip in self.chips:
+                if chip.shadow is not None:
+                    blur_radius, color, offset = chip.shadow
+                    painter.setOpacity(base_opacity * chip.opacity)
+                    paint_shadow(painter, chip.rect, blur_radius, color, offset)
+        for index, chip in enumerate(self.chips):
+            if not exposed.intersects(chip.rect):
+                continue
+            opacity = base_opacity * (0.35 if index == self._dragged else 1.0)
+            paint_chip(painter, chip, self.font, zoom, opacity=opacity)
+        painter.setOpacity(base_opacity)
+
+    def hoverMoveEvent(self, event):
+        index = self.chip_at(event.pos())
+        tooltip = self.chips[index].tooltip if index is not None else None
+        self.setToolTip(tooltip or "")
+        super().hoverMoveEvent(event)
+
+    def mousePressEvent(self, event):
+        index = self.chip_at(event.pos())
+        if event.button() != Qt.LeftButton or index is None or self.drag is None:
+            event.ignore()
+            return
+        self.drag.press(self, index, event.scenePos())
+        event.accept()
+
+    def mouseMoveEvent(self, event):
+        if self.drag is not None:
+            self.drag.move(event.scenePos())
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self.drag is not None:
+            self.drag.release(event.scenePos())
+
+
+class ChipGhostItem(QGraphicsItem):
+    """Copy of a chip that follows the mouse while it is dragged"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setZValue(1000)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self._chip = None
+        self._font = None
+        self._rect = QRectF()
+
+    def set_chip(self, chip, font):
+        self.prepareGeometryChange()
+        self._chip = chip
+        self._font = font
+        self._rect = chip.rect.adjusted(-2.0, -2.0, 2.0, 2.0) if chip is not None else QRectF()
+
+    def boundingRect(self):
+        return self._rect
+
+    def paint(self, painter, option, widget=None):
+        if self._chip is None:
+            return
+        zoom = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        paint_chip(painter, self._chip, self._font, zoom, opacity=0.85)
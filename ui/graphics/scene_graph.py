@@ -0,0 +1,79 @@
+class RetainedSceneGraph:
+    """Keeps timeline items grouped by key and only rebuilds groups that changed.
+
+    Every group has a signature (a tuple of everything its drawing depends on).
+    During an update pass the controller calls `update(key, signature, draw)`;
+    if the stored signature matches, the existing items are kept and the
+    cached draw result is returned, otherwise the old items are removed and
+    `draw` runs again while the scene records the items it adds.
+    Groups that are not visited during a pass are removed in `end_pass`.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self._groups = {}
+        self._seen = set()
+        self.stats = {'built': 0, 'kept': 0, 'removed': 0}
+
+    def begin_pass(self):
+        self._seen = set()
+        self.stats = {'built': 0, 'kept': 0, 'removed': 0}
+
+    def update(self, key, signature, draw):
+        """Return draw result for key, drawing only if the signature changed"""
+        self._seen.add(key)
+        group = self._groups.get(key)
+        if group is not None and group[0] == signature:
+            self.stats['kept'] += 1
+            return group[2]
+
+        if group is not None:
+            self._remove_items(group[1])
+        items = []
+        self.scene.begin_capture(items)
+        try:
+            result = draw()
+        finally:
+            self.scene.end_capture()
+        self._groups[key] = (signature, items, result)
+        self.stats['built'] += 1
+        return result
+
+    def end_pass(self):
+        """Remove groups that were not part of this pass"""
+        for key in [key for key in self._groups if key not in self._seen]:
+            self.remove(key)
+
+    def remove(self, key):
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        self._remove_items(group[1])
+        self.stats['removed'] += 1
+
+    def keys(self, kind=None):
+        """Group keys, optionally only those whose first element is kind"""
+        if kind is None:
+            return list(self._groups)
+        return [key for key in self._groups if key[0] == kind]
+
+    def items_for(self, key):
+        group = self._groups.get(key)
+        return list(group[1]) if group else []
+
+    def clear(self):
+        """Forget every group and empty the scene"""
+        self._groups.clear()
+        self._seen = set()
+        self.scene.clear()
+
+    def __contains__(self, key):
+        return key in self._groups
+
+    def __len__(self):
+        return len(self._groups)
+
+    def _remove_items(self, items):
+        for item in items:
+            if item.scene() is self.scene:
+                self.scene.removeItem(item)
@@ -0,0 +1,133 @@
+import math
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsRectItem, QStyleOptionGraphicsItem
+
+# default zoom level below which shadows are not painted at all
+SHADOW_MIN_ZOOM = 0.35
+SIZE_BUCKET = 8
+
+_shadow_pixmaps = {}
+
+
+def _profile(length, margin, sigma):
+    """Alpha (0..1) across a blurred box of length pixels, with margin pixels on both sides"""
+    scale = 1.0 / (sigma * math.sqrt(2.0))
+    values = []
+    for index in range(length + 2 * margin):
+        position = index + 0.5 - margin
+        values.append(0.5 * (math.erf(position * scale) - math.erf((position - length) * scale)))
+    return values
+
+
+def _profile_image(values, horizontal):
+    image = QImage(len(values), 1, QImage.Format_ARGB32) if horizontal else QImage(1, len(values), QImage.Format_ARGB32)
+    for index, value in enumerate(values):
+        alpha = max(0, min(255, int(round(value * 255))))
+        if horizontal:
+            image.setPixelColor(index, 0, QColor(0, 0, 0, alpha))
+        else:
+            image.setPixelColor(0, index, QColor(0, 0, 0, alpha))
+    return image
+
+
+def shadow_min_zoom(item):
+    """Zoom below which item skips its shadow, set by its scene's shadow_min_zoom"""
+    return getattr(item.scene(), 'shadow_min_zoom', SHADOW_MIN_ZOOM)
+
+
+def shadow_margin(blur_radius):
+    return int(math.ceil(blur_radius))
+
+
+def shadow_pixmap(blur_radius, color, width, height):
+    """Pre-rendered shadow of a box, shared by every box of the same size bucket and color.
+
+    Box sizes are rounded up to SIZE_BUCKET and capped where the middle of
+    the shadow is flat anyway; larger boxes are drawn nine-slice from the
+    capped pixmap. Returns (pixmap, box_width, box_height, margin).
+    """
+    margin = shadow_margin(blur_radius)
+    cap = 4 * margin
+    box_width = min(cap, int(math.ceil(max(1.0, width) / SIZE_BUCKET)) * SIZE_BUCKET)
+    box_height = min(cap, int(math.ceil(max(1.0, height) / SIZE_BUCKET)) * SIZE_BUCKET)
+    key = (blur_radius, color.rgba(), box_width, box_height)
+    cached = _shadow_pixmaps.get(key)
+    if cached is not None:
+        return cached
+
+    sigma = max(0.5, blur_radius / 3.0)
+    image = QImage(box_width + 2 * margin, box_height + 2 * margin, QImage.Format_ARGB32_Premultiplied)
+    image.fill(color)
+    painter = QPainter(image)
+    # a blurred box is separable: alpha = color alpha * row profile * column profile
+    painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(QRectF(image.rect()), _profile_image(_profile(box_width, margin, sigma), True))
+    painter.drawImage(QRectF(image.rect()), _profile_image(_profile(box_height, margin, sigma), False))
+    painter.end()
+    cached = (QPixmap.fromImage(image), box_width, box_height, margin)
+    _shadow_pixmaps[key] = cached
+    return cached
+
+
+def _bands(box, size, margin, start, pixmap_size):
+    """(source start, source length, target start, target length) bands along one axis"""
+    target = size + 2 * margin
+    if size <= box:
+        return [(0, pixmap_size, start, target)]
+    edge = 2 * margin
+    return [
+        (0, edge, start, edge),
+        (edge, pixmap_size - 2 * edge, start + edge, target - 2 * edge),
+        (pixmap_size - edge, edge, start + target - edge, edge),
+    ]
+
+
+def paint_shadow(painter, rect, blur_radius, color, offset=(0, 0)):
+    """Paint the cached shadow of rect, moved by offset"""
+    if blur_radius <= 0 or color.alpha() == 0:
+        return
+    pixmap, box_width, box_height, margin = shadow_pixmap(blur_radius, color, rect.width(), rect.height())
+    left = rect.left() + offset[0] - margin
+    top = rect.top() + offset[1] - margin
+    columns = _bands(box_width, rect.width(), margin, left, pixmap.width())
+    rows = _bands(box_height, rect.height(), margin, top, pixmap.height())
+    for source_y, source_height, target_y, target_height in rows:
+        for source_x, source_width, target_x, target_width in columns:
+            painter.drawPixmap(
+                QRectF(target_x, target_y, target_width, target_height),
+                pixmap,
+                QRectF(source_x, source_y, source_width, source_height),
+            )
+
+
+class ShadowRectItem(QGraphicsRectItem):
+    """Rect item that paints its own drop shadow from the shared pixmap cache.
+
+    Replaces a QGraphicsDropShadowEffect, which blurs the item offscreen on
+    every repaint. Below the scene's shadow_min_zoom the shadow is skipped.
+    """
+
+    def __init__(self, x, y, width, height, parent=None):
+        super().__init__(x, y, width, height, parent)
+        self._shadow = None
+
+    def set_shadow(self, blur_radius, color, offset=(0, 0)):
+        self.prepareGeometryChange()
+        self._shadow = (float(blur_radius), QColor(color), (float(offset[0]), float(offset[1])))
+
+    def boundingRect(self):
+        bounds = super().boundingRect()
+        if self._shadow is None:
+            return bounds
+        blur_radius, _color, (dx, dy) = self._shadow
+        margin = shadow_margin(blur_radius)
+        return bounds.united(self.rect().translated(dx, dy).adjusted(-margin, -margin, margin, margin))
+
+    def paint(self, painter, option, widget=None):
+        if self._shadow is not None:
+            zoom = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+            if zoom >= shadow_min_zoom(self):
+                blur_radius, color, offset = self._shadow
+                paint_shadow(painter, self.rect(), blur_radius, color, offset)
+        super().paint(painter, option, widget)
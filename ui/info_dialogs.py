@@ -1,14 +1,24 @@
 import os
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QColor, QPixmap
 from PySide6.QtWidgets import QDialog,QDialogButtonBox,QFormLayout,QHBoxLayout,QLabel,QVBoxLayout,QWidget
+from core.logic.thumbnail_cache import ThumbnailCache
 
 class TimelineInfoDialogs:
     """Shows information dialogs for timeline objects"""
 
+    THUMBNAIL_SIZE = QSize(60, 60)
+
     def __init__(self, timeline_controller):
         self.timeline_controller = timeline_controller
         self.main_controller = timeline_controller.main_controller
+        self._thumbnails = None
+
+    @property
+    def thumbnails(self):
+        if self._thumbnails is None:
+            self._thumbnails = getattr(self.main_controller, 'thumbnail_cache', None) or ThumbnailCache()
+        return self._thumbnails
 
     def show_event(self, event):
         places = self.timeline_controller.data_manager.get_place_names(getattr(event, 'associated_places', []))
@@ -106,6 +116,8 @@ class TimelineInfoDialogs:
         dialog.exec()
 
     def image_preview(self, paths):
+        thumbnails = self.thumbnails
+        size = self.THUMBNAIL_SIZE
         valid_paths = []
         for path in paths:
             if path and os.path.exists(path):
@@ -117,7 +129,17 @@ class TimelineInfoDialogs:
             def __init__(self, image_path, parent=None):
                 super().__init__(parent)
                 self.image_path = image_path
-                
+
+            def on_thumbnail_ready(self, path):
+                # placeholder until the thumbnail is decoded, hidden if it cannot be
+                if path != os.path.abspath(self.image_path):
+                    return
+                thumb = thumbnails.cached(self.image_path, size)
+                if thumb is None:
+                    self.hide()
+                else:
+                    self.setPixmap(thumb)
+
             def mousePressEvent(self, event):
                 self.show_image_dialog()
 
@@ -141,11 +163,12 @@ class TimelineInfoDialogs:
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
         for path in valid_paths[:3]:
-            pixmap = QPixmap(path)
-            if not pixmap.isNull():
-                thumb = pixmap.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            thumb = thumbnails.thumbnail(path, size)
+            if thumb is not None:
                 label = SimpleImageLabel(path)
                 label.setPixmap(thumb)
+                label.setAlignment(Qt.AlignCenter)
+                thumbnails.thumbnail_ready.connect(label.on_thumbnail_ready)
                 label.setFixedSize(64, 64)
                 label.setStyleSheet("border: 1px solid #ccc; padding: 2px;")
                 label.setToolTip(f"Click to view: {os.path.basename(path)}")
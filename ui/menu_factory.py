@@ -49,6 +49,10 @@ def create_basic_menus(main):
     edit_menu.addSeparator()
     main.actionEditProjectName = QAction("Project Name", main)
     edit_menu.addAction(main.actionEditProjectName)
+    edit_menu.addSeparator()
+    main.actionFind_Ctrl_F = QAction("Find...", main)
+    main.actionFind_Ctrl_F.setShortcut("Ctrl+F")
+    edit_menu.addAction(main.actionFind_Ctrl_F)
     #View
     view_menu = menubar.addMenu("View")
     main.actionEvents = QAction("Events", main)
@@ -58,6 +62,14 @@ def create_basic_menus(main):
     view_menu.addAction(main.actionPlaces)
     view_menu.addAction(main.actionCharacters)
     view_menu.addSeparator()
+    main.actionGoToDate = QAction("Go to Date...", main)
+    main.actionGoToDate.setShortcut("Ctrl+G")
+    main.actionGoToToday = QAction("Today / Day 1", main)
+    view_menu.addAction(main.actionGoToDate)
+    view_menu.addAction(main.actionGoToToday)
+    view_menu.addSeparator()
+    main.actionShadowZoom = QAction("Shadow Zoom Level...", main)
+    view_menu.addAction(main.actionShadowZoom)
     #Filter
     filter_menu = menubar.addMenu("Filter")
     main.actionFilterCharacters = QAction("Characters", main)
@@ -27,6 +27,34 @@ class NavigationController:
         if hasattr(self.main, 'stackTables'):
             self.main.stackTables.setCurrentIndex(2)
 
+    def show_entity(self, kind, entity, in_table=False):
+        """Bring a character, event or place into view.
+
+        Scrolls the timeline to it, or selects its table row when in_table is
+        set or it is not on the timeline. Returns True if it was found.
+        """
+        timeline = getattr(self.main, 'timeline_controller', None)
+        if not in_table and timeline:
+            self.show_timeline()
+            if timeline.reveal(kind, entity):
+                return True
+        tables = getattr(self.main, 'table_controller', None)
+        if not tables:
+            return False
+        show_table = {'place': self.show_places, 'character': self.show_chars, 'event': self.show_events}.get(kind)
+        if show_table is None:
+            return False
+        show_table()
+        return tables.reveal(kind, entity)
+
+    def go_to(self, value):
+        """Show the timeline at a date or day number, False when it is outside"""
+        timeline = getattr(self.main, 'timeline_controller', None)
+        if not timeline:
+            return False
+        self.show_timeline()
+        return timeline.go_to(value)
+
     def zoom_in(self):
         if hasattr(self.main, 'timeline_controller'):
             self.main.timeline_controller.zoom_in()
@@ -51,28 +79,37 @@ class NavigationController:
         """Set display mode"""
         if mode in ['calendar', 'day_sequence']:
             self.main.timeline_mode = mode
-            if hasattr(self.main, 'timeline_controller'):
-                self.main.timeline_controller.update_timeline()
+            self._refresh('timeline')
 
     def switch_mode(self):
         """switch between span and point display"""
         current = getattr(self.main, 'timeline_display_mode', 'span')
         new = 'point' if current == 'span' else 'span'
         self.main.timeline_display_mode = new
-
-        if hasattr(self.main, 'timeline_controller'):
-            self.main.timeline_controller.update_timeline()
+        self._refresh('timeline')
  
     def filter_chars(self, char_ids):
         """Show events for specific characters"""
         timeline = getattr(self.main, 'timeline_controller', None)
         if timeline:
             timeline._filtered_characters = char_ids
-            timeline.update_timeline()
+            self._refresh('timeline')
 
     def refresh_all(self):
         """Update all views"""
-        if hasattr(self.main, 'table_controller'):
+        self._refresh()
+
+    def refresh_timeline(self):
+        """Update the timeline only"""
+        self._refresh('timeline')
+
+    def _refresh(self, *regions):
+        """Ask the refresh scheduler for a repaint, or repaint right away without one"""
+        scheduler = getattr(self.main, 'refresh_scheduler', None)
+        if scheduler:
+            scheduler.request(*regions)
+            return
+        if not regions and hasattr(self.main, 'table_controller'):
             self.main.table_controller.update_tables()
         if hasattr(self.main, 'timeline_controller'):
-            self.main.timeline_controller.update_timeline() 
\ No newline at end of file
+            self.main.timeline_controller.update_timeline()
\ No newline at end of file
@@ -1,6 +1,7 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QGraphicsScene
 from PySide6.QtGui import QTransform
+from ui.graphics.shadows import SHADOW_MIN_ZOOM
 
 class TimelineScene(QGraphicsScene):
     """mouse click events"""
@@ -8,7 +9,26 @@ class TimelineScene(QGraphicsScene):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
-        
+        self._capture = None
+
+    @property
+    def shadow_min_zoom(self):
+        """Zoom level below which items skip their shadows, a display setting of the main window"""
+        main = getattr(self.controller, 'main_controller', None)
+        return getattr(main, 'shadow_min_zoom', SHADOW_MIN_ZOOM)
+
+    def begin_capture(self, items):
+        """Record every item added until end_capture() into items"""
+        self._capture = items
+
+    def end_capture(self):
+        self._capture = None
+
+    def addItem(self, item):
+        super().addItem(item)
+        if self._capture is not None:
+            self._capture.append(item)
+
     def mousePressEvent(self, event):
         if event.button() != Qt.RightButton:
             super().mousePressEvent(event)
@@ -18,7 +38,9 @@ class TimelineScene(QGraphicsScene):
         if item is None:
             super().mousePressEvent(event)  # empty area
             return
-        item_data = item.data(0)
+        # roster items hold several participants and know which one was hit
+        data_at = getattr(item, 'data_at', None)
+        item_data = data_at(click_position) if data_at is not None else item.data(0)
 
         if not isinstance(item_data, dict):
             super().mousePressEvent(event)  